@@ -0,0 +1,57 @@
+"""Add stored reservation end time
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '002'
+down_revision: Union[str, None] = '001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'reservations',
+        sa.Column('end_time', sa.DateTime(), nullable=True)
+    )
+
+    # Backfill end_time for existing reservations
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute(
+            "UPDATE reservations "
+            "SET end_time = reservation_time + duration_minutes * INTERVAL '1 minute'"
+        )
+    else:
+        # In the format SQLAlchemy stores SQLite datetimes in, microseconds
+        # included; datetime() would drop them and compare unequal
+        op.execute(
+            "UPDATE reservations SET end_time = strftime("
+            "'%Y-%m-%d %H:%M:%S', reservation_time, "
+            "'+' || duration_minutes || ' minutes'"
+            ") || coalesce(nullif(substr(reservation_time, 20), ''), '.000000')"
+        )
+
+    with op.batch_alter_table('reservations') as batch_op:
+        batch_op.alter_column('end_time', nullable=False)
+
+    op.create_index(
+        'ix_reservations_table_id_end_time',
+        'reservations',
+        ['table_id', 'end_time'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_reservations_table_id_end_time', table_name='reservations')
+    with op.batch_alter_table('reservations') as batch_op:
+        batch_op.drop_column('end_time')
@@ -0,0 +1,101 @@
+"""Add no-overlap exclusion constraint for reservations
+
+The constraint cannot be added NOT VALID, so ALTER TABLE holds an ACCESS
+EXCLUSIVE lock on reservations, blocking reads and writes, while the GiST
+index is built and every row checked. Run it in a maintenance window.
+
+Existing double bookings would fail the constraint halfway through, so the
+migration first looks for them and, if any are found, stops without
+changing anything and lists them. Cancel or move one reservation of each
+pair and run the migration again. Reservations ending before they start
+are reported the same way.
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '003'
+down_revision: Union[str, None] = '002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Overlapping pairs listed in the error; the count covers all of them
+MAX_LISTED = 50
+
+
+def _check_reservations() -> None:
+    connection = op.get_bind()
+    # tsrange() raises on these rather than reporting a violation
+    reversed_ids = connection.execute(sa.text(
+        "SELECT id FROM reservations WHERE end_time < reservation_time "
+        "ORDER BY id LIMIT :limit"
+    ), {"limit": MAX_LISTED}).scalars().all()
+    if reversed_ids:
+        raise RuntimeError(
+            "Reservations ending before they start must be fixed before the "
+            f"migration can run: {', '.join(map(str, reversed_ids))}"
+        )
+
+    count, = connection.execute(sa.text(
+        "SELECT COUNT(*) FROM reservations a JOIN reservations b "
+        "ON b.table_id = a.table_id AND b.id > a.id "
+        "AND b.reservation_time < a.end_time "
+        "AND a.reservation_time < b.end_time"
+    )).one()
+    if not count:
+        return
+    pairs = connection.execute(sa.text(
+        "SELECT a.table_id, a.id, a.reservation_time, a.end_time, "
+        "b.id, b.reservation_time, b.end_time "
+        "FROM reservations a JOIN reservations b "
+        "ON b.table_id = a.table_id AND b.id > a.id "
+        "AND b.reservation_time < a.end_time "
+        "AND a.reservation_time < b.end_time "
+        "ORDER BY a.table_id, a.reservation_time, a.id, b.id "
+        "LIMIT :limit"
+    ), {"limit": MAX_LISTED}).all()
+    lines = [
+        f"  table {table_id}: reservation {a_id} ({a_start} - {a_end}) "
+        f"overlaps reservation {b_id} ({b_start} - {b_end})"
+        for table_id, a_id, a_start, a_end, b_id, b_start, b_end in pairs
+    ]
+    if count > len(pairs):
+        lines.append(f"  ... and {count - len(pairs)} more")
+    raise RuntimeError(
+        f"Found {count} overlapping reservation pairs; cancel or move one "
+        "reservation of each pair, then run the migration again:\n"
+        + "\n".join(lines)
+    )
+
+
+def upgrade() -> None:
+    # Exclusion constraints are PostgreSQL-only; other databases rely on the
+    # per-table lock taken by ReservationService.
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    _check_reservations()
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+    op.execute(
+        "ALTER TABLE reservations ADD CONSTRAINT reservations_no_overlap "
+        "EXCLUDE USING gist ("
+        "table_id WITH =, tsrange(reservation_time, end_time) WITH &&"
+        ")"
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute(
+        "ALTER TABLE reservations DROP CONSTRAINT IF EXISTS reservations_no_overlap"
+    )
@@ -0,0 +1,77 @@
+"""Make table names unique for the bulk upsert
+
+Table names that are already duplicated would fail the unique index, and
+renaming them automatically could collide with other names or pass the
+column's length limit. So the migration first looks for duplicates and,
+if any are found, stops without changing anything and lists them. Rename
+or merge the tables and run the migration again.
+
+Revision ID: 003a
+Revises: 003
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '003a'
+down_revision: Union[str, None] = '003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Duplicated names listed in the error; the count covers all of them
+MAX_LISTED = 50
+
+
+def _check_duplicates() -> None:
+    connection = op.get_bind()
+    duplicates = connection.execute(sa.text(
+        "SELECT name, COUNT(*), MIN(id) FROM tables GROUP BY name "
+        "HAVING COUNT(*) > 1 ORDER BY name"
+    )).all()
+    if not duplicates:
+        return
+    lines = [
+        f"  {name!r}: {count} tables, the oldest is {first_id}"
+        for name, count, first_id in duplicates[:MAX_LISTED]
+    ]
+    if len(duplicates) > MAX_LISTED:
+        lines.append(f"  ... and {len(duplicates) - MAX_LISTED} more")
+    raise RuntimeError(
+        f"Found {len(duplicates)} duplicated table names; rename or merge "
+        "the tables, then run the migration again:\n" + "\n".join(lines)
+    )
+
+
+def upgrade() -> None:
+    # The model declares table names unique, and the bulk upsert's
+    # ON CONFLICT (name) needs a unique index to infer the conflict target
+    _check_duplicates()
+
+    # Built CONCURRENTLY under a temporary name on PostgreSQL, so writes
+    # are not blocked and lookups by name keep an index throughout
+    if op.get_bind().dialect.name == 'postgresql':
+        with op.get_context().autocommit_block():
+            op.create_index(
+                'ix_tables_name_unique',
+                'tables',
+                ['name'],
+                unique=True,
+                postgresql_concurrently=True
+            )
+            op.drop_index(
+                'ix_tables_name', table_name='tables', postgresql_concurrently=True
+            )
+            op.execute("ALTER INDEX ix_tables_name_unique RENAME TO ix_tables_name")
+    else:
+        op.drop_index('ix_tables_name', table_name='tables')
+        op.create_index('ix_tables_name', 'tables', ['name'], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tables_name', table_name='tables')
+    op.create_index('ix_tables_name', 'tables', ['name'], unique=False)
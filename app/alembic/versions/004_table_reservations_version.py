@@ -0,0 +1,35 @@
+"""Add reservation list version to tables
+
+Revision ID: 004
+Revises: 003a
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '004'
+down_revision: Union[str, None] = '003a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'tables',
+        sa.Column(
+            'reservations_version',
+            sa.Integer(),
+            nullable=False,
+            server_default='0'
+        )
+    )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('tables') as batch_op:
+        batch_op.drop_column('reservations_version')
@@ -0,0 +1,54 @@
+"""Add tombstones and updated_at indexes for the change feed
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '005'
+down_revision: Union[str, None] = '004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'tombstones',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('entity', sa.String(length=20), nullable=False),
+        sa.Column('entity_id', sa.Integer(), nullable=False),
+        sa.Column('deleted_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(
+        'ix_tombstones_deleted_at_id',
+        'tombstones',
+        ['deleted_at', 'id'],
+        unique=False
+    )
+    op.create_index(
+        'ix_tables_updated_at_id',
+        'tables',
+        ['updated_at', 'id'],
+        unique=False
+    )
+    op.create_index(
+        'ix_reservations_updated_at_id',
+        'reservations',
+        ['updated_at', 'id'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_reservations_updated_at_id', table_name='reservations')
+    op.drop_index('ix_tables_updated_at_id', table_name='tables')
+    op.drop_index('ix_tombstones_deleted_at_id', table_name='tombstones')
+    op.drop_table('tombstones')
@@ -0,0 +1,84 @@
+"""Replace single-column indexes with composites for the booking queries
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '007'
+down_revision: Union[str, None] = '006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Indexes are built and dropped CONCURRENTLY on PostgreSQL so writes to the
+# tables are not blocked during deploys. CONCURRENTLY cannot run inside a
+# transaction, hence the autocommit blocks; if a build fails it leaves an
+# INVALID index behind that must be dropped before running this again.
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_reservations_table_id_end_time_reservation_time',
+            'reservations',
+            ['table_id', 'end_time', 'reservation_time'],
+            unique=False,
+            postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_reservations_table_id_reservation_time_id',
+            'reservations',
+            ['table_id', 'reservation_time', 'id'],
+            unique=False,
+            postgresql_concurrently=True
+        )
+        # Prefixes of the indexes above, or not used by any query
+        for name in (
+            'ix_reservations_table_id_end_time',
+            'ix_reservations_table_id',
+            'ix_reservations_customer_name',
+        ):
+            op.drop_index(
+                name, table_name='reservations', postgresql_concurrently=True
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_reservations_customer_name',
+            'reservations',
+            ['customer_name'],
+            unique=False,
+            postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_reservations_table_id',
+            'reservations',
+            ['table_id'],
+            unique=False,
+            postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_reservations_table_id_end_time',
+            'reservations',
+            ['table_id', 'end_time'],
+            unique=False,
+            postgresql_concurrently=True
+        )
+        op.drop_index(
+            'ix_reservations_table_id_reservation_time_id',
+            table_name='reservations',
+            postgresql_concurrently=True
+        )
+        op.drop_index(
+            'ix_reservations_table_id_end_time_reservation_time',
+            table_name='reservations',
+            postgresql_concurrently=True
+        )
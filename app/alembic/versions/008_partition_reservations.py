@@ -0,0 +1,50 @@
+"""Partition reservations by month on PostgreSQL
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+from app.db.partitions import partition_reservations, unpartition_reservations
+
+
+# revision identifiers, used by Alembic.
+revision: str = '008'
+down_revision: Union[str, None] = '007'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Indexes of reservations as of this revision, recreated on the new table
+RESERVATION_INDEXES = [
+    ('ix_reservations_reservation_time', ['reservation_time']),
+    ('ix_reservations_updated_at_id', ['updated_at', 'id']),
+    (
+        'ix_reservations_table_id_end_time_reservation_time',
+        ['table_id', 'end_time', 'reservation_time']
+    ),
+    (
+        'ix_reservations_table_id_reservation_time_id',
+        ['table_id', 'reservation_time', 'id']
+    ),
+]
+
+
+# Writes to reservations are blocked while the rows are copied; on large
+# tables run this in a maintenance window. Other databases keep the plain
+# table.
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    partition_reservations(op.get_bind(), RESERVATION_INDEXES)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    unpartition_reservations(op.get_bind(), RESERVATION_INDEXES)
@@ -0,0 +1,67 @@
+"""Add reservation archive and archiver checkpoints
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '009'
+down_revision: Union[str, None] = '008'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'reservations_archive',
+        sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column('table_id', sa.Integer(), nullable=False),
+        sa.Column('customer_name', sa.String(), nullable=False),
+        sa.Column('reservation_time', sa.DateTime(), nullable=False),
+        sa.Column('duration_minutes', sa.Integer(), nullable=False),
+        sa.Column('end_time', sa.DateTime(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.Column('archived_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(
+        'ix_reservations_archive_reservation_time_id',
+        'reservations_archive',
+        ['reservation_time', 'id'],
+        unique=False
+    )
+    op.create_index(
+        'ix_reservations_archive_table_id_reservation_time_id',
+        'reservations_archive',
+        ['table_id', 'reservation_time', 'id'],
+        unique=False
+    )
+    op.create_table(
+        'archive_checkpoints',
+        sa.Column('destination', sa.String(length=255), nullable=False),
+        sa.Column('pending', sa.String(), nullable=True),
+        sa.Column('parts', sa.Integer(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('destination')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('archive_checkpoints')
+    op.drop_index(
+        'ix_reservations_archive_table_id_reservation_time_id',
+        table_name='reservations_archive'
+    )
+    op.drop_index(
+        'ix_reservations_archive_reservation_time_id',
+        table_name='reservations_archive'
+    )
+    op.drop_table('reservations_archive')
@@ -1,6 +1,8 @@
 from fastapi import APIRouter
 
-from app.api.v1.endpoints import tables, reservations
+from app.api.v1.endpoints import (
+    tables, reservations, metrics, availability, events, changes
+)
 
 api_router = APIRouter()
 
@@ -15,4 +17,28 @@ api_router.include_router(
     reservations.router,
     prefix="/reservations",
     tags=["reservations"]
-) 
\ No newline at end of file
+)
+
+api_router.include_router(
+    availability.router,
+    prefix="/availability",
+    tags=["availability"]
+)
+
+api_router.include_router(
+    changes.router,
+    prefix="/changes",
+    tags=["changes"]
+)
+
+api_router.include_router(
+    events.router,
+    prefix="/events",
+    tags=["events"]
+)
+
+api_router.include_router(
+    metrics.router,
+    prefix="/metrics",
+    tags=["metrics"]
+)
\ No newline at end of file
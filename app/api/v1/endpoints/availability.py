@@ -0,0 +1,64 @@
+from datetime import date, datetime, time
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+
+from app.db.session import AnySession, get_read_session, get_session
+from app.schemas.availability import SlotGridResponse
+from app.schemas.table import TableResponse
+from app.services.availability import AsyncAvailabilityService
+from app.services.table import AsyncTableService
+
+router = APIRouter()
+
+
+@router.get("/", response_model=List[TableResponse])
+async def get_available_tables(
+    seats: int = Query(..., ge=1),
+    start: datetime = Query(...),
+    duration: int = Query(60, ge=1),
+    location: Optional[str] = None,
+    session: AnySession = Depends(get_read_session)
+) -> List[TableResponse]:
+    """
+    Get tables that seat the party and are free for the whole time window.
+
+    Tables are ordered by seat count, best fit first.
+    """
+    service = AsyncTableService(session)
+    return await service.get_available_tables(
+        seats, start=start, duration_minutes=duration, location=location
+    )
+
+
+@router.get("/grid", response_model=SlotGridResponse)
+async def get_slot_grid(
+    day: date = Query(...),
+    seats: int = Query(1, ge=1),
+    location: Optional[str] = None,
+    start: Optional[time] = None,
+    end: Optional[time] = None,
+    duration: Optional[int] = Query(None, ge=1, le=24 * 60),
+    session: AnySession = Depends(get_session)
+) -> SlotGridResponse:
+    """
+    Get every open slot of a day across all tables.
+
+    Reads the primary database: days loaded here are cached in the
+    availability index, which must not be filled from a lagging replica.
+    """
+    service = AsyncAvailabilityService(session)
+    try:
+        return await service.get_slot_grid(
+            day,
+            seats=seats,
+            location=location,
+            start=start,
+            end=end,
+            duration_minutes=duration
+        )
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(exc)
+        )
@@ -0,0 +1,38 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+
+from app.core.config import settings
+from app.db.session import AnySession, get_session
+from app.schemas.changes import ChangesResponse
+from app.services.changes import AsyncChangeService
+
+router = APIRouter()
+
+
+@router.get("/", response_model=ChangesResponse)
+async def get_changes(
+    since: Optional[str] = None,
+    limit: int = Query(
+        settings.PAGINATION_DEFAULT_LIMIT,
+        ge=1,
+        le=settings.PAGINATION_MAX_LIMIT
+    ),
+    session: AnySession = Depends(get_session)
+) -> ChangesResponse:
+    """
+    Get tables and reservations changed since a cursor, and deleted rows.
+
+    Start without ``since`` for a full snapshot, then pass the returned
+    ``next_cursor`` to receive only what changed. Request again right away
+    while ``has_more`` is true. Reads the primary: a lagging replica could
+    let the cursor move past rows it has not received yet.
+    """
+    service = AsyncChangeService(session)
+    try:
+        return await service.get_changes(since, limit)
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(exc)
+        )
@@ -0,0 +1,34 @@
+from typing import Optional
+
+from fastapi import APIRouter
+from fastapi.responses import StreamingResponse
+
+from app.core.events import event_broker, sse_stream
+
+router = APIRouter()
+
+
+@router.get(
+    "/reservations",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"text/event-stream": {}}}}
+)
+async def stream_reservation_events(
+    table_id: Optional[int] = None,
+    location: Optional[str] = None
+) -> StreamingResponse:
+    """
+    Stream reservation changes as Server-Sent Events.
+
+    Every committed create, update and delete is sent as a
+    ``reservation.created``, ``reservation.updated`` or
+    ``reservation.deleted`` event; updates that move a reservation also
+    reach subscribers of the table or location it left. Events are not
+    replayed: a client that reconnects should reload the state it shows.
+    """
+    subscription = event_broker.subscribe(table_id=table_id, location=location)
+    return StreamingResponse(
+        sse_stream(subscription),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
@@ -0,0 +1,16 @@
+from typing import Dict
+
+from fastapi import APIRouter
+
+from app.db.registry import engine_registry
+from app.schemas.metrics import PoolStats
+
+router = APIRouter()
+
+
+@router.get("/pool", response_model=Dict[str, PoolStats])
+async def get_pool_metrics() -> Dict[str, PoolStats]:
+    """
+    Get connection pool statistics for every database engine.
+    """
+    return engine_registry.pool_stats()
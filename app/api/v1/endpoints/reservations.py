@@ -1,38 +1,122 @@
-from typing import List
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlmodel import Session
+from fastapi import (
+    APIRouter,
+    Depends,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status
+)
+from fastapi.responses import StreamingResponse
 from pydantic import ValidationError
+from sqlmodel import Session
 
-from app.db.session import get_session
+from app.api.v1.idempotency import IdempotentRoute, idempotency_key
+from app.core.config import settings
+from app.core.etag import (
+    PreconditionFailed,
+    not_modified,
+    not_modified_response,
+    set_etag_headers
+)
+from app.core.export import encode_csv, encode_ndjson, gzip_stream
+from app.core.pagination import set_next_page_headers
+from app.core.responses import ORJSONResponse
+from app.db.partitions import NoPartition
+from app.db.session import (
+    AnySession,
+    get_read_session,
+    get_read_session_factory,
+    get_session
+)
 from app.schemas.reservation import (
+    BulkItemStatus,
+    BulkMode,
+    ExportFormat,
+    ReservationBulkCreate,
+    ReservationBulkItemResult,
+    ReservationBulkResponse,
     ReservationCreate,
     ReservationResponse,
     ReservationUpdate
 )
-from app.services.reservation import ReservationService
+from app.services.reservation import (
+    EXPORT_COLUMNS,
+    AsyncReservationService,
+    ReservationService
+)
+
+router = APIRouter(route_class=IdempotentRoute)
 
-router = APIRouter()
+# Reservations change often: clients keep their copy but revalidate it
+# with If-None-Match on every use.
+CACHE_CONTROL = "private, no-cache"
 
 
 @router.get("/", response_model=List[ReservationResponse])
-def get_reservations(
-    session: Session = Depends(get_session)
+async def get_reservations(
+    request: Request,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    table_id: Optional[int] = None,
+    location: Optional[str] = None,
+    include_archived: bool = False,
+    cursor: Optional[str] = None,
+    limit: int = Query(
+        settings.PAGINATION_DEFAULT_LIMIT,
+        ge=1,
+        le=settings.PAGINATION_MAX_LIMIT
+    ),
+    session: AnySession = Depends(get_read_session)
 ) -> List[ReservationResponse]:
     """
-    Get all reservations.
+    Get reservations ordered by time, one page at a time.
+
+    The next page is requested with the cursor from the X-Next-Cursor
+    header, which is absent on the last page. Rows are read as plain
+    columns and encoded with orjson, skipping per-row model validation.
+    With include_archived=true archived reservations are listed too.
     """
-    service = ReservationService(session)
-    return service.get_all()
+    service = AsyncReservationService(session)
+    try:
+        reservations, next_cursor = await service.get_page_rows(
+            limit,
+            cursor=cursor,
+            start=start,
+            end=end,
+            table_id=table_id,
+            location=location,
+            include_archived=include_archived
+        )
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+    response = ORJSONResponse(reservations)
+    set_next_page_headers(request, response, next_cursor)
+    return response
 
 
-@router.post("/", response_model=ReservationResponse, status_code=status.HTTP_201_CREATED)
-def create_reservation(
+@router.post(
+    "/",
+    response_model=ReservationResponse,
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(idempotency_key)]
+)
+async def create_reservation(
     reservation: ReservationCreate,
-    db: Session = Depends(get_session)
+    db: AnySession = Depends(get_session)
 ) -> ReservationResponse:
     """
     Create a new reservation.
+
+    Without table_id, the best-fitting free table for party_size guests
+    is assigned.
     
     Args:
         reservation: Reservation data
@@ -42,12 +126,24 @@ def create_reservation(
         ReservationResponse: Created reservation
         
     Raises:
-        HTTPException: If reservation cannot be created
+        HTTPException: If reservation cannot be created, 422 if its month
+            has no partition yet
     """
-    reservation_service = ReservationService(db)
-    created_reservation = reservation_service.create(reservation)
+    reservation_service = AsyncReservationService(db)
+    try:
+        created_reservation = await reservation_service.create(reservation)
+    except NoPartition as exc:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(exc)
+        )
     
     if not created_reservation:
+        if reservation.table_id is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Cannot create reservation. No free table for the party."
+            )
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Cannot create reservation. Table not found or time conflict."
@@ -56,47 +152,195 @@ def create_reservation(
     return ReservationResponse.model_validate(created_reservation)
 
 
-@router.get("/{reservation_id}", response_model=ReservationResponse)
-def get_reservation(
+@router.post(
+    "/bulk",
+    response_model=ReservationBulkResponse,
+    status_code=status.HTTP_201_CREATED,
+    responses={status.HTTP_409_CONFLICT: {"model": ReservationBulkResponse}},
+    dependencies=[Depends(idempotency_key)]
+)
+async def create_reservations_bulk(
+    batch: ReservationBulkCreate,
+    response: Response,
+    db: AnySession = Depends(get_session)
+) -> ReservationBulkResponse:
+    """
+    Create many reservations in one transaction.
+
+    Every item gets a result in request order. In all_or_nothing mode a
+    single failed item rejects the batch with 409 and the valid items are
+    reported as skipped; in partial mode the valid items are created and
+    409 is only returned when none of them was.
+    """
+    service = AsyncReservationService(db)
+    outcomes = await service.create_bulk(
+        batch.items, all_or_nothing=batch.mode == BulkMode.ALL_OR_NOTHING
+    )
+
+    results = [
+        ReservationBulkItemResult(
+            index=index,
+            status=item_status,
+            reservation=(
+                ReservationResponse.model_validate(reservation)
+                if reservation is not None else None
+            )
+        )
+        for index, (item_status, reservation) in enumerate(outcomes)
+    ]
+    created = sum(
+        1 for result in results if result.status == BulkItemStatus.CREATED
+    )
+    if not created:
+        response.status_code = status.HTTP_409_CONFLICT
+    return ReservationBulkResponse(created=created, results=results)
+
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_reservations(
+    format: ExportFormat = ExportFormat.NDJSON,
+    gzip: bool = False,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    table_id: Optional[int] = None,
+    location: Optional[str] = None,
+    session_factory: Callable[[], Session] = Depends(get_read_session_factory)
+) -> StreamingResponse:
+    """
+    Stream reservations as NDJSON or CSV.
+
+    Rows are read through a server-side cursor and written as they arrive,
+    so memory use stays constant regardless of how many rows match. With
+    gzip=true the body is gzip-compressed (Content-Encoding: gzip).
+    """
+    def batches() -> Iterator[List[Dict[str, Any]]]:
+        with session_factory() as session:
+            yield from ReservationService(session).iter_export_batches(
+                start=start, end=end, table_id=table_id, location=location
+            )
+
+    if format == ExportFormat.CSV:
+        body = encode_csv(batches(), EXPORT_COLUMNS)
+        media_type = "text/csv"
+    else:
+        body = encode_ndjson(batches())
+        media_type = "application/x-ndjson"
+
+    headers = {
+        "Content-Disposition": (
+            f'attachment; filename="reservations.{format.value}"'
+        )
+    }
+    if gzip:
+        body = gzip_stream(body)
+        headers["Content-Encoding"] = "gzip"
+    return StreamingResponse(body, media_type=media_type, headers=headers)
+
+
+@router.get(
+    "/{reservation_id}",
+    response_model=ReservationResponse,
+    responses={status.HTTP_304_NOT_MODIFIED: {"description": "Not Modified"}}
+)
+async def get_reservation(
     reservation_id: int,
-    session: Session = Depends(get_session)
+    request: Request,
+    response: Response,
+    session: AnySession = Depends(get_read_session)
 ) -> ReservationResponse:
     """
     Get reservation by ID.
+
+    The ETag changes with the reservation and its table. A request whose
+    If-None-Match still matches gets 304 after a single-row version lookup,
+    without loading or serializing the reservation.
     """
-    service = ReservationService(session)
-    reservation = service.get_by_id(reservation_id)
+    service = AsyncReservationService(session)
+    if "if-none-match" in request.headers:
+        etag = await service.get_etag(reservation_id)
+        if etag is not None and not_modified(request, etag):
+            return not_modified_response(etag, CACHE_CONTROL)
+
+    reservation = await service.get_by_id(reservation_id)
     if not reservation:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Reservation with ID {reservation_id} not found"
         )
+    set_etag_headers(response, ReservationService.etag(reservation), CACHE_CONTROL)
     return reservation
 
 
-@router.get("/table/{table_id}", response_model=List[ReservationResponse])
-def get_table_reservations(
+@router.get(
+    "/table/{table_id}",
+    response_model=List[ReservationResponse],
+    responses={status.HTTP_304_NOT_MODIFIED: {"description": "Not Modified"}}
+)
+async def get_table_reservations(
     table_id: int,
-    session: Session = Depends(get_session)
+    request: Request,
+    response: Response,
+    session: AnySession = Depends(get_read_session)
 ) -> List[ReservationResponse]:
     """
     Get all reservations for a specific table.
+
+    The ETag comes from the table's reservation version, which every
+    booking change for the table advances, so If-None-Match is answered
+    with 304 from one lookup of the table row.
     """
-    service = ReservationService(session)
-    return service.get_by_table_id(table_id)
+    service = AsyncReservationService(session)
+    if "if-none-match" in request.headers:
+        etag = await service.get_table_etag(table_id)
+        if etag is not None and not_modified(request, etag):
+            return not_modified_response(etag, CACHE_CONTROL)
+
+    reservations = await service.get_by_table_id(table_id)
+    # The version is read with the rows; an empty list needs a lookup
+    if reservations:
+        etag = ReservationService.table_etag(reservations[0].table)
+    else:
+        etag = await service.get_table_etag(table_id)
+    if etag is not None:
+        set_etag_headers(response, etag, CACHE_CONTROL)
+    return reservations
 
 
-@router.put("/{reservation_id}", response_model=ReservationResponse)
-def update_reservation(
+@router.put(
+    "/{reservation_id}",
+    response_model=ReservationResponse,
+    responses={status.HTTP_412_PRECONDITION_FAILED: {"description": "Modified"}},
+    dependencies=[Depends(idempotency_key)]
+)
+async def update_reservation(
     reservation_id: int,
     reservation_data: ReservationUpdate,
-    session: Session = Depends(get_session)
+    response: Response,
+    if_match: Optional[str] = Header(None),
+    session: AnySession = Depends(get_session)
 ) -> ReservationResponse:
     """
     Update an existing reservation.
+
+    With If-Match the update is applied only if the reservation still has
+    that ETag; otherwise 412 is returned. Updates that race with another
+    change of the same reservation also get 412.
     """
-    service = ReservationService(session)
-    reservation = service.update(reservation_id, reservation_data)
+    service = AsyncReservationService(session)
+    try:
+        reservation = await service.update(
+            reservation_id, reservation_data, if_match=if_match
+        )
+    except PreconditionFailed as exc:
+        raise HTTPException(
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+            detail=str(exc)
+        )
+    except NoPartition as exc:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(exc)
+        )
     if not reservation:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -105,19 +349,36 @@ def update_reservation(
                 "time slot is already booked"
             )
         )
+    set_etag_headers(response, ReservationService.etag(reservation), CACHE_CONTROL)
     return reservation
 
 
-@router.delete("/{reservation_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_reservation(
+@router.delete(
+    "/{reservation_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    responses={status.HTTP_412_PRECONDITION_FAILED: {"description": "Modified"}},
+    dependencies=[Depends(idempotency_key)]
+)
+async def delete_reservation(
     reservation_id: int,
-    session: Session = Depends(get_session)
+    if_match: Optional[str] = Header(None),
+    session: AnySession = Depends(get_session)
 ) -> None:
     """
     Delete a reservation.
+
+    With If-Match the reservation is deleted only if it still has that
+    ETag; otherwise 412 is returned.
     """
-    service = ReservationService(session)
-    if not service.delete(reservation_id):
+    service = AsyncReservationService(session)
+    try:
+        deleted = await service.delete(reservation_id, if_match=if_match)
+    except PreconditionFailed as exc:
+        raise HTTPException(
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+            detail=str(exc)
+        )
+    if not deleted:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Reservation with ID {reservation_id} not found"
@@ -1,36 +1,111 @@
-from typing import List
+import csv
+import io
+import json
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlmodel import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.exceptions import RequestValidationError
+from pydantic import ValidationError
 
-from app.db.session import get_session
-from app.schemas.table import TableCreate, TableResponse, TableUpdate
-from app.services.table import TableService
+from app.core.cache import CachedResponse
+from app.core.config import settings
+from app.core.etag import not_modified, not_modified_response, set_etag_headers
+from app.core.pagination import set_next_page_headers
+from app.db.session import AnySession, get_session
+from app.schemas.table import (
+    TableBulkResponse,
+    TableBulkUpsert,
+    TableCreate,
+    TableResponse,
+    TableUpdate
+)
+from app.services.table import AsyncTableService
 
 router = APIRouter()
 
 
+def _cached_json(request: Request, cached: CachedResponse) -> Response:
+    """
+    Send a cached table response, or 304 if the client already has it.
+    """
+    cache_control = f"public, max-age={settings.TABLE_CACHE_MAX_AGE}"
+    if not_modified(request, cached.etag):
+        return not_modified_response(cached.etag, cache_control)
+    response = Response(content=cached.body, media_type="application/json")
+    set_etag_headers(response, cached.etag, cache_control)
+    return response
+
+
+# The bulk body is parsed by hand to accept CSV as well as JSON, so its
+# schema is documented explicitly.
+BULK_UPSERT_OPENAPI = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "application/json": {
+                "schema": {
+                    key: value
+                    for key, value in TableBulkUpsert.model_json_schema(
+                        ref_template="#/components/schemas/{model}"
+                    ).items()
+                    if key != "$defs"
+                }
+            },
+            "text/csv": {
+                "schema": {"type": "string"},
+                "example": "name,seats,location\nTable 1,4,Main Hall\n",
+            },
+        },
+    }
+}
+
+
 @router.get("/", response_model=List[TableResponse])
-def get_tables(
-    session: Session = Depends(get_session)
+async def get_tables(
+    request: Request,
+    location: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(
+        settings.PAGINATION_DEFAULT_LIMIT,
+        ge=1,
+        le=settings.PAGINATION_MAX_LIMIT
+    ),
+    session: AnySession = Depends(get_session)
 ) -> List[TableResponse]:
     """
-    Get all tables.
+    Get tables ordered by ID, one page at a time.
+
+    The next page is requested with the cursor from the X-Next-Cursor
+    header, which is absent on the last page. Pages are served from the
+    table cache and carry an ETag; If-None-Match is answered with 304.
+    Cache misses read the primary so a lagging replica cannot refill the
+    cache with rows older than the last write.
     """
-    service = TableService(session)
-    return service.get_all()
+    service = AsyncTableService(session)
+    try:
+        cached = await service.get_page_cached(
+            limit, cursor=cursor, location=location
+        )
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+    response = _cached_json(request, cached)
+    set_next_page_headers(request, response, cached.next_cursor)
+    return response
 
 
 @router.post("/", response_model=TableResponse, status_code=status.HTTP_201_CREATED)
-def create_table(
+async def create_table(
     table_data: TableCreate,
-    session: Session = Depends(get_session)
+    session: AnySession = Depends(get_session)
 ) -> TableResponse:
     """
     Create a new table.
     """
-    service = TableService(session)
-    table = service.create(table_data)
+    service = AsyncTableService(session)
+    table = await service.create(table_data)
     if not table:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -39,35 +114,81 @@ def create_table(
     return table
 
 
+@router.post(
+    "/bulk",
+    response_model=TableBulkResponse,
+    openapi_extra=BULK_UPSERT_OPENAPI
+)
+async def upsert_tables_bulk(
+    request: Request,
+    session: AnySession = Depends(get_session)
+) -> TableBulkResponse:
+    """
+    Insert or update many tables by name in one statement.
+
+    Accepts JSON ({"items": [...]}) or CSV (Content-Type: text/csv) with a
+    name,seats,location header; an empty location falls back to the
+    default.
+    """
+    body = await request.body()
+    try:
+        if request.headers.get("content-type", "").startswith("text/csv"):
+            reader = csv.DictReader(io.StringIO(body.decode("utf-8-sig")))
+            payload = {
+                "items": [
+                    {key: value for key, value in row.items() if value}
+                    for row in reader
+                ]
+            }
+        else:
+            payload = json.loads(body)
+        batch = TableBulkUpsert.model_validate(payload)
+    except ValidationError as exc:
+        raise RequestValidationError(exc.errors(include_url=False))
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Malformed request body"
+        )
+
+    service = AsyncTableService(session)
+    inserted, updated = await service.upsert_bulk(batch.items)
+    return TableBulkResponse(inserted=inserted, updated=updated)
+
+
 @router.get("/{table_id}", response_model=TableResponse)
-def get_table(
+async def get_table(
     table_id: int,
-    session: Session = Depends(get_session)
+    request: Request,
+    session: AnySession = Depends(get_session)
 ) -> TableResponse:
     """
     Get table by ID.
+
+    Served from the table cache with an ETag; If-None-Match is answered
+    with 304. Cache misses read the primary.
     """
-    service = TableService(session)
-    table = service.get_by_id(table_id)
-    if not table:
+    service = AsyncTableService(session)
+    cached = await service.get_by_id_cached(table_id)
+    if not cached:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Table with ID {table_id} not found"
         )
-    return table
+    return _cached_json(request, cached)
 
 
 @router.put("/{table_id}", response_model=TableResponse)
-def update_table(
+async def update_table(
     table_id: int,
     table_data: TableUpdate,
-    session: Session = Depends(get_session)
+    session: AnySession = Depends(get_session)
 ) -> TableResponse:
     """
     Update an existing table.
     """
-    service = TableService(session)
-    table = service.update(table_id, table_data)
+    service = AsyncTableService(session)
+    table = await service.update(table_id, table_data)
     if not table:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -77,15 +198,15 @@ def update_table(
 
 
 @router.delete("/{table_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_table(
+async def delete_table(
     table_id: int,
-    session: Session = Depends(get_session)
+    session: AnySession = Depends(get_session)
 ) -> None:
     """
     Delete a table.
     """
-    service = TableService(session)
-    if not service.delete(table_id):
+    service = AsyncTableService(session)
+    if not await service.delete(table_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Table with ID {table_id} not found"
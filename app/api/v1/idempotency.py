@@ -0,0 +1,183 @@
+import asyncio
+import hashlib
+import json
+from time import monotonic
+from typing import Callable, Dict, Optional
+
+from fastapi import Depends, Header, HTTPException, Request, Response, status
+from fastapi.exception_handlers import (
+    http_exception_handler,
+    request_validation_exception_handler
+)
+from fastapi.exceptions import RequestValidationError
+from fastapi.routing import APIRoute
+from sqlmodel import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.db.session import get_session_factory
+from app.models.idempotency import IdempotencyKey
+from app.services.idempotency import ClaimStatus, IdempotencyService
+
+# Set on responses served from a stored outcome
+REPLAYED_HEADER = "Idempotent-Replayed"
+# Response headers stored with the body and replayed
+STORED_HEADERS = ("content-type", "etag", "cache-control")
+
+
+class IdempotencyClaim:
+    """
+    Key claimed by the current request, completed once it has a response.
+    """
+
+    def __init__(self, key: str, session_factory: Callable[[], Session]):
+        self.key = key
+        self.session_factory = session_factory
+
+    async def finish(self, response: Response) -> None:
+        """
+        Store the response, or drop the claim after a server error so that
+        a retry runs again.
+
+        Args:
+            response: Response sent to the client
+        """
+        if response.status_code >= 500:
+            await self.release()
+            return
+        headers = {
+            name: response.headers[name]
+            for name in STORED_HEADERS if name in response.headers
+        }
+        await run_in_threadpool(
+            self._call, "complete",
+            self.key, response.status_code, headers, bytes(response.body)
+        )
+
+    async def release(self) -> None:
+        await run_in_threadpool(self._call, "release", self.key)
+
+    def _call(self, method: str, *args) -> None:
+        with self.session_factory() as session:
+            getattr(IdempotencyService(session), method)(*args)
+
+
+class _Replay(Exception):
+    def __init__(self, response: Response):
+        self.response = response
+
+
+def _fingerprint(request: Request, body: bytes) -> str:
+    digest = hashlib.sha256()
+    for part in (request.method, request.url.path, request.url.query):
+        digest.update(part.encode())
+        digest.update(b"\0")
+    digest.update(body)
+    return digest.hexdigest()
+
+
+def _replay_response(record: IdempotencyKey) -> Response:
+    headers: Dict[str, str] = json.loads(record.headers or "{}")
+    headers[REPLAYED_HEADER] = "true"
+    return Response(
+        content=record.body or b"",
+        status_code=record.status_code,
+        headers=headers
+    )
+
+
+async def idempotency_key(
+    request: Request,
+    idempotency_key: Optional[str] = Header(None, max_length=255),
+    session_factory: Callable[[], Session] = Depends(get_session_factory)
+) -> None:
+    """
+    Make a write request idempotent when it carries an Idempotency-Key.
+
+    The first request with a key claims it and runs; its response is stored
+    by IdempotentRoute and replayed to every retry with the same key and
+    request, without running the endpoint again. A retry that arrives while
+    the first request is still running waits for its outcome.
+
+    Raises:
+        HTTPException: 422 if the key was used for a different request,
+            409 if the first request is still running after
+            IDEMPOTENCY_WAIT_SECONDS
+    """
+    if idempotency_key is None:
+        return
+    fingerprint = _fingerprint(request, await request.body())
+
+    def claim():
+        with session_factory() as session:
+            claim_status, record = IdempotencyService(session).claim(
+                idempotency_key, fingerprint
+            )
+            # Build the replay before the session closes
+            return claim_status, (
+                _replay_response(record) if record is not None else None
+            )
+
+    deadline = monotonic() + settings.IDEMPOTENCY_WAIT_SECONDS
+    delay = 0.02
+    while True:
+        claim_status, replay = await run_in_threadpool(claim)
+        if claim_status == ClaimStatus.CLAIMED:
+            request.state.idempotency = IdempotencyClaim(
+                idempotency_key, session_factory
+            )
+            return
+        if claim_status == ClaimStatus.COMPLETED:
+            raise _Replay(replay)
+        if claim_status == ClaimStatus.MISMATCH:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="Idempotency-Key was already used for a different request"
+            )
+        if monotonic() >= deadline:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="A request with this Idempotency-Key is still in progress",
+                headers={"Retry-After": "1"}
+            )
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, 0.5)
+
+
+class IdempotentRoute(APIRoute):
+    """
+    Route that stores the response of requests claimed by idempotency_key.
+
+    Error responses are stored too, so a retry of a rejected booking gets
+    the same rejection; server errors are not, and the key is released.
+    Routes without the dependency are unaffected.
+    """
+
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+
+        async def route_handler(request: Request) -> Response:
+            try:
+                response = await handler(request)
+            except _Replay as replay:
+                return replay.response
+            except HTTPException as exc:
+                if not hasattr(request.state, "idempotency"):
+                    raise
+                response = await http_exception_handler(request, exc)
+            except RequestValidationError as exc:
+                if not hasattr(request.state, "idempotency"):
+                    raise
+                response = await request_validation_exception_handler(request, exc)
+            except Exception:
+                claim = getattr(request.state, "idempotency", None)
+                if claim is not None:
+                    await claim.release()
+                raise
+
+            claim = getattr(request.state, "idempotency", None)
+            if claim is not None:
+                await claim.finish(response)
+            return response
+
+        return route_handler
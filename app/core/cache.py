@@ -0,0 +1,271 @@
+import json
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from time import monotonic
+from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple
+
+from app.core.config import settings
+from app.core.etag import make_etag
+from app.core.invalidation import invalidation_bus
+from app.core.logging import get_logger
+
+logger = get_logger("cache")
+
+
+class CacheBackend(ABC):
+    """
+    Key-value store behind the response cache.
+
+    Values are bytes. ``incr`` must be atomic and its counters must not be
+    evicted before entries are: they hold the namespace versions used for
+    invalidation.
+    """
+    # True when every worker sees the same entries, so invalidations need
+    # not be broadcast
+    shared = False
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[bytes]:
+        ...
+
+    @abstractmethod
+    def set(self, key: str, value: bytes, ttl: int) -> None:
+        ...
+
+    @abstractmethod
+    def incr(self, key: str) -> int:
+        ...
+
+
+class NullCache(CacheBackend):
+    """
+    Backend that stores nothing; every read is a miss.
+    """
+
+    def __init__(self) -> None:
+        self._counters: Dict[str, int] = {}
+
+    def get(self, key: str) -> Optional[bytes]:
+        return None
+
+    def set(self, key: str, value: bytes, ttl: int) -> None:
+        pass
+
+    def incr(self, key: str) -> int:
+        self._counters[key] = self._counters.get(key, 0) + 1
+        return self._counters[key]
+
+
+class MemoryCache(CacheBackend):
+    """
+    In-process cache with per-entry TTL and LRU eviction.
+
+    Each worker process has its own copy; invalidations made by another
+    worker reach it only when the entries expire.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+        # Counters live outside the LRU so a version is never forgotten
+        self._counters: Dict[str, int] = {}
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            if key in self._counters:
+                return str(self._counters[key]).encode()
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes, ttl: int) -> None:
+        with self._lock:
+            self._entries[key] = (monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def incr(self, key: str) -> int:
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + 1
+            return self._counters[key]
+
+
+class RedisCache(CacheBackend):
+    """
+    Backend on a Redis-compatible server, shared by all workers.
+
+    Any client with redis-py's ``get``, ``set(..., ex=)`` and ``incr``
+    methods works. Server errors are logged and treated as cache misses so
+    a Redis outage only costs database reads.
+    """
+    shared = True
+
+    def __init__(self, client: Any):
+        self.client = client
+
+    @classmethod
+    def from_url(cls, url: str) -> "RedisCache":
+        """
+        Create a backend connected to the given Redis URL.
+
+        Args:
+            url: Redis connection URL
+
+        Returns:
+            RedisCache: Backend using a redis-py client
+
+        Raises:
+            RuntimeError: If the redis package is not installed
+        """
+        try:
+            import redis
+        except ImportError as exc:
+            raise RuntimeError(
+                "CACHE_BACKEND=redis requires the redis package"
+            ) from exc
+        return cls(redis.Redis.from_url(url))
+
+    def get(self, key: str) -> Optional[bytes]:
+        try:
+            return self.client.get(key)
+        except Exception:
+            logger.warning("Cache read failed for %s", key, exc_info=True)
+            return None
+
+    def set(self, key: str, value: bytes, ttl: int) -> None:
+        try:
+            self.client.set(key, value, ex=ttl)
+        except Exception:
+            logger.warning("Cache write failed for %s", key, exc_info=True)
+
+    def incr(self, key: str) -> int:
+        try:
+            return self.client.incr(key)
+        except Exception:
+            # The write has already been committed; stale entries age out
+            # after CACHE_TTL.
+            logger.error("Cache invalidation failed for %s", key, exc_info=True)
+            return 0
+
+
+class CachedResponse(NamedTuple):
+    """
+    Serialized JSON response body with its ETag.
+    """
+    body: bytes
+    etag: str
+    next_cursor: Optional[str] = None
+
+    @classmethod
+    def from_content(
+        cls,
+        content: Any,
+        next_cursor: Optional[str] = None
+    ) -> "CachedResponse":
+        body = json.dumps(
+            content, ensure_ascii=False, separators=(",", ":")
+        ).encode()
+        return cls(body, make_etag(body), next_cursor)
+
+    def dumps(self) -> bytes:
+        header = json.dumps({"etag": self.etag, "next_cursor": self.next_cursor})
+        return header.encode() + b"\n" + self.body
+
+    @classmethod
+    def loads(cls, value: bytes) -> "CachedResponse":
+        header, body = value.split(b"\n", 1)
+        meta = json.loads(header)
+        return cls(body, meta["etag"], meta["next_cursor"])
+
+
+class ResponseCache:
+    """
+    Namespace of cached responses that can be invalidated in one step.
+
+    Keys are prefixed with the namespace version kept by the backend;
+    ``invalidate`` bumps the version, so every entry written before it is
+    never read again and simply expires. With a per-worker backend the
+    invalidation is also sent to the other workers.
+    """
+
+    def __init__(self, backend: CacheBackend, namespace: str, ttl: int):
+        self.backend = backend
+        self.namespace = namespace
+        self.ttl = ttl
+        self._version_key = f"{namespace}:version"
+
+    def get_or_set(
+        self,
+        key: str,
+        build: Callable[[], Optional[CachedResponse]]
+    ) -> Optional[CachedResponse]:
+        """
+        Get a cached response, building and storing it on a miss.
+
+        The namespace version is read once, before ``build`` runs: if the
+        namespace is invalidated while the response is being built, it is
+        stored under the old version and never served.
+
+        Args:
+            key: Cache key within the namespace
+            build: Builds the response; None results are not cached
+
+        Returns:
+            Optional[CachedResponse]: Cached or freshly built response
+        """
+        version = self.backend.get(self._version_key) or b"0"
+        full_key = f"{self.namespace}:{version.decode()}:{key}"
+        value = self.backend.get(full_key)
+        if value is not None:
+            return CachedResponse.loads(value)
+
+        response = build()
+        if response is not None:
+            self.backend.set(full_key, response.dumps(), self.ttl)
+        return response
+
+    def invalidate(self, broadcast: bool = True) -> None:
+        """
+        Drop every response in the namespace.
+
+        Args:
+            broadcast: Also invalidate the namespace on the other workers
+        """
+        self.backend.incr(self._version_key)
+        if broadcast and not self.backend.shared:
+            invalidation_bus.publish(f"cache.{self.namespace}")
+
+
+def create_backend() -> CacheBackend:
+    """
+    Create the cache backend selected by CACHE_BACKEND.
+
+    Returns:
+        CacheBackend: Configured backend
+    """
+    if settings.CACHE_BACKEND == "redis":
+        if not settings.CACHE_REDIS_URL:
+            raise RuntimeError("CACHE_BACKEND=redis requires CACHE_REDIS_URL")
+        return RedisCache.from_url(settings.CACHE_REDIS_URL)
+    if settings.CACHE_BACKEND == "none":
+        return NullCache()
+    return MemoryCache(settings.CACHE_MAX_ENTRIES)
+
+
+# Responses of the table catalogue endpoints
+table_cache = ResponseCache(create_backend(), "tables", settings.CACHE_TTL)
+invalidation_bus.subscribe(
+    "cache.tables", lambda message: table_cache.invalidate(broadcast=False)
+)
+invalidation_bus.subscribe_reset(
+    lambda: table_cache.invalidate(broadcast=False)
+)
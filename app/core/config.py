@@ -1,9 +1,8 @@
-from typing import Optional, Any, Generator
+from typing import Optional, Any, Literal
 from pydantic_settings import BaseSettings
 from pydantic import PostgresDsn, field_validator
 import secrets
 from functools import lru_cache
-from sqlmodel import Session, create_engine
 
 
 class Settings(BaseSettings):
@@ -20,6 +19,25 @@ class Settings(BaseSettings):
     POSTGRES_PASSWORD: str = "postgres"
     POSTGRES_DB: str = "restaurant_booking"
     SQLALCHEMY_DATABASE_URI: Optional[PostgresDsn] = None
+    # Optional read replica, registered as the "replica" engine; any
+    # SQLAlchemy URL, like the primary's when it is given explicitly
+    SQLALCHEMY_REPLICA_URI: Optional[str] = None
+    # Seconds a client's reads stay on the primary after it writes
+    DB_READ_YOUR_WRITES_SECONDS: int = 5
+
+    # "sync" serves requests through a blocking engine on the threadpool,
+    # "async" through an AsyncEngine (asyncpg / aiosqlite drivers)
+    DB_ENGINE: Literal["sync", "async"] = "sync"
+
+    # Connection pool settings
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30  # seconds to wait for a free connection
+    DB_POOL_RECYCLE: int = 1800  # seconds before a connection is replaced, -1 disables
+    # Ping connections on every checkout. Off by default: the extra round
+    # trip is replaced by DB_POOL_RECYCLE retiring connections before the
+    # server or a proxy drops them.
+    DB_POOL_PRE_PING: bool = False
 
     @field_validator("SQLALCHEMY_DATABASE_URI", mode="before")
     @classmethod
@@ -36,10 +54,73 @@ class Settings(BaseSettings):
             path=f"/{info.data.get('POSTGRES_DB') or ''}",
         )
 
-    def get_session(self) -> Generator[Session, None, None]:
-        engine = create_engine(str(self.SQLALCHEMY_DATABASE_URI))
-        with Session(engine) as session:
-            yield session
+    # Pagination settings
+    PAGINATION_DEFAULT_LIMIT: int = 100
+    PAGINATION_MAX_LIMIT: int = 500
+
+    # Response cache of the table catalogue: "memory" keeps a TTL+LRU
+    # cache in each worker, "redis" shares one through CACHE_REDIS_URL
+    CACHE_BACKEND: Literal["memory", "redis", "none"] = "memory"
+    CACHE_REDIS_URL: Optional[str] = None
+    CACHE_TTL: int = 300  # seconds an entry is kept
+    CACHE_MAX_ENTRIES: int = 1024  # per worker, memory backend only
+    # Seconds clients may reuse a table response without revalidating
+    TABLE_CACHE_MAX_AGE: int = 30
+
+    # Seconds the change feed holds back the newest changes, so writes that
+    # were timestamped but not yet committed are not skipped
+    CHANGES_SETTLE_SECONDS: int = 5
+
+    # Invalidation of per-worker caches (memory table cache, availability
+    # index) on the other workers: "postgres" uses LISTEN/NOTIFY, "unix"
+    # datagram sockets in INVALIDATION_SOCKET_DIR for single-host
+    # deployments; "auto" picks by the primary database
+    INVALIDATION_BACKEND: Literal["auto", "postgres", "unix", "none"] = "auto"
+    INVALIDATION_CHANNEL: str = "cache_invalidation"
+    # Private (mode 0700) directory of the "unix" sockets; by default one
+    # per user under XDG_RUNTIME_DIR or the temporary directory
+    INVALIDATION_SOCKET_DIR: Optional[str] = None
+
+    # Idempotency-Key handling of reservation writes
+    IDEMPOTENCY_TTL_SECONDS: int = 86400  # how long a response is replayed
+    IDEMPOTENCY_LOCK_SECONDS: int = 60  # before a stuck claim is taken over
+    IDEMPOTENCY_WAIT_SECONDS: int = 10  # a duplicate waits for the first request
+
+    # Longest reservation accepted; bounds how far back conflict checks
+    # look, which lets PostgreSQL prune old partitions
+    RESERVATION_MAX_DURATION_MINUTES: int = 1440
+
+    # Monthly reservation partitions on PostgreSQL, see app/db/partitions.py
+    RESERVATION_PARTITIONS_AHEAD_MONTHS: int = 12  # created in advance
+    RESERVATION_PARTITIONS_RETAIN_MONTHS: int = 24  # kept attached
+
+    # Archiver moving past reservations out of the live table
+    ARCHIVE_AFTER_DAYS: int = 90  # reservations that ended this long ago
+    ARCHIVE_CHUNK_SIZE: int = 1000  # rows moved per transaction
+    ARCHIVE_DIR: str = "archive"  # NDJSON destination
+
+    # Maximum number of reservations in one bulk request
+    BULK_MAX_ITEMS: int = 1000
+
+    # Slot-grid availability index
+    AVAILABILITY_SLOT_MINUTES: int = 15
+    AVAILABILITY_CACHE_DAYS: int = 31  # days kept in memory per worker
+    AVAILABILITY_CACHE_TTL: int = 60  # seconds before a day is reloaded
+
+    # Table auto-assignment for reservations without table_id
+    SEATING_INDEX_TTL: int = 60  # seconds before the seat index is reloaded
+    SEATING_MIN_GAP_MINUTES: int = 60  # shorter free gaps count as fragments
+    SEATING_MAX_ATTEMPTS: int = 3  # ranked tables tried before giving up
+
+    # Reservation event stream: "local" fans events out within one worker,
+    # "postgres" shares them between workers through LISTEN/NOTIFY
+    EVENTS_BACKEND: Literal["local", "postgres"] = "local"
+    EVENTS_CHANNEL: str = "reservation_events"
+    EVENTS_QUEUE_SIZE: int = 1000  # events buffered per subscriber
+    EVENTS_KEEPALIVE_SECONDS: int = 15
+    # Longest wait between attempts to reopen a dropped LISTEN connection,
+    # used by both the event stream and the invalidation bus
+    NOTIFY_RECONNECT_MAX_SECONDS: int = 30
 
     # Logging settings
     LOG_LEVEL: str = "INFO"
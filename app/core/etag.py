@@ -0,0 +1,111 @@
+import hashlib
+from datetime import datetime, timedelta
+from typing import Optional, Union
+
+from fastapi import Request, Response
+
+
+def make_etag(body: bytes) -> str:
+    """
+    Build a strong ETag from a response body.
+
+    Args:
+        body: Response body
+
+    Returns:
+        str: Quoted entity tag
+    """
+    return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+
+class PreconditionFailed(Exception):
+    """
+    Raised when a conditional write finds the resource changed.
+    """
+
+
+def version_etag(*parts: Union[int, str, datetime]) -> str:
+    """
+    Build a strong ETag from version values such as IDs and timestamps.
+
+    Args:
+        parts: Values that change whenever the representation does
+
+    Returns:
+        str: Quoted entity tag
+    """
+    epoch = datetime(1970, 1, 1)
+    return '"' + "-".join(
+        str((part.replace(tzinfo=None) - epoch) // timedelta(microseconds=1))
+        if isinstance(part, datetime) else str(part)
+        for part in parts
+    ) + '"'
+
+
+def etag_in(header: Optional[str], etag: str, weak: bool = True) -> bool:
+    """
+    Check whether an If-None-Match / If-Match header lists the ETag.
+
+    With weak comparison, used for If-None-Match, weak validators (W/"...")
+    match their strong counterpart. If-Match requires strong comparison
+    (RFC 9110, section 13.1.1), where a weak validator matches nothing.
+
+    Args:
+        header: Header value, a comma-separated list of tags or "*"
+        etag: Current ETag of the resource
+        weak: Use weak comparison; strong comparison if False
+
+    Returns:
+        bool: True if the header matches the ETag
+    """
+    if header is None:
+        return False
+    tags = [tag.strip() for tag in header.split(",")]
+    if "*" in tags:
+        return True
+    if not weak:
+        return etag in tags
+    return etag in (tag[2:] if tag.startswith("W/") else tag for tag in tags)
+
+
+def not_modified(request: Request, etag: str) -> bool:
+    """
+    Check whether the client's cached copy is current.
+
+    Args:
+        request: Current request
+        etag: Current ETag of the resource
+
+    Returns:
+        bool: True if the response can be 304 Not Modified
+    """
+    return etag_in(request.headers.get("if-none-match"), etag)
+
+
+def set_etag_headers(response: Response, etag: str, cache_control: str) -> None:
+    """
+    Set the ETag and Cache-Control headers of a cacheable response.
+
+    Args:
+        response: Response being built
+        etag: ETag of the response body
+        cache_control: Cache-Control directives
+    """
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = cache_control
+
+
+def not_modified_response(etag: str, cache_control: str) -> Response:
+    """
+    Build a 304 Not Modified response.
+
+    Args:
+        etag: Current ETag of the resource
+        cache_control: Cache-Control directives
+
+    Returns:
+        Response: Empty 304 response
+    """
+    response = Response(status_code=304)
+    set_etag_headers(response, etag, cache_control)
+    return response
@@ -0,0 +1,260 @@
+import asyncio
+import json
+import threading
+from collections import defaultdict
+from typing import Any, AsyncIterator, Dict, List, Optional, Set
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.db.notify import PostgresListener, pg_notify
+
+logger = get_logger("events")
+
+Event = Dict[str, Any]
+
+
+class Subscription:
+    """
+    Queue of events for one subscriber, optionally filtered by table or
+    location.
+
+    Events are delivered on the event loop the subscription was created
+    on; when the queue is full new events are dropped and counted.
+    """
+
+    def __init__(
+        self,
+        broker: "EventBroker",
+        table_id: Optional[int] = None,
+        location: Optional[str] = None,
+        maxsize: int = settings.EVENTS_QUEUE_SIZE
+    ):
+        self.broker = broker
+        self.table_id = table_id
+        self.location = location
+        self.loop = asyncio.get_running_loop()
+        self.queue: "asyncio.Queue[Event]" = asyncio.Queue(maxsize)
+        self.dropped = 0
+
+    def matches(self, event: Event) -> bool:
+        if self.table_id is not None and self.table_id not in (
+            event.get("table_id"), event.get("previous_table_id")
+        ):
+            return False
+        if self.location is not None and self.location not in (
+            event.get("location"), event.get("previous_location")
+        ):
+            return False
+        return True
+
+    def put(self, event: Event) -> None:
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.dropped += 1
+
+    async def get(self) -> Event:
+        return await self.queue.get()
+
+    def close(self) -> None:
+        self.broker.unsubscribe(self)
+
+
+class EventBroker:
+    """
+    In-process fan-out of reservation events to subscribers.
+
+    ``publish`` may be called from any thread: services run on the
+    threadpool or inside ``AsyncSession.run_sync``. Matching subscribers are
+    grouped by event loop and each loop is woken once per event with
+    ``call_soon_threadsafe``, however many of its subscribers match.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._subscriptions: Set[Subscription] = set()
+
+    def start(self) -> None:
+        """
+        Start delivering events; a no-op for the in-process broker.
+        """
+
+    def stop(self) -> None:
+        """
+        Stop delivering events; a no-op for the in-process broker.
+        """
+
+    def subscribe(
+        self,
+        table_id: Optional[int] = None,
+        location: Optional[str] = None
+    ) -> Subscription:
+        """
+        Subscribe the current event loop to events.
+
+        Args:
+            table_id: Only events for this table
+            location: Only events for tables in this location
+
+        Returns:
+            Subscription: Queue receiving matching events
+        """
+        subscription = Subscription(self, table_id=table_id, location=location)
+        with self._lock:
+            self._subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            self._subscriptions.discard(subscription)
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscriptions)
+
+    def publish(self, event: Event) -> None:
+        """
+        Publish an event to every matching subscriber.
+
+        Args:
+            event: JSON-serializable event
+        """
+        self.deliver(event)
+
+    def deliver(self, event: Event) -> None:
+        """
+        Hand an event to the matching subscribers of this process.
+
+        Args:
+            event: Event to deliver
+        """
+        with self._lock:
+            subscriptions = list(self._subscriptions)
+
+        by_loop: Dict[asyncio.AbstractEventLoop, List[Subscription]] = defaultdict(list)
+        for subscription in subscriptions:
+            if subscription.matches(event):
+                by_loop[subscription.loop].append(subscription)
+
+        try:
+            current = asyncio.get_running_loop()
+        except RuntimeError:
+            current = None
+        for loop, targets in by_loop.items():
+            if loop is current:
+                self._put_all(targets, event)
+                continue
+            try:
+                loop.call_soon_threadsafe(self._put_all, targets, event)
+            except RuntimeError:
+                # The loop has been closed; its subscribers are gone
+                for subscription in targets:
+                    self.unsubscribe(subscription)
+
+    @staticmethod
+    def _put_all(targets: List[Subscription], event: Event) -> None:
+        for subscription in targets:
+            subscription.put(event)
+
+
+class PostgresEventBroker(EventBroker):
+    """
+    Broker that shares events between workers through LISTEN/NOTIFY.
+
+    ``publish`` sends ``pg_notify`` on the primary database and does not
+    deliver locally; every worker, the publisher included, receives the
+    notification on its listener connection and fans it out to its own
+    subscribers.
+    """
+
+    def __init__(self, channel: str = settings.EVENTS_CHANNEL):
+        super().__init__()
+        self.channel = channel
+        self._listener: Optional[PostgresListener] = None
+
+    def start(self) -> None:
+        """
+        Start listening for events from all workers.
+        """
+        if self._listener is None:
+            self._listener = PostgresListener(self.channel, self._receive)
+            self._listener.start()
+
+    def stop(self) -> None:
+        """
+        Stop listening.
+        """
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+
+    def publish(self, event: Event) -> None:
+        pg_notify(self.channel, json.dumps(event))
+
+    def _receive(self, payload: str) -> None:
+        try:
+            self.deliver(json.loads(payload))
+        except ValueError:
+            logger.warning("Ignoring malformed event %r", payload)
+
+
+def format_sse(event: Event) -> bytes:
+    """
+    Encode an event as a Server-Sent Events message.
+
+    Args:
+        event: Event with a "type" key
+
+    Returns:
+        bytes: SSE message
+    """
+    return (
+        f"event: {event['type']}\ndata: {json.dumps(event)}\n\n"
+    ).encode()
+
+
+async def sse_stream(
+    subscription: Subscription,
+    keepalive: float = settings.EVENTS_KEEPALIVE_SECONDS
+) -> AsyncIterator[bytes]:
+    """
+    Stream a subscription as Server-Sent Events.
+
+    A comment line is sent when no event arrived for ``keepalive`` seconds
+    so proxies keep the connection open. The subscription is closed when
+    the client disconnects.
+
+    Args:
+        subscription: Subscription to stream
+        keepalive: Seconds between keepalive comments
+
+    Yields:
+        bytes: SSE messages
+    """
+    try:
+        yield b": connected\n\n"
+        while True:
+            try:
+                event = await asyncio.wait_for(subscription.get(), keepalive)
+            except asyncio.TimeoutError:
+                yield b": keepalive\n\n"
+                continue
+            yield format_sse(event)
+    finally:
+        subscription.close()
+
+
+def create_broker() -> EventBroker:
+    """
+    Create the event broker selected by EVENTS_BACKEND.
+
+    Returns:
+        EventBroker: Configured broker
+    """
+    if settings.EVENTS_BACKEND == "postgres":
+        return PostgresEventBroker()
+    return EventBroker()
+
+
+# Reservation create, update and delete events
+event_broker = create_broker()
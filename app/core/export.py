@@ -0,0 +1,80 @@
+import csv
+import io
+import json
+import zlib
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Sequence
+
+
+def _json_default(value: Any) -> str:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def encode_ndjson(batches: Iterable[List[Dict[str, Any]]]) -> Iterator[bytes]:
+    """
+    Encode row batches as newline-delimited JSON, one chunk per batch.
+
+    Args:
+        batches: Batches of rows
+
+    Yields:
+        bytes: Encoded chunk
+    """
+    for batch in batches:
+        yield "".join(
+            json.dumps(row, default=_json_default, ensure_ascii=False) + "\n"
+            for row in batch
+        ).encode()
+
+
+def encode_csv(
+    batches: Iterable[List[Dict[str, Any]]],
+    columns: Sequence[str]
+) -> Iterator[bytes]:
+    """
+    Encode row batches as CSV with a header row, one chunk per batch.
+
+    Args:
+        batches: Batches of rows
+        columns: Column names, in output order
+
+    Yields:
+        bytes: Encoded chunk
+    """
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=columns, extrasaction="ignore")
+    writer.writeheader()
+    for batch in batches:
+        writer.writerows(
+            {
+                key: value.isoformat() if isinstance(value, datetime) else value
+                for key, value in row.items()
+            }
+            for row in batch
+        )
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+def gzip_stream(chunks: Iterable[bytes], level: int = 6) -> Iterator[bytes]:
+    """
+    Compress a byte stream into gzip format incrementally.
+
+    Args:
+        chunks: Uncompressed chunks
+        level: Compression level
+
+    Yields:
+        bytes: Compressed chunk
+    """
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)  # 31: gzip container
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
@@ -0,0 +1,314 @@
+import json
+import os
+import socket
+import stat
+import tempfile
+import threading
+from typing import Any, Callable, Dict, List, Optional
+from uuid import uuid4
+
+from sqlalchemy.engine import make_url
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.db.notify import PostgresListener, pg_notify
+from app.db.registry import PRIMARY, engine_registry
+
+logger = get_logger("invalidation")
+
+Message = Dict[str, Any]
+Handler = Callable[[Message], None]
+
+
+class InvalidationBus:
+    """
+    Broadcasts changes to in-process caches to the other worker processes.
+
+    The owner of a cache applies a change locally, then publishes it; every
+    other worker receives the message and calls the handler subscribed for
+    its type. Messages never come back to the worker that sent them.
+
+    Delivery is best effort: a lost message leaves the entries on that
+    worker stale until they expire. When a transport knows messages may
+    have been lost, such as after reconnecting, it calls ``reset`` and the
+    caches drop everything they hold. The base class has no peers and
+    suits single-process deployments. Nothing is published until ``start``.
+    """
+
+    def __init__(self) -> None:
+        self.origin = uuid4().hex
+        self._handlers: Dict[str, Handler] = {}
+        self._reset_handlers: List[Callable[[], None]] = []
+        self._started = False
+
+    def subscribe(self, message_type: str, handler: Handler) -> None:
+        """
+        Register the handler for one message type.
+
+        Args:
+            message_type: Message type
+            handler: Called with the message on a background thread
+        """
+        self._handlers[message_type] = handler
+
+    def subscribe_reset(self, handler: Callable[[], None]) -> None:
+        """
+        Register a handler dropping a cache whose invalidations may be lost.
+
+        Args:
+            handler: Called without arguments on a background thread
+        """
+        self._reset_handlers.append(handler)
+
+    def reset(self) -> None:
+        """
+        Drop every subscribed cache in this worker.
+        """
+        for handler in self._reset_handlers:
+            try:
+                handler()
+            except Exception:
+                logger.exception("Failed to reset a cache")
+
+    def start(self) -> None:
+        """
+        Connect to the other workers.
+        """
+        if not self._started:
+            self._open()
+            self._started = True
+
+    def stop(self) -> None:
+        """
+        Disconnect from the other workers.
+        """
+        if self._started:
+            self._started = False
+            self._close()
+
+    def publish(self, message_type: str, **fields: Any) -> None:
+        """
+        Send a message to every other worker.
+
+        Args:
+            message_type: Message type
+            **fields: JSON-serializable message fields
+        """
+        if not self._started:
+            return
+        payload = json.dumps({"type": message_type, "origin": self.origin, **fields})
+        try:
+            self._send(payload)
+        except Exception:
+            # The write has already been committed; stale entries on other
+            # workers age out with their cache TTL.
+            logger.error("Failed to publish %s", message_type, exc_info=True)
+
+    def receive(self, payload: str) -> None:
+        """
+        Dispatch a message received from another worker.
+
+        Args:
+            payload: Message as sent by ``publish``
+        """
+        try:
+            message = json.loads(payload)
+        except ValueError:
+            logger.warning("Ignoring malformed message %r", payload)
+            return
+        if message.get("origin") == self.origin:
+            return
+        handler = self._handlers.get(message.get("type"))
+        if handler is None:
+            return
+        try:
+            handler(message)
+        except Exception:
+            logger.exception("Failed to apply %s", message["type"])
+
+    def _open(self) -> None:
+        pass
+
+    def _close(self) -> None:
+        pass
+
+    def _send(self, payload: str) -> None:
+        pass
+
+
+class PostgresInvalidationBus(InvalidationBus):
+    """
+    Bus over PostgreSQL LISTEN/NOTIFY, reaching workers on every host.
+
+    Messages must stay under the 8000 byte NOTIFY payload limit.
+    """
+
+    def __init__(self, channel: str = settings.INVALIDATION_CHANNEL):
+        super().__init__()
+        self.channel = channel
+        self._listener: Optional[PostgresListener] = None
+
+    def _open(self) -> None:
+        # Invalidations sent while the connection was down are lost
+        self._listener = PostgresListener(
+            self.channel, self.receive, on_reconnect=self.reset
+        )
+        self._listener.start()
+
+    def _close(self) -> None:
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+
+    def _send(self, payload: str) -> None:
+        pg_notify(self.channel, payload)
+
+
+def default_socket_dir() -> str:
+    """
+    Get the per-user socket directory used without INVALIDATION_SOCKET_DIR.
+
+    Returns:
+        str: Directory under XDG_RUNTIME_DIR, or the temporary directory
+    """
+    base = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    return os.path.join(base, f"restaurant-booking-invalidation-{os.getuid()}")
+
+
+class UnixSocketInvalidationBus(InvalidationBus):
+    """
+    Bus over Unix datagram sockets, reaching workers on the same host.
+
+    Every worker binds a socket in a shared directory and sends each
+    message to all the other sockets found there. Sockets left behind by
+    workers that died are removed when a send to them is refused.
+
+    Datagrams carry no credentials, so the directory is what keeps other
+    local users out: it is created with mode 0700, and the bus refuses to
+    start in one that another user owns or can open. Sends never block; a
+    peer whose queue is full misses the message.
+    """
+
+    def __init__(self, directory: Optional[str] = settings.INVALIDATION_SOCKET_DIR):
+        super().__init__()
+        self.directory = directory or default_socket_dir()
+        self.path = os.path.join(
+            self.directory, f"{os.getpid()}-{self.origin[:8]}.sock"
+        )
+        self._socket: Optional[socket.socket] = None
+        self._sender: Optional[socket.socket] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def _open(self) -> None:
+        os.makedirs(self.directory, mode=0o700, exist_ok=True)
+        self._check_private(self.directory)
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        sock.bind(self.path)
+        # Bounds how soon the receiving thread notices stop()
+        sock.settimeout(1.0)
+        # Sends go through their own non-blocking socket, so a peer that
+        # stopped reading cannot hold up the request publishing to it
+        sender = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        sender.setblocking(False)
+        self._sender = sender
+        self._socket = sock
+        self._thread = threading.Thread(
+            target=self._listen, args=(sock,), name="invalidation", daemon=True
+        )
+        self._thread.start()
+
+    def _close(self) -> None:
+        sock, self._socket = self._socket, None
+        if self._thread is not None:
+            # Wake the receiving thread instead of waiting for its timeout
+            try:
+                sock.sendto(b"", self.path)
+            except OSError:
+                pass
+            self._thread.join()
+            self._thread = None
+        if sock is not None:
+            sock.close()
+        sender, self._sender = self._sender, None
+        if sender is not None:
+            sender.close()
+        try:
+            os.unlink(self.path)
+        except FileNotFoundError:
+            pass
+
+    def _send(self, payload: str) -> None:
+        sock = self._sender
+        if sock is None:
+            return
+        data = payload.encode()
+        for name in os.listdir(self.directory):
+            path = os.path.join(self.directory, name)
+            if not name.endswith(".sock") or path == self.path:
+                continue
+            try:
+                sock.sendto(data, path)
+            except (ConnectionRefusedError, FileNotFoundError):
+                self._remove_stale(path)
+            except BlockingIOError:
+                logger.warning("Dropped invalidation for %s: queue full", path)
+            except OSError:
+                logger.warning("Dropped invalidation for %s", path, exc_info=True)
+
+    def _listen(self, sock: socket.socket) -> None:
+        while self._socket is sock:
+            try:
+                data = sock.recv(65536)
+            except socket.timeout:
+                continue
+            except OSError:
+                if self._socket is sock:
+                    logger.exception("Invalidation listener stopped")
+                return
+            if data:
+                self.receive(data.decode())
+
+    @staticmethod
+    def _check_private(directory: str) -> None:
+        info = os.lstat(directory)
+        if (
+            not stat.S_ISDIR(info.st_mode)
+            or info.st_uid != os.getuid()
+            or info.st_mode & 0o077
+        ):
+            raise RuntimeError(
+                f"Invalidation socket directory {directory} must be a "
+                "directory owned by this user with mode 0700"
+            )
+
+    @staticmethod
+    def _remove_stale(path: str) -> None:
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+
+
+def create_bus() -> InvalidationBus:
+    """
+    Create the bus selected by INVALIDATION_BACKEND.
+
+    "auto" uses LISTEN/NOTIFY when the primary database is PostgreSQL and
+    Unix sockets otherwise.
+
+    Returns:
+        InvalidationBus: Configured bus
+    """
+    backend = settings.INVALIDATION_BACKEND
+    if backend == "auto":
+        url = make_url(engine_registry.get_urls()[PRIMARY])
+        backend = "postgres" if url.get_backend_name() == "postgresql" else "unix"
+    if backend == "postgres":
+        return PostgresInvalidationBus()
+    if backend == "unix":
+        return UnixSocketInvalidationBus()
+    return InvalidationBus()
+
+
+# Invalidations of the table response cache and the availability index
+invalidation_bus = create_bus()
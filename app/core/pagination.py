@@ -0,0 +1,75 @@
+import base64
+import json
+from datetime import datetime
+from typing import Any, List, Optional, Sequence
+
+from fastapi import Request, Response
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """
+    Encode a keyset position as an opaque cursor token.
+
+    Args:
+        values: Sort key values of the last row on a page
+
+    Returns:
+        str: URL-safe cursor token
+    """
+    payload = [
+        value.isoformat() if isinstance(value, datetime) else value
+        for value in values
+    ]
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(token: str) -> List[Any]:
+    """
+    Decode a cursor token produced by encode_cursor.
+
+    Datetime values are returned as ISO strings; callers convert them.
+
+    Args:
+        token: Cursor token
+
+    Returns:
+        List[Any]: Sort key values
+
+    Raises:
+        ValueError: If the token is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        values = json.loads(raw)
+    except (ValueError, TypeError) as exc:
+        raise ValueError("Invalid cursor") from exc
+    if not isinstance(values, list):
+        raise ValueError("Invalid cursor")
+    return values
+
+
+# Response header carrying the cursor of the next page
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def set_next_page_headers(
+    request: Request,
+    response: Response,
+    cursor: Optional[str]
+) -> None:
+    """
+    Advertise the next page through X-Next-Cursor and Link headers.
+
+    Nothing is set on the last page.
+
+    Args:
+        request: Current request
+        response: Response being built
+        cursor: Cursor of the next page
+    """
+    if cursor is None:
+        return
+    response.headers[NEXT_CURSOR_HEADER] = cursor
+    next_url = request.url.include_query_params(cursor=cursor)
+    response.headers["Link"] = f'<{next_url}>; rel="next"'
@@ -0,0 +1,19 @@
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response encoded with orjson.
+
+    Meant for content that is already made of plain dicts, lists and
+    scalars: orjson encodes datetimes, dataclasses and UUIDs itself, in
+    the same ISO format as Pydantic, several times faster than json.dumps.
+    Routes returning it keep their ``response_model`` for the OpenAPI
+    schema, but FastAPI skips validating the content against it.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
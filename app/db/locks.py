@@ -0,0 +1,79 @@
+import asyncio
+import threading
+import weakref
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator
+
+from sqlalchemy import text
+from sqlalchemy.util.concurrency import await_only, in_greenlet
+from sqlmodel import Session
+
+# Namespace for the two-key form of pg_advisory_xact_lock so table locks
+# cannot collide with advisory locks taken by other parts of the system.
+TABLE_LOCK_NAMESPACE = 1001
+
+_local_locks: Dict[int, threading.Lock] = {}
+_local_locks_guard = threading.Lock()
+# Per event loop, since an asyncio.Lock belongs to the loop it is used on
+_async_locks: "weakref.WeakKeyDictionary[Any, Dict[int, asyncio.Lock]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_local_lock(table_id: int) -> threading.Lock:
+    with _local_locks_guard:
+        lock = _local_locks.get(table_id)
+        if lock is None:
+            lock = _local_locks[table_id] = threading.Lock()
+        return lock
+
+
+def _get_async_lock(table_id: int) -> asyncio.Lock:
+    locks = _async_locks.setdefault(asyncio.get_running_loop(), {})
+    lock = locks.get(table_id)
+    if lock is None:
+        lock = locks[table_id] = asyncio.Lock()
+    return lock
+
+
+@contextmanager
+def table_lock(session: Session, table_id: int) -> Iterator[None]:
+    """
+    Serialize bookings for a single table.
+
+    On PostgreSQL a transaction-scoped advisory lock is taken, so the lock is
+    held until the surrounding transaction commits or rolls back and works
+    across worker processes. Other databases fall back to an in-process lock
+    per table. Bookings for different tables never wait on each other.
+
+    A service called through AsyncSession.run_sync runs on the event loop
+    thread, where blocking on a threading.Lock held by a suspended request
+    would freeze the loop; there the per-table lock is an asyncio.Lock,
+    awaited through SQLAlchemy's greenlet bridge.
+
+    Args:
+        session: Database session running the booking transaction
+        table_id: Table ID to lock
+
+    Yields:
+        None: The lock is held for the duration of the block
+    """
+    if session.get_bind().dialect.name == "postgresql":
+        session.execute(
+            text("SELECT pg_advisory_xact_lock(:namespace, :key)"),
+            {"namespace": TABLE_LOCK_NAMESPACE, "key": table_id}
+        )
+        yield
+        return
+
+    if in_greenlet():
+        lock = _get_async_lock(table_id)
+        await_only(lock.acquire())
+        try:
+            yield
+        finally:
+            lock.release()
+        return
+
+    with _get_local_lock(table_id):
+        yield
@@ -0,0 +1,136 @@
+import select
+import threading
+from typing import Any, Callable, Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.db.registry import PRIMARY, engine_registry
+
+logger = get_logger("notify")
+
+
+def pg_notify(channel: str, payload: str) -> None:
+    """
+    Send a NOTIFY on the primary database.
+
+    Args:
+        channel: Channel name
+        payload: Message, at most 8000 bytes
+    """
+    with engine_registry.get(PRIMARY).begin() as connection:
+        connection.execute(
+            text("SELECT pg_notify(:channel, :payload)"),
+            {"channel": channel, "payload": payload}
+        )
+
+
+class PostgresListener:
+    """
+    Background thread receiving NOTIFY messages on one channel.
+
+    Uses a dedicated psycopg2 connection to the primary database outside
+    the pool, since a listening connection must stay open. ``callback`` is
+    called on the listener thread with each payload.
+
+    A dropped connection, for example on a failover, is reopened with
+    exponential backoff up to NOTIFY_RECONNECT_MAX_SECONDS. Notifications
+    sent while it was down are lost, so ``on_reconnect`` is called once
+    listening again, letting the owner resync.
+    """
+
+    def __init__(
+        self,
+        channel: str,
+        callback: Callable[[str], None],
+        on_reconnect: Optional[Callable[[], None]] = None
+    ):
+        self.channel = channel
+        self.callback = callback
+        self.on_reconnect = on_reconnect
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+
+    def start(self) -> None:
+        """
+        Open the listening connection and start the thread.
+        """
+        if self._thread is not None:
+            return
+        # The first connection is opened here, so a misconfiguration fails
+        # startup instead of being retried in the background
+        connection = self._connect()
+
+        self._stopping.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(connection,),
+            name=f"listen-{self.channel}",
+            daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stop the thread and close its connection.
+        """
+        if self._thread is None:
+            return
+        self._stopping.set()
+        self._thread.join()
+        self._thread = None
+
+    def _connect(self) -> Any:
+        import psycopg2
+
+        url = make_url(engine_registry.get_urls()[PRIMARY])
+        connection = psycopg2.connect(
+            url.set(drivername="postgresql").render_as_string(hide_password=False)
+        )
+        connection.autocommit = True
+        with connection.cursor() as cursor:
+            cursor.execute(f'LISTEN "{self.channel}"')
+        return connection
+
+    def _run(self, connection: Any) -> None:
+        delay = 0.0
+        while True:
+            if connection is not None:
+                self._listen(connection)
+            if self._stopping.is_set():
+                return
+            delay = min(max(delay * 2, 1.0), settings.NOTIFY_RECONNECT_MAX_SECONDS)
+            if self._stopping.wait(delay):
+                return
+            try:
+                connection = self._connect()
+            except Exception:
+                logger.warning(
+                    "Reconnecting listener on %s failed", self.channel,
+                    exc_info=True
+                )
+                connection = None
+                continue
+            delay = 0.0
+            logger.info("Listener on %s reconnected", self.channel)
+            if self.on_reconnect is not None:
+                try:
+                    self.on_reconnect()
+                except Exception:
+                    logger.exception("Failed to resync %s", self.channel)
+
+    def _listen(self, connection: Any) -> None:
+        try:
+            while not self._stopping.is_set():
+                # Wake up regularly to notice stop()
+                if select.select([connection], [], [], 1.0) == ([], [], []):
+                    continue
+                connection.poll()
+                while connection.notifies:
+                    self.callback(connection.notifies.pop(0).payload)
+        except Exception:
+            logger.exception("Listener on %s lost its connection", self.channel)
+        finally:
+            connection.close()
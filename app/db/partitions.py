@@ -0,0 +1,416 @@
+"""
+Monthly range partitions of the reservations table on PostgreSQL.
+
+Reservations are partitioned by ``reservation_time``, one partition per
+calendar month, so queries for the next few weeks only touch one or two
+small partitions. There is no default partition: partitions are created
+RESERVATION_PARTITIONS_AHEAD_MONTHS ahead by the maintenance command, which
+also detaches partitions older than RESERVATION_PARTITIONS_RETAIN_MONTHS.
+A booking for a month without a partition raises NoPartition, which the
+API reports as 422 rather than as a conflict.
+Detached partitions stay in the database as plain tables until archived or
+dropped.
+
+PostgreSQL cannot enforce an exclusion constraint across partitions unless
+it includes the partition key with equality, so each partition carries its
+own no-overlap constraint. Two reservations on either side of a month
+boundary are only kept apart by the per-table lock in ReservationService.
+
+Usage:
+    python -m app.db.partitions [--ahead 12] [--retain 24] [--dry-run]
+"""
+import argparse
+from datetime import date, datetime
+from typing import List, Optional, Sequence, Tuple, Union
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import IntegrityError
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.db.registry import PRIMARY, engine_registry
+
+logger = get_logger("partitions")
+
+PARENT = "reservations"
+PARTITION_PREFIX = "reservations_y"
+# Bounds how long partition DDL waits behind running queries
+LOCK_TIMEOUT = "5s"
+
+# Index name and columns
+IndexSpec = Tuple[str, Sequence[str]]
+
+
+class NoPartition(Exception):
+    """
+    Raised when a reservation falls in a month that has no partition yet.
+    """
+
+
+def is_missing_partition(exc: IntegrityError) -> bool:
+    """
+    Check whether a failed write had no partition to go to.
+
+    PostgreSQL reports it as a check violation (SQLSTATE 23514), like a
+    violated CHECK constraint, so the message tells the two apart.
+
+    Args:
+        exc: Error raised by the write
+
+    Returns:
+        bool: True if the row's month has no partition
+    """
+    orig = exc.orig
+    code = getattr(orig, "pgcode", None) or getattr(orig, "sqlstate", None)
+    return code == "23514" and "no partition of relation" in str(orig)
+
+
+def month_start(value: Union[date, datetime]) -> date:
+    """
+    Get the first day of the month containing a date or time.
+
+    Args:
+        value: Any day or time in the month
+
+    Returns:
+        date: First day of the month
+    """
+    return date(value.year, value.month, 1)
+
+
+def add_months(month: date, months: int) -> date:
+    """
+    Shift the first day of a month by a number of months.
+
+    Args:
+        month: First day of a month
+        months: Months to add, may be negative
+
+    Returns:
+        date: First day of the resulting month
+    """
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    """
+    Get the name of the partition holding a month.
+
+    Args:
+        month: First day of the month
+
+    Returns:
+        str: Partition table name, e.g. reservations_y2026m10
+    """
+    return f"{PARTITION_PREFIX}{month.year:04d}m{month.month:02d}"
+
+
+def partition_month(name: str) -> Optional[date]:
+    """
+    Get the month held by a partition from its name.
+
+    Args:
+        name: Table name
+
+    Returns:
+        Optional[date]: First day of the month, None for other tables
+    """
+    if not name.startswith(PARTITION_PREFIX):
+        return None
+    try:
+        year, month = name[len(PARTITION_PREFIX):].split("m")
+        return date(int(year), int(month), 1)
+    except ValueError:
+        return None
+
+
+def plan_partitions(
+    existing: List[date],
+    today: date,
+    ahead: int,
+    retain: int
+) -> Tuple[List[date], List[date]]:
+    """
+    Decide which monthly partitions to create and which to detach.
+
+    Args:
+        existing: Months of the attached partitions
+        today: Current date
+        ahead: Months after the current one that must have a partition
+        retain: Months before the current one whose partitions stay attached
+
+    Returns:
+        Tuple[List[date], List[date]]: Months to create and months to
+        detach, both in ascending order
+    """
+    current = month_start(today)
+    wanted = [add_months(current, i) for i in range(ahead + 1)]
+    oldest_kept = add_months(current, -retain)
+    create = [month for month in wanted if month not in existing]
+    detach = sorted(month for month in existing if month < oldest_kept)
+    return create, detach
+
+
+def attached_partitions(connection: Connection) -> List[date]:
+    """
+    Get the months of the partitions attached to the reservations table.
+
+    Args:
+        connection: Connection to the primary database
+
+    Returns:
+        List[date]: First day of each partition's month, ascending
+    """
+    names = connection.execute(text(
+        "SELECT child.relname FROM pg_inherits "
+        "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+        "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+        "WHERE parent.relname = :parent"
+    ), {"parent": PARENT}).scalars()
+    return sorted(
+        month for month in map(partition_month, names) if month is not None
+    )
+
+
+def _no_overlap_sql(table: str) -> str:
+    return (
+        f"ALTER TABLE {table} ADD CONSTRAINT {table}_no_overlap "
+        "EXCLUDE USING gist ("
+        "table_id WITH =, tsrange(reservation_time, end_time) WITH &&"
+        ")"
+    )
+
+
+def _bounds(month: date) -> str:
+    return f"FROM ('{month.isoformat()}') TO ('{add_months(month, 1).isoformat()}')"
+
+
+def create_partition(connection: Connection, month: date) -> None:
+    """
+    Create and attach the partition for one month.
+
+    The partition is built as a standalone table and then attached, which
+    only takes a SHARE UPDATE EXCLUSIVE lock on the parent; creating it with
+    PARTITION OF would block every query on reservations meanwhile.
+
+    Args:
+        connection: Connection to the primary database, in a transaction
+        month: First day of the month
+    """
+    name = partition_name(month)
+    connection.execute(text(f"SET LOCAL lock_timeout = '{LOCK_TIMEOUT}'"))
+    connection.execute(text(
+        f"CREATE TABLE {name} (LIKE {PARENT} INCLUDING DEFAULTS)"
+    ))
+    # Lets ATTACH skip scanning the table to validate the bounds
+    connection.execute(text(
+        f"ALTER TABLE {name} ADD CONSTRAINT {name}_bounds CHECK ("
+        f"reservation_time >= '{month.isoformat()}' "
+        f"AND reservation_time < '{add_months(month, 1).isoformat()}')"
+    ))
+    connection.execute(text(_no_overlap_sql(name)))
+    connection.execute(text(
+        f"ALTER TABLE {PARENT} ATTACH PARTITION {name} FOR VALUES {_bounds(month)}"
+    ))
+    connection.execute(text(f"ALTER TABLE {name} DROP CONSTRAINT {name}_bounds"))
+
+
+def detach_partition(connection: Connection, month: date) -> None:
+    """
+    Detach the partition of one month, keeping it as a plain table.
+
+    Args:
+        connection: Connection to the primary database, in a transaction
+        month: First day of the month
+    """
+    connection.execute(text(f"SET LOCAL lock_timeout = '{LOCK_TIMEOUT}'"))
+    connection.execute(text(
+        f"ALTER TABLE {PARENT} DETACH PARTITION {partition_name(month)}"
+    ))
+
+
+def maintain_partitions(
+    connection: Connection,
+    today: Optional[date] = None,
+    ahead: int = settings.RESERVATION_PARTITIONS_AHEAD_MONTHS,
+    retain: int = settings.RESERVATION_PARTITIONS_RETAIN_MONTHS,
+    dry_run: bool = False
+) -> Tuple[List[date], List[date]]:
+    """
+    Pre-create future partitions and detach old ones.
+
+    Every partition change is committed on its own, so locks on the
+    reservations table are held only briefly.
+
+    Args:
+        connection: Connection to the primary database, outside a transaction
+        today: Current date, today by default
+        ahead: Months after the current one that must have a partition
+        retain: Months before the current one whose partitions stay attached
+        dry_run: Only report what would change
+
+    Returns:
+        Tuple[List[date], List[date]]: Months created and months detached
+    """
+    with connection.begin():
+        existing = attached_partitions(connection)
+    create, detach = plan_partitions(
+        existing, today or date.today(), ahead, retain
+    )
+    if dry_run:
+        return create, detach
+    for month in create:
+        with connection.begin():
+            create_partition(connection, month)
+        logger.info("Created partition %s", partition_name(month))
+    for month in detach:
+        with connection.begin():
+            detach_partition(connection, month)
+        logger.info("Detached partition %s", partition_name(month))
+    return create, detach
+
+
+def partition_reservations(
+    connection: Connection,
+    indexes: Sequence[IndexSpec],
+    ahead: int = settings.RESERVATION_PARTITIONS_AHEAD_MONTHS
+) -> None:
+    """
+    Convert the reservations table into a table partitioned by month.
+
+    Rows are copied into a new partitioned table while the old one is
+    locked against writes, then the new table takes its name, sequence,
+    foreign key and indexes. Reads continue during the copy. Runs inside the
+    caller's transaction.
+
+    Args:
+        connection: Connection to the primary database, in a transaction
+        indexes: Indexes to recreate; a migration passes the ones of its
+            own revision rather than the current model's
+        ahead: Months after the current one to create partitions for
+    """
+    new = f"{PARENT}_partitioned"
+    connection.execute(text(f"LOCK TABLE {PARENT} IN EXCLUSIVE MODE"))
+    first, last = connection.execute(text(
+        f"SELECT min(reservation_time), max(reservation_time) FROM {PARENT}"
+    )).one()
+
+    connection.execute(text(
+        f"CREATE TABLE {new} (LIKE {PARENT} INCLUDING DEFAULTS) "
+        "PARTITION BY RANGE (reservation_time)"
+    ))
+    # Unique constraints on a partitioned table must include the key
+    connection.execute(text(
+        f"ALTER TABLE {new} ADD CONSTRAINT {new}_pkey "
+        "PRIMARY KEY (id, reservation_time)"
+    ))
+
+    current = month_start(date.today())
+    month = min(month_start(first), current) if first else current
+    end = add_months(current, ahead)
+    if last is not None:
+        end = max(end, month_start(last))
+    while month <= end:
+        name = partition_name(month)
+        connection.execute(text(
+            f"CREATE TABLE {name} PARTITION OF {new} FOR VALUES {_bounds(month)}"
+        ))
+        connection.execute(text(_no_overlap_sql(name)))
+        month = add_months(month, 1)
+
+    connection.execute(text(f"INSERT INTO {new} SELECT * FROM {PARENT}"))
+    connection.execute(text(
+        f"ALTER SEQUENCE {_id_sequence(connection)} OWNED BY {new}.id"
+    ))
+    connection.execute(text(f"DROP TABLE {PARENT}"))
+    connection.execute(text(f"ALTER TABLE {new} RENAME TO {PARENT}"))
+    connection.execute(text(
+        f"ALTER TABLE {PARENT} RENAME CONSTRAINT {new}_pkey TO {PARENT}_pkey"
+    ))
+    _create_dependents(connection, indexes)
+
+
+def unpartition_reservations(
+    connection: Connection,
+    indexes: Sequence[IndexSpec]
+) -> None:
+    """
+    Convert the partitioned reservations table back into a plain table.
+
+    Only rows in attached partitions are kept; detached partitions are left
+    as they are. Runs inside the caller's transaction.
+
+    Args:
+        connection: Connection to the primary database, in a transaction
+        indexes: Indexes to recreate
+    """
+    new = f"{PARENT}_unpartitioned"
+    connection.execute(text(f"LOCK TABLE {PARENT} IN EXCLUSIVE MODE"))
+    connection.execute(text(
+        f"CREATE TABLE {new} (LIKE {PARENT} INCLUDING DEFAULTS)"
+    ))
+    connection.execute(text(
+        f"ALTER TABLE {new} ADD CONSTRAINT {new}_pkey PRIMARY KEY (id)"
+    ))
+    connection.execute(text(f"INSERT INTO {new} SELECT * FROM {PARENT}"))
+    connection.execute(text(
+        f"ALTER SEQUENCE {_id_sequence(connection)} OWNED BY {new}.id"
+    ))
+    connection.execute(text(f"DROP TABLE {PARENT}"))
+    connection.execute(text(f"ALTER TABLE {new} RENAME TO {PARENT}"))
+    connection.execute(text(
+        f"ALTER TABLE {PARENT} RENAME CONSTRAINT {new}_pkey TO {PARENT}_pkey"
+    ))
+    connection.execute(text(_no_overlap_sql(PARENT)))
+    _create_dependents(connection, indexes)
+
+
+def _id_sequence(connection: Connection) -> str:
+    return connection.execute(text(
+        f"SELECT pg_get_serial_sequence('{PARENT}', 'id')"
+    )).scalar_one()
+
+
+def _create_dependents(
+    connection: Connection,
+    indexes: Sequence[IndexSpec]
+) -> None:
+    # The foreign key and the given indexes; on a partitioned table each
+    # index is created on every partition too.
+    connection.execute(text(
+        f"ALTER TABLE {PARENT} ADD CONSTRAINT {PARENT}_table_id_fkey "
+        "FOREIGN KEY (table_id) REFERENCES tables (id)"
+    ))
+    for name, columns in indexes:
+        connection.execute(text(
+            f"CREATE INDEX {name} ON {PARENT} ({', '.join(columns)})"
+        ))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Create future reservation partitions and detach old ones."
+    )
+    parser.add_argument(
+        "--ahead", type=int, default=settings.RESERVATION_PARTITIONS_AHEAD_MONTHS
+    )
+    parser.add_argument(
+        "--retain", type=int, default=settings.RESERVATION_PARTITIONS_RETAIN_MONTHS
+    )
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args()
+
+    engine_registry.startup()
+    with engine_registry.get(PRIMARY).connect() as connection:
+        create, detach = maintain_partitions(
+            connection, ahead=args.ahead, retain=args.retain, dry_run=args.dry_run
+        )
+    verb = "Would" if args.dry_run else "Did"
+    print(f"{verb} create: {', '.join(map(partition_name, create)) or 'none'}")
+    print(f"{verb} detach: {', '.join(map(partition_name, detach)) or 'none'}")
+
+
+if __name__ == "__main__":
+    main()
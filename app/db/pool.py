@@ -0,0 +1,158 @@
+import threading
+import time
+from typing import Any, Dict
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry, QueuePool
+
+from app.core.config import settings
+
+# Key in ConnectionPoolEntry.info holding how long the last checkout waited
+CHECKOUT_WAIT_KEY = "checkout_wait"
+# Key in ConnectionPoolEntry.info holding when the DBAPI connection was opened
+CONNECTED_AT_KEY = "connected_at"
+
+
+class _CheckoutTimingMixin:
+    """
+    Records how long each checkout waited for a connection.
+
+    The time covers waiting on the queue when the pool is exhausted as well as
+    opening a new connection. It is stored on the pool entry and picked up by
+    the ``checkout`` listener of PoolMetrics.
+    """
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        started = time.perf_counter()
+        record = super()._do_get()  # type: ignore[misc]
+        record.info[CHECKOUT_WAIT_KEY] = time.perf_counter() - started
+        return record
+
+
+class InstrumentedQueuePool(_CheckoutTimingMixin, QueuePool):
+    """
+    QueuePool that records checkout wait time.
+    """
+
+
+class InstrumentedAsyncAdaptedQueuePool(
+    _CheckoutTimingMixin, AsyncAdaptedQueuePool
+):
+    """
+    AsyncAdaptedQueuePool that records checkout wait time.
+    """
+
+
+def get_pool_options(async_engine: bool = False) -> Dict[str, Any]:
+    """
+    Build connection pool arguments for create_engine from settings.
+
+    Args:
+        async_engine: Whether the options are for an AsyncEngine
+
+    Returns:
+        Dict[str, Any]: Keyword arguments for create_engine
+    """
+    return {
+        "poolclass": (
+            InstrumentedAsyncAdaptedQueuePool if async_engine
+            else InstrumentedQueuePool
+        ),
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+
+
+class PoolMetrics:
+    """
+    Connection pool telemetry collected from SQLAlchemy pool events.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.connects = 0
+        self.invalidations = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.overflow_peak = 0
+        self._connected_at: Dict[int, float] = {}
+
+    def attach(self, engine: Engine) -> None:
+        """
+        Start collecting metrics for an engine's pool.
+
+        Args:
+            engine: Engine to instrument (``AsyncEngine.sync_engine`` for async)
+        """
+        self.engine = engine
+        event.listen(engine, "connect", self._on_connect)
+        event.listen(engine, "checkout", self._on_checkout)
+        event.listen(engine, "close", self._on_close)
+        event.listen(engine, "invalidate", self._on_invalidate)
+
+    def _on_connect(self, dbapi_connection: Any, record: Any) -> None:
+        now = time.monotonic()
+        record.info[CONNECTED_AT_KEY] = now
+        with self._lock:
+            self.connects += 1
+            self._connected_at[id(dbapi_connection)] = now
+
+    def _on_checkout(self, dbapi_connection: Any, record: Any, proxy: Any) -> None:
+        wait = record.info.pop(CHECKOUT_WAIT_KEY, 0.0)
+        overflow = getattr(self.engine.pool, "overflow", lambda: 0)()
+        with self._lock:
+            self.checkouts += 1
+            self.wait_total += wait
+            self.wait_max = max(self.wait_max, wait)
+            self.overflow_peak = max(self.overflow_peak, overflow)
+
+    def _on_close(self, dbapi_connection: Any, record: Any) -> None:
+        with self._lock:
+            self._connected_at.pop(id(dbapi_connection), None)
+
+    def _on_invalidate(
+        self, dbapi_connection: Any, record: Any, exception: Any
+    ) -> None:
+        with self._lock:
+            self.invalidations += 1
+            self._connected_at.pop(id(dbapi_connection), None)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get current pool state and accumulated counters.
+
+        Returns:
+            Dict[str, Any]: Pool statistics
+        """
+        pool = self.engine.pool
+        now = time.monotonic()
+        with self._lock:
+            ages = [now - opened for opened in self._connected_at.values()]
+            return {
+                "pool_class": type(pool).__name__,
+                "size": getattr(pool, "size", lambda: 0)(),
+                "checked_out": getattr(pool, "checkedout", lambda: 0)(),
+                "checked_in": getattr(pool, "checkedin", lambda: 0)(),
+                "overflow": max(getattr(pool, "overflow", lambda: 0)(), 0),
+                "max_overflow": getattr(pool, "_max_overflow", 0),
+                "overflow_peak": max(self.overflow_peak, 0),
+                "checkouts": self.checkouts,
+                "connects": self.connects,
+                "invalidations": self.invalidations,
+                "wait_total_ms": self.wait_total * 1000,
+                "wait_max_ms": self.wait_max * 1000,
+                "wait_avg_ms": (
+                    self.wait_total / self.checkouts * 1000
+                    if self.checkouts else 0.0
+                ),
+                "open_connections": len(ages),
+                "connection_age_max_seconds": max(ages, default=0.0),
+                "connection_age_avg_seconds": (
+                    sum(ages) / len(ages) if ages else 0.0
+                ),
+            }
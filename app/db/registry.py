@@ -0,0 +1,177 @@
+from typing import Any, Dict, Optional
+
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlmodel import create_engine
+
+from app.core.config import settings
+from app.db.pool import PoolMetrics, get_pool_options
+
+# Async drivers used for each backend when DB_ENGINE is "async"
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+PRIMARY = "primary"
+REPLICA = "replica"
+
+
+def get_async_url(url: str) -> str:
+    """
+    Convert a database URL to its async driver equivalent.
+
+    Args:
+        url: Database URL using a blocking driver
+
+    Returns:
+        str: The same URL using the matching async driver
+    """
+    parsed = make_url(url)
+    drivername = ASYNC_DRIVERS.get(parsed.get_backend_name(), parsed.drivername)
+    return parsed.set(drivername=drivername).render_as_string(hide_password=False)
+
+
+class EngineRegistry:
+    """
+    Registry of named database engines.
+
+    Engines are created once when the application starts and disposed when
+    it shuts down, so every request shares the same connection pools.
+    """
+
+    def __init__(self) -> None:
+        self._engines: Dict[str, Engine] = {}
+        self._async_engines: Dict[str, AsyncEngine] = {}
+        self._metrics: Dict[str, PoolMetrics] = {}
+
+    def get_urls(self) -> Dict[str, str]:
+        """
+        Get database URLs for every configured engine name.
+
+        Returns:
+            Dict[str, str]: Engine name to database URL
+        """
+        urls = {PRIMARY: str(settings.SQLALCHEMY_DATABASE_URI)}
+        if settings.SQLALCHEMY_REPLICA_URI:
+            urls[REPLICA] = str(settings.SQLALCHEMY_REPLICA_URI)
+        return urls
+
+    def startup(self) -> None:
+        """
+        Create engines for all configured databases.
+        """
+        for name, url in self.get_urls().items():
+            self.register(name, url)
+
+    def register(self, name: str, url: str) -> Engine:
+        """
+        Create and register the engines for one database.
+
+        The blocking engine is always created; an AsyncEngine is added when
+        DB_ENGINE is "async". Registering an existing name is a no-op.
+
+        Args:
+            name: Engine name, e.g. "primary" or "replica"
+            url: Database URL using a blocking driver
+
+        Returns:
+            Engine: The registered blocking engine
+        """
+        if name in self._engines:
+            return self._engines[name]
+
+        echo = settings.LOG_LEVEL == "DEBUG"  # Enable SQL logging in debug mode
+        engine = create_engine(url, echo=echo, **get_pool_options())
+        self._engines[name] = engine
+        self._metrics[name] = PoolMetrics()
+        self._metrics[name].attach(engine)
+
+        if settings.DB_ENGINE == "async":
+            async_engine = create_async_engine(
+                get_async_url(url),
+                echo=echo,
+                **get_pool_options(async_engine=True)
+            )
+            self._async_engines[name] = async_engine
+            self._metrics[f"{name}_async"] = PoolMetrics()
+            self._metrics[f"{name}_async"].attach(async_engine.sync_engine)
+        return engine
+
+    def has(self, name: str) -> bool:
+        """
+        Check whether an engine with the given name is registered.
+        """
+        return name in self._engines
+
+    def get(self, name: str = PRIMARY) -> Engine:
+        """
+        Get a registered blocking engine.
+
+        Args:
+            name: Engine name
+
+        Returns:
+            Engine: The engine
+
+        Raises:
+            RuntimeError: If no engine is registered under the name
+        """
+        try:
+            return self._engines[name]
+        except KeyError:
+            raise RuntimeError(
+                f"Database engine '{name}' is not registered; "
+                "engines are created at application startup"
+            ) from None
+
+    def get_async(self, name: str = PRIMARY) -> AsyncEngine:
+        """
+        Get a registered async engine.
+
+        Args:
+            name: Engine name
+
+        Returns:
+            AsyncEngine: The engine
+
+        Raises:
+            RuntimeError: If no async engine is registered under the name
+        """
+        try:
+            return self._async_engines[name]
+        except KeyError:
+            raise RuntimeError(
+                f"Async database engine '{name}' is not registered; "
+                "set DB_ENGINE=async and start the application"
+            ) from None
+
+    def pool_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get connection pool statistics for every registered engine.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Engine name to pool statistics
+        """
+        return {name: metrics.snapshot() for name, metrics in self._metrics.items()}
+
+    def get_metrics(self, name: str = PRIMARY) -> Optional[PoolMetrics]:
+        """
+        Get the pool metrics collector of a registered engine.
+        """
+        return self._metrics.get(name)
+
+    async def dispose(self) -> None:
+        """
+        Close all pooled connections and forget every engine.
+        """
+        for async_engine in self._async_engines.values():
+            await async_engine.dispose()
+        for engine in self._engines.values():
+            engine.dispose()
+        self._engines.clear()
+        self._async_engines.clear()
+        self._metrics.clear()
+
+
+engine_registry = EngineRegistry()
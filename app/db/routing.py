@@ -0,0 +1,73 @@
+import time
+from typing import Awaitable, Callable
+
+from fastapi import Request, Response
+
+from app.core.config import settings
+from app.db.registry import PRIMARY, REPLICA, engine_registry
+
+# Cookie holding the UNIX time until which the client reads from the primary
+STICKY_COOKIE = "db_primary_until"
+WRITE_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
+
+
+def prefers_primary(request: Request) -> bool:
+    """
+    Check whether the client wrote recently and must read from the primary.
+
+    Args:
+        request: Incoming request
+
+    Returns:
+        bool: True while the client's read-your-writes window is open
+    """
+    value = request.cookies.get(STICKY_COOKIE)
+    if not value:
+        return False
+    try:
+        return float(value) > time.time()
+    except ValueError:
+        return False
+
+
+def get_read_engine_name(request: Request) -> str:
+    """
+    Choose the engine that serves a read-only request.
+
+    Reads go to the replica when one is configured, except for clients
+    that wrote within the last DB_READ_YOUR_WRITES_SECONDS, so they always
+    see their own changes despite replication lag.
+
+    Args:
+        request: Incoming request
+
+    Returns:
+        str: Engine name in the registry
+    """
+    if engine_registry.has(REPLICA) and not prefers_primary(request):
+        return REPLICA
+    return PRIMARY
+
+
+async def read_your_writes_middleware(
+    request: Request,
+    call_next: Callable[[Request], Awaitable[Response]]
+) -> Response:
+    """
+    Pin a client's reads to the primary for a short window after a write.
+    """
+    response = await call_next(request)
+    window = settings.DB_READ_YOUR_WRITES_SECONDS
+    if (
+        request.method in WRITE_METHODS
+        and response.status_code < 400
+        and window > 0
+    ):
+        response.set_cookie(
+            STICKY_COOKIE,
+            f"{time.time() + window:.3f}",
+            max_age=window,
+            httponly=True,
+            samesite="lax"
+        )
+    return response
@@ -1,23 +1,110 @@
-from typing import Generator
+from typing import AsyncGenerator, Callable, Generator, Union
 
-from sqlmodel import Session, create_engine
+from fastapi import Request
+from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.core.config import settings
+from app.db.registry import PRIMARY, engine_registry, get_async_url
+from app.db.routing import get_read_engine_name
 
-# Create SQLAlchemy engine
-engine = create_engine(
-    str(settings.SQLALCHEMY_DATABASE_URI),
-    pool_pre_ping=True,
-    echo=settings.LOG_LEVEL == "DEBUG"  # Enable SQL logging in debug mode
-)
+# Session type handed to endpoints, depending on the configured engine
+AnySession = Union[Session, AsyncSession]
 
 
-def get_session() -> Generator[Session, None, None]:
+def get_sync_session() -> Generator[Session, None, None]:
     """
     Get database session.
-    
+
+    Objects are not expired on commit: writes return their rows with
+    RETURNING, so reloading them afterwards would only add round trips.
+
     Yields:
         Session: Database session
     """
-    with Session(engine) as session:
-        yield session 
\ No newline at end of file
+    with Session(engine_registry.get(PRIMARY), expire_on_commit=False) as session:
+        yield session
+
+
+async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Get async database session.
+
+    Objects are not expired on commit, since attribute refreshes cannot
+    happen implicitly outside of the async driver's context.
+
+    Yields:
+        AsyncSession: Async database session
+    """
+    async with AsyncSession(
+        engine_registry.get_async(PRIMARY), expire_on_commit=False
+    ) as session:
+        yield session
+
+
+def get_sync_read_session(request: Request) -> Generator[Session, None, None]:
+    """
+    Get database session for read-only requests.
+
+    Uses the replica when one is configured, see get_read_engine_name.
+
+    Yields:
+        Session: Database session
+    """
+    with Session(engine_registry.get(get_read_engine_name(request))) as session:
+        yield session
+
+
+async def get_async_read_session(
+    request: Request
+) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Get async database session for read-only requests.
+
+    Yields:
+        AsyncSession: Async database session
+    """
+    async with AsyncSession(
+        engine_registry.get_async(get_read_engine_name(request)),
+        expire_on_commit=False
+    ) as session:
+        yield session
+
+
+def get_read_session_factory(request: Request) -> Callable[[], Session]:
+    """
+    Get a factory of blocking read sessions.
+
+    For streaming responses, which keep reading from the database after the
+    endpoint has returned and its dependencies have been closed. The sessions
+    use the same engine routing as get_read_session.
+
+    Returns:
+        Callable[[], Session]: Factory of new sessions
+    """
+    engine = engine_registry.get(get_read_engine_name(request))
+    return lambda: Session(engine)
+
+
+def get_session_factory() -> Callable[[], Session]:
+    """
+    Get a factory of blocking sessions on the primary database.
+
+    For bookkeeping that must commit independently of the endpoint's own
+    session and may run after its dependencies have been closed.
+
+    Returns:
+        Callable[[], Session]: Factory of new sessions
+    """
+    engine = engine_registry.get(PRIMARY)
+    return lambda: Session(engine)
+
+
+# Session dependencies used by the endpoints for the configured engine:
+# get_session for writes, get_read_session for GET routes
+if settings.DB_ENGINE == "async":
+    get_session = get_async_session
+    get_read_session = get_async_read_session
+else:
+    get_session = get_sync_session
+    get_read_session = get_sync_read_session
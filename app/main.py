@@ -1,17 +1,44 @@
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.api.v1.api import api_router
 from app.core.config import settings
+from app.core.events import event_broker
+from app.core.invalidation import invalidation_bus
 from app.core.logging import setup_logging
+from app.core.pagination import NEXT_CURSOR_HEADER
+from app.db.registry import engine_registry
+from app.db.routing import read_your_writes_middleware
 
 # Setup logging
 setup_logging()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    Create database engines and connect the event broker and invalidation
+    bus on startup; stop and dispose them on shutdown.
+    """
+    engine_registry.startup()
+    event_broker.start()
+    invalidation_bus.start()
+    try:
+        yield
+    finally:
+        invalidation_bus.stop()
+        event_broker.stop()
+        await engine_registry.dispose()
+
+
 # Create FastAPI app
 app = FastAPI(
     title=settings.PROJECT_NAME,
-    openapi_url=f"{settings.API_V1_STR}/openapi.json"
+    openapi_url=f"{settings.API_V1_STR}/openapi.json",
+    lifespan=lifespan
 )
 
 # Set up CORS middleware
@@ -21,8 +48,13 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],  # Allows all methods
     allow_headers=["*"],  # Allows all headers
+    # Pagination and conditional request headers
+    expose_headers=[NEXT_CURSOR_HEADER, "Link", "ETag"],
 )
 
+# Keep clients on the primary database right after they write
+app.middleware("http")(read_your_writes_middleware)
+
 # Include API router
 app.include_router(api_router, prefix=settings.API_V1_STR)
 
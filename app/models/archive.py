@@ -0,0 +1,51 @@
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import Index
+from sqlmodel import Field, SQLModel
+
+
+class ArchivedReservation(SQLModel, table=True):
+    """
+    Past reservation moved out of the reservations table by the archiver.
+
+    Keeps the reservation's ID, so a reservation is either live or archived
+    and pages over both can share one cursor. There is no foreign key to
+    tables: archived rows outlive the tables they were made for.
+    """
+    __tablename__ = "reservations_archive"
+    __table_args__ = (
+        # Date-range pages in keyset order, overall and for one table
+        Index("ix_reservations_archive_reservation_time_id", "reservation_time", "id"),
+        Index(
+            "ix_reservations_archive_table_id_reservation_time_id",
+            "table_id", "reservation_time", "id"
+        ),
+    )
+
+    id: int = Field(primary_key=True, sa_column_kwargs={"autoincrement": False})
+    table_id: int
+    customer_name: str
+    reservation_time: datetime
+    duration_minutes: int
+    end_time: datetime
+    created_at: datetime
+    updated_at: datetime
+    archived_at: datetime = Field(default_factory=datetime.utcnow)
+
+
+class ArchiveCheckpoint(SQLModel, table=True):
+    """
+    Progress of the archiver for one destination.
+
+    When a chunk has been written to a file but not yet removed from the
+    live table, ``pending`` holds its IDs as JSON so an interrupted run
+    finishes the chunk instead of writing it again.
+    """
+    __tablename__ = "archive_checkpoints"
+
+    destination: str = Field(primary_key=True, max_length=255)
+    pending: Optional[str] = None
+    # Chunks written so far; numbers the archive files
+    parts: int = 0
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
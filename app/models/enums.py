@@ -5,4 +5,9 @@ class ReservationStatus(str, Enum):
     """Enum for reservation status."""
     PENDING = "pending"
     CONFIRMED = "confirmed"
-    CANCELLED = "cancelled" 
\ No newline at end of file
+    CANCELLED = "cancelled" 
+
+class ChangeEntity(str, Enum):
+    """Kind of row recorded by a tombstone."""
+    TABLE = "table"
+    RESERVATION = "reservation"
@@ -0,0 +1,27 @@
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import Column, LargeBinary
+from sqlmodel import Field, SQLModel
+
+
+class IdempotencyKey(SQLModel, table=True):
+    """
+    Outcome of a write request sent with an Idempotency-Key header.
+
+    A row without a status code is a claim: the first request with the key
+    is still running. Completed rows hold the response replayed to retries
+    until they expire.
+    """
+    __tablename__ = "idempotency_keys"
+
+    key: str = Field(primary_key=True, max_length=255)
+    # SHA-256 of the method, path and body the key was first used with
+    fingerprint: str = Field(max_length=64)
+    status_code: Optional[int] = None
+    # Replayed response headers (content type, ETag) as JSON
+    headers: Optional[str] = None
+    body: Optional[bytes] = Field(default=None, sa_column=Column(LargeBinary))
+    # A claim older than this was abandoned by a crashed worker
+    locked_until: datetime
+    expires_at: datetime = Field(index=True)
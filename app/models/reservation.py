@@ -1,28 +1,90 @@
-from datetime import datetime
-from typing import TYPE_CHECKING, Optional
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any, Optional
 
+from sqlalchemy import DDL, Index, event, func, literal_column
+from sqlalchemy.dialects.postgresql import ExcludeConstraint
+from sqlalchemy.orm import declared_attr
 from sqlmodel import Field, SQLModel, Relationship
 
 if TYPE_CHECKING:
     from app.models.table import Table
 
 
+def compute_end_time(context: Any) -> datetime:
+    """
+    Column default for ``end_time``: start of the reservation plus its duration.
+    """
+    params = context.get_current_parameters()
+    return params["reservation_time"] + timedelta(
+        minutes=params["duration_minutes"]
+    )
+
+
 class Reservation(SQLModel, table=True):
     """
     Reservation model representing a table booking.
     """
     __tablename__ = "reservations"
+    __table_args__ = (
+        # Conflict checks only need reservations that end after the requested
+        # start, so past history is skipped by the index range scan; with
+        # reservation_time in the key the check never reads the table rows.
+        Index(
+            "ix_reservations_table_id_end_time_reservation_time",
+            "table_id", "end_time", "reservation_time"
+        ),
+        # One table's reservations in a time range, in keyset page order
+        Index(
+            "ix_reservations_table_id_reservation_time_id",
+            "table_id", "reservation_time", "id"
+        ),
+        # The change feed pages through reservations in (updated_at, id) order
+        Index("ix_reservations_updated_at_id", "updated_at", "id"),
+        # PostgreSQL rejects overlapping reservations for the same table,
+        # even when two bookings race past the application-level check.
+        ExcludeConstraint(
+            (literal_column("table_id"), "="),
+            (
+                func.tsrange(
+                    literal_column("reservation_time"),
+                    literal_column("end_time")
+                ),
+                "&&"
+            ),
+            name="reservations_no_overlap",
+            using="gist"
+        ).ddl_if(dialect="postgresql"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     table_id: int = Field(foreign_key="tables.id")
     customer_name: str
-    reservation_time: datetime
+    reservation_time: datetime = Field(index=True)
     duration_minutes: int = Field(default=60)
+    end_time: Optional[datetime] = Field(
+        default=None,
+        sa_column_kwargs={"default": compute_end_time, "nullable": False}
+    )
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
 
+    @declared_attr
+    def __mapper_args__(cls) -> dict:
+        # updated_at doubles as the row version: every ORM update sets it
+        # and only succeeds if the row still has the value that was loaded,
+        # so concurrent changes raise StaleDataError instead of being lost.
+        return {
+            "version_id_col": cls.__table__.c.updated_at,
+            "version_id_generator": lambda version: datetime.utcnow(),
+        }
+
     # Relationships
-    table: "Table" = Relationship(back_populates="reservations")
+    # Loaded eagerly with the reservation: async sessions cannot lazy-load
+    # on attribute access while the response is being serialized.
+    table: "Table" = Relationship(
+        back_populates="reservations",
+        sa_relationship_kwargs={"lazy": "selectin"}
+    )
 
     class Config:
         json_schema_extra = {
@@ -32,7 +94,19 @@ class Reservation(SQLModel, table=True):
                 "customer_name": "John Doe",
                 "reservation_time": "2024-04-11T19:00:00",
                 "duration_minutes": 60,
+                "end_time": "2024-04-11T20:00:00",
                 "created_at": "2024-04-11T12:00:00",
                 "updated_at": "2024-04-11T12:00:00"
             }
         }
+
+
+# btree_gist provides the "=" operator class for integers inside the
+# exclusion constraint above.
+event.listen(
+    SQLModel.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS btree_gist").execute_if(
+        dialect="postgresql"
+    )
+)
@@ -1,6 +1,7 @@
 from datetime import datetime
 from typing import TYPE_CHECKING, Optional, List
 
+from sqlalchemy import Index
 from sqlmodel import Field, SQLModel, Relationship
 
 if TYPE_CHECKING:
@@ -12,11 +13,20 @@ class Table(SQLModel, table=True):
     Table model representing a restaurant table.
     """
     __tablename__ = "tables"
+    __table_args__ = (
+        # The change feed pages through tables in (updated_at, id) order
+        Index("ix_tables_updated_at_id", "updated_at", "id"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     name: str = Field(unique=True, index=True)
     seats: int
-    location: Optional[str] = Field(default="Main Hall")
+    location: Optional[str] = Field(default="Main Hall", index=True)
+    # Bumped by every reservation write for this table; versions the
+    # table's reservation list for ETags
+    reservations_version: int = Field(
+        default=0, sa_column_kwargs={"server_default": "0"}
+    )
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
 
@@ -0,0 +1,22 @@
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import Index
+from sqlmodel import Field, SQLModel
+
+
+class Tombstone(SQLModel, table=True):
+    """
+    Record of a deleted table or reservation, read by the change feed.
+    """
+    __tablename__ = "tombstones"
+    __table_args__ = (
+        # The change feed pages through tombstones in (deleted_at, id) order
+        Index("ix_tombstones_deleted_at_id", "deleted_at", "id"),
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    # A ChangeEntity value
+    entity: str = Field(max_length=20)
+    entity_id: int
+    deleted_at: datetime = Field(default_factory=datetime.utcnow)
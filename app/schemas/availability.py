@@ -0,0 +1,25 @@
+from datetime import date, datetime
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+
+class TableSlots(BaseModel):
+    """
+    Schema for the open slots of one table.
+    """
+    id: int
+    name: str
+    seats: int
+    location: Optional[str] = None
+    free_slots: List[datetime]
+
+
+class SlotGridResponse(BaseModel):
+    """
+    Schema for the slot-grid availability of one day.
+    """
+    day: date
+    slot_minutes: int
+    slots: List[datetime]
+    tables: List[TableSlots]
@@ -0,0 +1,30 @@
+from datetime import datetime
+from typing import List
+
+from pydantic import BaseModel
+
+from app.models.enums import ChangeEntity
+from app.schemas.reservation import ReservationResponse
+from app.schemas.table import TableResponse
+
+
+class DeletedItem(BaseModel):
+    """
+    Schema for a deleted table or reservation.
+    """
+    entity: ChangeEntity
+    id: int
+    deleted_at: datetime
+
+
+class ChangesResponse(BaseModel):
+    """
+    Schema for one page of the change feed.
+    """
+    tables: List[TableResponse]
+    reservations: List[ReservationResponse]
+    deleted: List[DeletedItem]
+    # Pass as ``since`` on the next request
+    next_cursor: str
+    # True when a limit was reached and more changes can be fetched now
+    has_more: bool
@@ -0,0 +1,23 @@
+from pydantic import BaseModel
+
+
+class PoolStats(BaseModel):
+    """
+    Schema for connection pool statistics of one engine.
+    """
+    pool_class: str
+    size: int
+    checked_out: int
+    checked_in: int
+    overflow: int
+    max_overflow: int
+    overflow_peak: int
+    checkouts: int
+    connects: int
+    invalidations: int
+    wait_total_ms: float
+    wait_max_ms: float
+    wait_avg_ms: float
+    open_connections: int
+    connection_age_max_seconds: float
+    connection_age_avg_seconds: float
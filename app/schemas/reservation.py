@@ -1,10 +1,12 @@
 from datetime import datetime, timedelta
-from typing import Optional
+from enum import Enum
+from typing import List, Optional
 
 from fastapi import HTTPException, status
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, model_validator, validator
 from sqlmodel import SQLModel
 
+from app.core.config import settings
 from app.schemas.table import TableResponse
 
 
@@ -21,7 +23,26 @@ class ReservationBase(SQLModel):
 class ReservationCreate(ReservationBase):
     """
     Schema for creating a new reservation.
+
+    Without ``table_id`` the best-fitting free table for ``party_size``
+    guests is assigned, optionally only from ``location``.
     """
+    duration_minutes: int = Field(
+        default=60, ge=1, le=settings.RESERVATION_MAX_DURATION_MINUTES
+    )
+    table_id: Optional[int] = None
+    party_size: Optional[int] = Field(default=None, ge=1)
+    location: Optional[str] = None
+
+    @model_validator(mode="after")
+    def validate_table_or_party_size(self):
+        """
+        Validate that either a table or a party size is given.
+        """
+        if self.table_id is None and self.party_size is None:
+            raise ValueError("table_id or party_size is required")
+        return self
+
     @validator("reservation_time")
     def validate_future_time(cls, v):
         """
@@ -42,7 +63,9 @@ class ReservationUpdate(SQLModel):
     """
     customer_name: Optional[str] = None
     reservation_time: Optional[datetime] = None
-    duration_minutes: Optional[int] = None
+    duration_minutes: Optional[int] = Field(
+        default=None, ge=1, le=settings.RESERVATION_MAX_DURATION_MINUTES
+    )
     table_id: Optional[int] = None
 
     @validator("reservation_time")
@@ -83,3 +106,69 @@ class ReservationResponse(ReservationBase):
 
     class Config:
         from_attributes = True
+
+
+class ExportFormat(str, Enum):
+    """
+    Output format of the reservation export.
+    """
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+class BulkMode(str, Enum):
+    """
+    How a bulk request handles items that cannot be created.
+    """
+    # Any failed item rejects the whole batch
+    ALL_OR_NOTHING = "all_or_nothing"
+    # Valid items are created, failed ones are reported
+    PARTIAL = "partial"
+
+
+class BulkItemStatus(str, Enum):
+    """
+    Outcome of one item of a bulk request.
+    """
+    CREATED = "created"
+    CONFLICT = "conflict"
+    TABLE_NOT_FOUND = "table_not_found"
+    # Valid, but not created because another item failed the batch
+    SKIPPED = "skipped"
+
+
+class ReservationBulkCreate(BaseModel):
+    """
+    Schema for creating many reservations in one request.
+    """
+    items: List[ReservationCreate] = Field(
+        ..., min_length=1, max_length=settings.BULK_MAX_ITEMS
+    )
+    mode: BulkMode = BulkMode.ALL_OR_NOTHING
+
+    @validator("items")
+    def validate_table_ids(cls, v):
+        """
+        Validate that every item names its table; bulk requests are not
+        auto-assigned.
+        """
+        if any(item.table_id is None for item in v):
+            raise ValueError("table_id is required for every bulk item")
+        return v
+
+
+class ReservationBulkItemResult(BaseModel):
+    """
+    Schema for the result of one item of a bulk request.
+    """
+    index: int
+    status: BulkItemStatus
+    reservation: Optional[ReservationResponse] = None
+
+
+class ReservationBulkResponse(BaseModel):
+    """
+    Schema for bulk reservation response.
+    """
+    created: int
+    results: List[ReservationBulkItemResult]
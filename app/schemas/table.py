@@ -1,8 +1,10 @@
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 from pydantic import BaseModel, Field
 
+from app.core.config import settings
+
 
 class TableBase(BaseModel):
     """
@@ -39,3 +41,20 @@ class TableResponse(TableBase):
 
     class Config:
         from_attributes = True
+
+
+class TableBulkUpsert(BaseModel):
+    """
+    Schema for inserting or updating many tables by name.
+    """
+    items: List[TableCreate] = Field(
+        ..., min_length=1, max_length=settings.BULK_MAX_ITEMS
+    )
+
+
+class TableBulkResponse(BaseModel):
+    """
+    Schema for bulk table upsert response.
+    """
+    inserted: int
+    updated: int
@@ -0,0 +1,245 @@
+"""
+Archiver moving past reservations out of the live reservations table.
+
+Reservations that ended more than ARCHIVE_AFTER_DAYS ago are moved, oldest
+first, into the reservations_archive table or into gzip-compressed NDJSON
+files. Every chunk of ARCHIVE_CHUNK_SIZE rows is its own short transaction
+and progress is checkpointed in archive_checkpoints, so the job can be
+stopped at any point and resumed by running it again.
+
+Usage:
+    python -m app.services.archive [--days 90] [--chunk-size 1000] [--to table|ndjson]
+"""
+import argparse
+import json
+import os
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import delete, insert, update
+from sqlmodel import Session, select
+
+from app.core.config import settings
+from app.core.export import encode_ndjson, gzip_stream
+from app.core.logging import get_logger
+from app.db.registry import PRIMARY, engine_registry
+from app.models.archive import ArchiveCheckpoint, ArchivedReservation
+from app.models.reservation import Reservation
+from app.models.table import Table
+from app.services.reservation import EXPORT_COLUMNS
+
+logger = get_logger("archive")
+
+Row = Dict[str, Any]
+
+
+class ArchiveSink(ABC):
+    """
+    Destination of archived reservations.
+
+    A transactional sink writes through the archiver's session, so a chunk
+    is stored and removed from the live table in one transaction.
+    """
+    transactional = True
+
+    @property
+    @abstractmethod
+    def destination(self) -> str:
+        """
+        Name the destination's checkpoint is stored under.
+        """
+
+    @abstractmethod
+    def write(self, session: Session, rows: List[Row], part: int) -> None:
+        """
+        Store one chunk of reservations.
+
+        Args:
+            session: Archiver session
+            rows: Reservations as EXPORT_COLUMNS dicts
+            part: Sequence number of the chunk
+        """
+
+
+class TableSink(ArchiveSink):
+    """
+    Sink inserting into the reservations_archive table, which the
+    reservation list can read back with include_archived.
+    """
+
+    @property
+    def destination(self) -> str:
+        return "table"
+
+    def write(self, session: Session, rows: List[Row], part: int) -> None:
+        session.execute(insert(ArchivedReservation), rows)
+
+
+class NDJSONSink(ArchiveSink):
+    """
+    Sink writing every chunk to its own ``part-NNNNNN.ndjson.gz`` file.
+
+    Files are written under a temporary name and renamed once complete. A
+    chunk interrupted before its checkpoint is written again under the same
+    part number, replacing the partial file.
+    """
+    transactional = False
+
+    def __init__(self, directory: str = settings.ARCHIVE_DIR):
+        self.directory = directory
+
+    @property
+    def destination(self) -> str:
+        return f"ndjson:{os.path.abspath(self.directory)}"
+
+    def write(self, session: Session, rows: List[Row], part: int) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, f"part-{part:06d}.ndjson.gz")
+        with open(path + ".tmp", "wb") as file:
+            for chunk in gzip_stream(encode_ndjson([rows])):
+                file.write(chunk)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(path + ".tmp", path)
+
+
+class ArchiveService:
+    """
+    Service moving past reservations to an archive sink.
+    """
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def archive(
+        self,
+        sink: ArchiveSink,
+        before: datetime,
+        chunk_size: int = settings.ARCHIVE_CHUNK_SIZE,
+        max_chunks: Optional[int] = None,
+        pause: float = 0.0
+    ) -> int:
+        """
+        Move reservations that ended before a time to the sink.
+
+        Args:
+            sink: Destination
+            before: Reservations ending before this time are archived
+            chunk_size: Rows moved per transaction
+            max_chunks: Stop after this many chunks; all chunks if omitted
+            pause: Seconds to wait between chunks, leaving the database to
+                other work
+
+        Returns:
+            int: Number of reservations archived
+        """
+        checkpoint = self._checkpoint(sink.destination)
+        archived = self._finish_pending(checkpoint)
+        chunks = 0
+        while max_chunks is None or chunks < max_chunks:
+            rows = self._next_chunk(before, chunk_size)
+            if not rows:
+                break
+            ids = [row["id"] for row in rows]
+
+            sink.write(self.session, rows, checkpoint.parts)
+            checkpoint.parts += 1
+            if not sink.transactional:
+                # The file is complete: record the chunk before removing it,
+                # so a crash in between removes rather than rewrites it
+                checkpoint.pending = json.dumps(ids)
+                self._save(checkpoint)
+            self._remove(ids, {row["table_id"] for row in rows})
+            checkpoint.pending = None
+            self._save(checkpoint)
+
+            archived += len(rows)
+            chunks += 1
+            logger.info("Archived %d reservations to %s", archived, sink.destination)
+            if pause:
+                time.sleep(pause)
+        return archived
+
+    def _checkpoint(self, destination: str) -> ArchiveCheckpoint:
+        checkpoint = self.session.get(ArchiveCheckpoint, destination)
+        if checkpoint is None:
+            checkpoint = ArchiveCheckpoint(destination=destination)
+            self._save(checkpoint)
+        return checkpoint
+
+    def _finish_pending(self, checkpoint: ArchiveCheckpoint) -> int:
+        if checkpoint.pending is None:
+            return 0
+        removed = self._remove(json.loads(checkpoint.pending))
+        checkpoint.pending = None
+        self._save(checkpoint)
+        return removed
+
+    def _next_chunk(self, before: datetime, limit: int) -> List[Row]:
+        # Moved rows are deleted, so the oldest remaining matches are the
+        # next chunk. No cursor is kept: a long reservation that started
+        # before an archived one but ended later would fall behind it.
+        # reservation_time < before is implied by end_time < before, and
+        # bounds the index range scan.
+        statement = select(
+            *(getattr(Reservation, name) for name in EXPORT_COLUMNS)
+        ).where(
+            Reservation.reservation_time < before,
+            Reservation.end_time < before
+        ).order_by(
+            Reservation.reservation_time, Reservation.id
+        ).limit(limit)
+        return [dict(row) for row in self.session.execute(statement).mappings()]
+
+    def _remove(self, ids: List[int], table_ids: Optional[set] = None) -> int:
+        if table_ids is None:
+            table_ids = set(self.session.exec(
+                select(Reservation.table_id).where(Reservation.id.in_(ids))
+            ).all())
+        removed = self.session.execute(
+            delete(Reservation).where(Reservation.id.in_(ids))
+        ).rowcount
+        # The tables' reservation lists changed, and so do their ETags
+        self.session.execute(
+            update(Table)
+            .where(Table.id.in_(sorted(table_ids)))
+            .values(reservations_version=Table.reservations_version + 1)
+        )
+        return removed
+
+    def _save(self, checkpoint: ArchiveCheckpoint) -> None:
+        checkpoint.updated_at = datetime.utcnow()
+        self.session.add(checkpoint)
+        self.session.commit()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Move past reservations to the archive table or to NDJSON files."
+    )
+    parser.add_argument("--days", type=int, default=settings.ARCHIVE_AFTER_DAYS)
+    parser.add_argument("--chunk-size", type=int, default=settings.ARCHIVE_CHUNK_SIZE)
+    parser.add_argument("--max-chunks", type=int, default=None)
+    parser.add_argument("--pause", type=float, default=0.0)
+    parser.add_argument("--to", choices=["table", "ndjson"], default="table")
+    parser.add_argument("--dir", default=settings.ARCHIVE_DIR)
+    args = parser.parse_args()
+
+    sink = TableSink() if args.to == "table" else NDJSONSink(args.dir)
+    before = datetime.utcnow() - timedelta(days=args.days)
+    engine_registry.startup()
+    with Session(engine_registry.get(PRIMARY), expire_on_commit=False) as session:
+        archived = ArchiveService(session).archive(
+            sink,
+            before,
+            chunk_size=args.chunk_size,
+            max_chunks=args.max_chunks,
+            pause=args.pause
+        )
+    print(f"Archived {archived} reservations to {sink.destination}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,426 @@
+import threading
+from collections import OrderedDict
+from datetime import date, datetime, time, timedelta, timezone
+from functools import reduce
+from operator import or_
+from time import monotonic
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from sqlmodel import Session, select
+
+from app.core.config import settings
+from app.core.invalidation import Message, invalidation_bus
+from app.models.reservation import Reservation
+from app.models.table import Table
+from app.services.base import AsyncServiceAdapter
+
+# Reservations per availability.add message, keeping it well below the
+# 8000 byte NOTIFY payload limit
+BROADCAST_CHUNK = 50
+
+
+def naive_utc(value: datetime) -> datetime:
+    """
+    Normalize a timestamp to naive UTC, the form stored in the database.
+    """
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+class _DayBitmap:
+    """
+    Booked slots of every table on one day.
+    """
+
+    def __init__(self) -> None:
+        self.loaded_at = monotonic()
+        # table_id -> OR of the masks of its reservations
+        self.busy: Dict[int, int] = {}
+        # table_id -> reservation_id -> mask
+        self.parts: Dict[int, Dict[int, int]] = {}
+        # reservation_id -> table_id
+        self.owners: Dict[int, int] = {}
+
+    def add(self, reservation_id: int, table_id: int, mask: int) -> None:
+        self.parts.setdefault(table_id, {})[reservation_id] = mask
+        self.owners[reservation_id] = table_id
+        self.busy[table_id] = self.busy.get(table_id, 0) | mask
+
+    def remove(self, reservation_id: int) -> None:
+        table_id = self.owners.pop(reservation_id, None)
+        if table_id is None:
+            return
+        parts = self.parts[table_id]
+        del parts[reservation_id]
+        # Slots are coarser than bookings, so two reservations can share a
+        # bit; the table's mask is rebuilt from the ones that remain.
+        if parts:
+            self.busy[table_id] = reduce(or_, parts.values())
+        else:
+            del self.parts[table_id]
+            del self.busy[table_id]
+
+    def remove_table(self, table_id: int) -> None:
+        for reservation_id in self.parts.pop(table_id, {}):
+            del self.owners[reservation_id]
+        self.busy.pop(table_id, None)
+
+
+class AvailabilityIndex:
+    """
+    In-memory bitmap of booked slots per table per day.
+
+    The day is split into slots of ``slot_minutes``; bit ``i`` of a table's
+    mask is set when any reservation covers part of slot ``i``. Masks are
+    plain Python ints, so a single bitwise operation answers a question for
+    every slot of a table at once.
+
+    Days are loaded from the database on first use and then kept current by
+    ReservationService, which reports every committed create, update and
+    delete. Each change is also sent over the invalidation bus and applied
+    by the other workers. Loaded days expire after ``ttl`` seconds, which
+    bounds staleness if a message is lost, and only the ``max_days`` most
+    recently used days are kept.
+    """
+
+    def __init__(
+        self,
+        slot_minutes: int = settings.AVAILABILITY_SLOT_MINUTES,
+        max_days: int = settings.AVAILABILITY_CACHE_DAYS,
+        ttl: float = settings.AVAILABILITY_CACHE_TTL
+    ):
+        if (24 * 60) % slot_minutes:
+            raise ValueError("slot_minutes must divide a day")
+        self.slot_minutes = slot_minutes
+        self.slots_per_day = 24 * 60 // slot_minutes
+        self.max_days = max_days
+        self.ttl = ttl
+        self._slot = timedelta(minutes=slot_minutes)
+        self._lock = threading.Lock()
+        self._days: "OrderedDict[date, _DayBitmap]" = OrderedDict()
+        # Bumped on every write; a day loaded while writes were applied is
+        # used once but not cached, since the load may have missed them.
+        self._writes = 0
+
+    def slot_masks(
+        self,
+        start: datetime,
+        end: datetime
+    ) -> Iterator[Tuple[date, int]]:
+        """
+        Split a time window into per-day masks of the slots it touches.
+
+        Args:
+            start: Start of the window
+            end: End of the window
+
+        Yields:
+            Tuple[date, int]: Day and the mask of its slots covered
+        """
+        start, end = naive_utc(start), naive_utc(end)
+        day = start.date()
+        day_start = datetime.combine(day, time.min)
+        while day_start < end:
+            first = max(start - day_start, timedelta(0)) // self._slot
+            # Round the end up: a partly booked slot is not free
+            last = -(-min(end - day_start, timedelta(days=1)) // self._slot)
+            if last > first:
+                yield day, ((1 << (last - first)) - 1) << first
+            day += timedelta(days=1)
+            day_start = datetime.combine(day, time.min)
+
+    def add(self, reservation: Reservation) -> None:
+        """
+        Record a reservation, replacing any previous version of it.
+
+        Args:
+            reservation: Committed reservation
+        """
+        self.add_many([reservation])
+
+    def add_many(self, reservations: Iterable[Reservation]) -> None:
+        """
+        Record several reservations, replacing previous versions of them.
+
+        Args:
+            reservations: Committed reservations
+        """
+        rows = [
+            (r.id, r.table_id, r.reservation_time, r.end_time)
+            for r in reservations
+        ]
+        self._add(rows)
+        for i in range(0, len(rows), BROADCAST_CHUNK):
+            invalidation_bus.publish("availability.add", reservations=[
+                [reservation_id, table_id, start.isoformat(), end.isoformat()]
+                for reservation_id, table_id, start, end
+                in rows[i:i + BROADCAST_CHUNK]
+            ])
+
+    def remove(self, reservation_id: int) -> None:
+        """
+        Forget a deleted reservation.
+
+        Args:
+            reservation_id: Reservation ID
+        """
+        with self._lock:
+            self._writes += 1
+            self._remove(reservation_id)
+        invalidation_bus.publish("availability.remove", id=reservation_id)
+
+    def remove_table(self, table_id: int) -> None:
+        """
+        Forget every reservation of a deleted table.
+
+        Args:
+            table_id: Table ID
+        """
+        self._remove_table(table_id)
+        invalidation_bus.publish("availability.remove_table", table_id=table_id)
+
+    def clear(self) -> None:
+        """
+        Drop all loaded days.
+        """
+        with self._lock:
+            self._writes += 1
+            self._days.clear()
+
+    def busy_masks(
+        self,
+        session: Session,
+        days: List[date]
+    ) -> Dict[date, Dict[int, int]]:
+        """
+        Get the booked-slot masks of every table on the given days.
+
+        Days that are not loaded, or whose copy has expired, are read from
+        the database in one query.
+
+        Args:
+            session: Database session used to load missing days
+            days: Days to return
+
+        Returns:
+            Dict[date, Dict[int, int]]: Per day, the mask of each table that
+            has reservations; tables without any are absent
+        """
+        result: Dict[date, Dict[int, int]] = {}
+        with self._lock:
+            now = monotonic()
+            missing = []
+            for day in days:
+                bitmap = self._days.get(day)
+                if bitmap is None or now - bitmap.loaded_at > self.ttl:
+                    missing.append(day)
+                else:
+                    self._days.move_to_end(day)
+                    result[day] = dict(bitmap.busy)
+            writes = self._writes
+        if not missing:
+            return result
+
+        loaded = self._load(session, missing)
+        with self._lock:
+            cache = writes == self._writes
+            for day, bitmap in loaded.items():
+                result[day] = dict(bitmap.busy)
+                if cache:
+                    self._days[day] = bitmap
+                    self._days.move_to_end(day)
+            while len(self._days) > self.max_days:
+                self._days.popitem(last=False)
+        return result
+
+    def _load(self, session: Session, days: List[date]) -> Dict[date, _DayBitmap]:
+        bitmaps = {day: _DayBitmap() for day in days}
+        window_start = datetime.combine(min(days), time.min)
+        window_end = datetime.combine(max(days), time.min) + timedelta(days=1)
+        statement = select(
+            Reservation.id,
+            Reservation.table_id,
+            Reservation.reservation_time,
+            Reservation.end_time
+        ).where(
+            Reservation.end_time > window_start,
+            Reservation.reservation_time < window_end
+        )
+        for reservation_id, table_id, start, end in session.exec(statement):
+            for day, mask in self.slot_masks(start, end):
+                bitmap = bitmaps.get(day)
+                if bitmap is not None:
+                    bitmap.add(reservation_id, table_id, mask)
+        return bitmaps
+
+    def _add(self, rows: List[Tuple[int, int, datetime, datetime]]) -> None:
+        masks = [
+            (reservation_id, table_id, list(self.slot_masks(start, end)))
+            for reservation_id, table_id, start, end in rows
+        ]
+        with self._lock:
+            self._writes += 1
+            for reservation_id, table_id, day_masks in masks:
+                self._remove(reservation_id)
+                for day, mask in day_masks:
+                    bitmap = self._days.get(day)
+                    if bitmap is not None:
+                        bitmap.add(reservation_id, table_id, mask)
+
+    def _remove(self, reservation_id: int) -> None:
+        for bitmap in self._days.values():
+            bitmap.remove(reservation_id)
+
+    def _remove_table(self, table_id: int) -> None:
+        with self._lock:
+            self._writes += 1
+            for bitmap in self._days.values():
+                bitmap.remove_table(table_id)
+
+    def apply(self, message: Message) -> None:
+        """
+        Apply a change published by another worker.
+
+        Args:
+            message: availability.* message from the invalidation bus
+        """
+        if message["type"] == "availability.add":
+            self._add([
+                (
+                    reservation_id,
+                    table_id,
+                    datetime.fromisoformat(start),
+                    datetime.fromisoformat(end)
+                )
+                for reservation_id, table_id, start, end
+                in message["reservations"]
+            ])
+        elif message["type"] == "availability.remove":
+            with self._lock:
+                self._writes += 1
+                self._remove(message["id"])
+        elif message["type"] == "availability.remove_table":
+            self._remove_table(message["table_id"])
+
+
+availability_index = AvailabilityIndex()
+for message_type in (
+    "availability.add", "availability.remove", "availability.remove_table"
+):
+    invalidation_bus.subscribe(message_type, availability_index.apply)
+invalidation_bus.subscribe_reset(availability_index.clear)
+
+
+class AvailabilityService:
+    """
+    Service answering slot-grid availability queries.
+    """
+
+    def __init__(self, session: Session, index: Optional[AvailabilityIndex] = None):
+        self.session = session
+        self.index = index or availability_index
+
+    def get_slot_grid(
+        self,
+        day: date,
+        seats: int = 1,
+        location: Optional[str] = None,
+        start: Optional[time] = None,
+        end: Optional[time] = None,
+        duration_minutes: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Get every open slot of one day for all matching tables.
+
+        A slot is open for a table when a booking of ``duration_minutes``
+        starting at that slot would not touch any of the table's
+        reservations. The answer comes from the availability index: one
+        query for the tables and, on a cold day, one for its reservations.
+
+        Args:
+            day: Day to show
+            seats: Required number of seats
+            location: Only tables in this location
+            start: Earliest slot start time, start of the day if omitted
+            end: Latest slot start time (exclusive), end of the day if omitted
+            duration_minutes: Length of the booking, one slot if omitted
+
+        Returns:
+            Dict[str, Any]: The day, slot length, open slot start times
+            across all tables and the open slots of each table
+
+        Raises:
+            ValueError: If end is not after start
+        """
+        index = self.index
+        slot = timedelta(minutes=index.slot_minutes)
+        day_start = datetime.combine(day, time.min)
+        first = (
+            datetime.combine(day, start) - day_start if start else timedelta(0)
+        ) // slot
+        last = -(-(
+            datetime.combine(day, end) - day_start if end else timedelta(days=1)
+        ) // slot)
+        if last <= first:
+            raise ValueError("end must be after start")
+        window = ((1 << (last - first)) - 1) << first
+
+        # A booking that runs past midnight needs the next day's slots too
+        length = -(-(duration_minutes or index.slot_minutes) // index.slot_minutes)
+        days = [day] if length == 1 else [day, day + timedelta(days=1)]
+        busy = index.busy_masks(self.session, days)
+        width = index.slots_per_day * len(days)
+        full = (1 << width) - 1
+
+        statement = select(Table).where(Table.seats >= seats)
+        if location is not None:
+            statement = statement.where(Table.location == location)
+        tables = self.session.exec(statement.order_by(Table.seats, Table.id)).all()
+
+        rows = []
+        union = 0
+        for table in tables:
+            booked = 0
+            for offset, current in enumerate(days):
+                booked |= busy[current].get(table.id, 0) << (
+                    offset * index.slots_per_day
+                )
+            free = ~booked & full
+            # Slot i can start a booking when slots i .. i + length - 1 are
+            # all free: AND the free mask with itself shifted down.
+            open_slots = free
+            for shift in range(1, length):
+                open_slots &= free >> shift
+            open_slots &= window
+            union |= open_slots
+            rows.append({
+                "id": table.id,
+                "name": table.name,
+                "seats": table.seats,
+                "location": table.location,
+                "free_slots": self._slot_times(open_slots, day_start, slot),
+            })
+
+        return {
+            "day": day,
+            "slot_minutes": index.slot_minutes,
+            "slots": self._slot_times(union, day_start, slot),
+            "tables": rows,
+        }
+
+    @staticmethod
+    def _slot_times(mask: int, day_start: datetime, slot: timedelta) -> List[datetime]:
+        times = []
+        while mask:
+            lowest = mask & -mask
+            times.append(day_start + slot * (lowest.bit_length() - 1))
+            mask ^= lowest
+        return times
+
+
+class AsyncAvailabilityService(AsyncServiceAdapter):
+    """
+    Async facade over AvailabilityService.
+    """
+    service_cls = AvailabilityService
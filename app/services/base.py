@@ -0,0 +1,40 @@
+from typing import Any, Awaitable, Callable, Type, Union
+
+from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+from starlette.concurrency import run_in_threadpool
+
+
+class AsyncServiceAdapter:
+    """
+    Awaitable facade over a synchronous service.
+
+    Every method of ``service_cls`` is exposed as a coroutine. With an
+    AsyncSession the call runs through ``AsyncSession.run_sync`` on the async
+    driver, so the event loop is never blocked; with a regular Session it is
+    offloaded to the threadpool. Business logic lives in the sync service
+    only and both engines share it.
+    """
+    service_cls: Type[Any]
+
+    def __init__(self, session: Union[Session, AsyncSession]):
+        self.session = session
+
+    def __getattr__(self, name: str) -> Callable[..., Awaitable[Any]]:
+        if name.startswith("_") or not callable(
+            getattr(self.service_cls, name, None)
+        ):
+            raise AttributeError(name)
+
+        async def call(*args: Any, **kwargs: Any) -> Any:
+            if isinstance(self.session, AsyncSession):
+                return await self.session.run_sync(
+                    lambda session: getattr(
+                        self.service_cls(session), name
+                    )(*args, **kwargs)
+                )
+            return await run_in_threadpool(
+                getattr(self.service_cls(self.session), name), *args, **kwargs
+            )
+
+        return call
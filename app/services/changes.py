@@ -0,0 +1,140 @@
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import Select, tuple_
+from sqlmodel import Session, select
+
+from app.core.config import settings
+from app.core.pagination import decode_cursor, encode_cursor
+from app.models.reservation import Reservation
+from app.models.table import Table
+from app.models.tombstone import Tombstone
+from app.services.base import AsyncServiceAdapter
+from app.services.reservation import ReservationService
+
+# Position of the last row read from one stream: (timestamp, id)
+Position = Optional[Tuple[datetime, int]]
+
+
+class ChangeService:
+    """
+    Service for the change feed used by incremental sync.
+    """
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def get_changes(self, since: Optional[str], limit: int) -> Dict[str, Any]:
+        """
+        Get tables and reservations written, and rows deleted, since a cursor.
+
+        Tables and reservations are read in (updated_at, id) order and
+        tombstones in (deleted_at, id) order; each stream is a keyset range
+        scan over its index and advances on its own. Changes newer than
+        CHANGES_SETTLE_SECONDS are left for a later call: timestamps are
+        taken before commit, so a row stamped earlier can become visible
+        after a later one and would otherwise fall behind the cursor.
+        Reservation writes are stamped once their table lock is held, so
+        the window only has to cover the write and commit, not a wait for
+        the lock.
+
+        Rows are returned in their current state. A row that is deleted and
+        recreated with the same ID appears in both lists, so consumers
+        should apply deletions before upserts.
+
+        Args:
+            since: Cursor from the previous call; everything if omitted
+            limit: Maximum number of rows per stream
+
+        Returns:
+            Dict[str, Any]: Changed tables, reservations and deleted rows,
+            the cursor to pass next time and whether a limit was reached
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        tables_after, reservations_after, deleted_after = (
+            self._decode_cursor(since) if since else (None, None, None)
+        )
+        upto = datetime.utcnow() - timedelta(
+            seconds=settings.CHANGES_SETTLE_SECONDS
+        )
+
+        tables, tables_after, more_tables = self._page(
+            select(Table), Table.updated_at, Table.id,
+            tables_after, upto, limit
+        )
+        reservations, reservations_after, more_reservations = self._page(
+            ReservationService._select_with_table(),
+            Reservation.updated_at, Reservation.id,
+            reservations_after, upto, limit
+        )
+        tombstones, deleted_after, more_deleted = self._page(
+            select(Tombstone), Tombstone.deleted_at, Tombstone.id,
+            deleted_after, upto, limit
+        )
+
+        return {
+            "tables": tables,
+            "reservations": reservations,
+            "deleted": [
+                {
+                    "entity": tombstone.entity,
+                    "id": tombstone.entity_id,
+                    "deleted_at": tombstone.deleted_at,
+                }
+                for tombstone in tombstones
+            ],
+            "next_cursor": encode_cursor([
+                value
+                for position in (tables_after, reservations_after, deleted_after)
+                for value in (position or (None, None))
+            ]),
+            "has_more": more_tables or more_reservations or more_deleted,
+        }
+
+    def _page(
+        self,
+        statement: Select,
+        stamp: Any,
+        key: Any,
+        after: Position,
+        upto: datetime,
+        limit: int
+    ) -> Tuple[List[Any], Position, bool]:
+        statement = statement.where(stamp < upto)
+        if after is not None:
+            statement = statement.where(tuple_(stamp, key) > tuple_(*after))
+        rows = list(self.session.exec(
+            statement.order_by(stamp, key).limit(limit + 1)
+        ).all())
+
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        if rows:
+            last = rows[-1]
+            after = (getattr(last, stamp.key), getattr(last, key.key))
+        return rows, after, has_more
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> Tuple[Position, Position, Position]:
+        values = decode_cursor(cursor)
+        if len(values) != 6:
+            raise ValueError("Invalid cursor")
+        positions: List[Position] = []
+        try:
+            for stamp, key in zip(values[::2], values[1::2]):
+                positions.append(
+                    None if stamp is None
+                    else (datetime.fromisoformat(stamp), int(key))
+                )
+        except (TypeError, ValueError) as exc:
+            raise ValueError("Invalid cursor") from exc
+        return positions[0], positions[1], positions[2]
+
+
+class AsyncChangeService(AsyncServiceAdapter):
+    """
+    Async facade over ChangeService.
+    """
+    service_cls = ChangeService
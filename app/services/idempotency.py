@@ -0,0 +1,153 @@
+import json
+from datetime import datetime, timedelta
+from enum import Enum
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import delete, or_, update
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session, select
+
+from app.core.config import settings
+from app.models.idempotency import IdempotencyKey
+
+# Expired keys removed by each new claim, keeping the table compact
+PURGE_BATCH = 100
+
+
+class ClaimStatus(str, Enum):
+    """
+    Result of claiming an idempotency key.
+    """
+    # The caller owns the key and must complete or release it
+    CLAIMED = "claimed"
+    # A previous request completed; replay its response
+    COMPLETED = "completed"
+    # A previous request with this key is still running
+    IN_PROGRESS = "in_progress"
+    # The key was first used for a different request
+    MISMATCH = "mismatch"
+
+
+class IdempotencyService:
+    """
+    Service storing the responses of requests sent with an Idempotency-Key.
+    """
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def claim(
+        self,
+        key: str,
+        fingerprint: str
+    ) -> Tuple[ClaimStatus, Optional[IdempotencyKey]]:
+        """
+        Claim a key for a request, or find what an earlier request left.
+
+        The claim is a committed insert, so concurrent requests with the same
+        key are decided by the primary key: exactly one of them wins. Keys
+        that have expired, and claims whose request died before completing,
+        are taken over with a conditional update.
+
+        Args:
+            key: Idempotency-Key header
+            fingerprint: Hash identifying the request
+
+        Returns:
+            Tuple[ClaimStatus, Optional[IdempotencyKey]]: Outcome, and the
+            stored response when it is COMPLETED
+        """
+        now = datetime.utcnow()
+        values = {
+            "fingerprint": fingerprint,
+            "status_code": None,
+            "headers": None,
+            "body": None,
+            "locked_until": now + timedelta(seconds=settings.IDEMPOTENCY_LOCK_SECONDS),
+            "expires_at": now + timedelta(seconds=settings.IDEMPOTENCY_TTL_SECONDS),
+        }
+
+        # Expired keys are deleted in small batches by new claims
+        expired = select(IdempotencyKey.key).where(
+            IdempotencyKey.expires_at <= now
+        ).limit(PURGE_BATCH)
+        self.session.execute(
+            delete(IdempotencyKey).where(IdempotencyKey.key.in_(expired))
+        )
+        self.session.add(IdempotencyKey(key=key, **values))
+        try:
+            self.session.commit()
+        except IntegrityError:
+            self.session.rollback()
+        else:
+            return ClaimStatus.CLAIMED, None
+
+        taken = self.session.execute(
+            update(IdempotencyKey)
+            .where(
+                IdempotencyKey.key == key,
+                or_(
+                    IdempotencyKey.expires_at <= now,
+                    IdempotencyKey.status_code.is_(None)
+                    & (IdempotencyKey.locked_until <= now)
+                )
+            )
+            .values(**values)
+        ).rowcount
+        self.session.commit()
+        if taken:
+            return ClaimStatus.CLAIMED, None
+
+        record = self.session.exec(
+            select(IdempotencyKey).where(IdempotencyKey.key == key)
+        ).first()
+        if record is None:
+            # Purged between the insert and the update; try again
+            return self.claim(key, fingerprint)
+        if record.fingerprint != fingerprint:
+            return ClaimStatus.MISMATCH, None
+        if record.status_code is None:
+            return ClaimStatus.IN_PROGRESS, None
+        return ClaimStatus.COMPLETED, record
+
+    def complete(
+        self,
+        key: str,
+        status_code: int,
+        headers: Dict[str, str],
+        body: bytes
+    ) -> None:
+        """
+        Store the response of a claimed request.
+
+        Args:
+            key: Claimed key
+            status_code: Response status
+            headers: Response headers to replay
+            body: Response body
+        """
+        self.session.execute(
+            update(IdempotencyKey)
+            .where(IdempotencyKey.key == key)
+            .values(
+                status_code=status_code,
+                headers=json.dumps(headers),
+                body=body
+            )
+        )
+        self.session.commit()
+
+    def release(self, key: str) -> None:
+        """
+        Drop a claim without storing a response, so a retry runs again.
+
+        Args:
+            key: Claimed key
+        """
+        self.session.execute(
+            delete(IdempotencyKey).where(
+                IdempotencyKey.key == key,
+                IdempotencyKey.status_code.is_(None)
+            )
+        )
+        self.session.commit()
\ No newline at end of file
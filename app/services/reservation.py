@@ -1,12 +1,91 @@
-from datetime import datetime, timedelta, UTC
-from typing import List, Optional
+import heapq
+from bisect import bisect_left
+from contextlib import ExitStack
+from datetime import datetime, timedelta
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Type, Union
 
 from fastapi import HTTPException, status
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import contains_eager, joinedload, lazyload
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy import (
+    Delete,
+    Exists,
+    Insert,
+    Select,
+    Update,
+    delete,
+    exists,
+    insert,
+    literal,
+    tuple_,
+    update
+)
 from sqlmodel import Session, select, func, Integer
 
+from app.core.config import settings
+from app.core.etag import PreconditionFailed, etag_in, version_etag
+from app.core.events import Event, event_broker
+from app.core.logging import get_logger
+from app.core.pagination import decode_cursor, encode_cursor
+from app.db.locks import table_lock
+from app.db.partitions import NoPartition, is_missing_partition
+from app.models.archive import ArchivedReservation
 from app.models.reservation import Reservation
+from app.models.enums import ChangeEntity
 from app.models.table import Table
-from app.schemas.reservation import ReservationCreate, ReservationUpdate
+from app.models.tombstone import Tombstone
+from app.schemas.reservation import (
+    BulkItemStatus,
+    ReservationCreate,
+    ReservationUpdate
+)
+from app.services.availability import availability_index, naive_utc
+from app.services.base import AsyncServiceAdapter
+from app.services.seating import SeatingService
+
+logger = get_logger("reservations")
+
+# Columns written by the reservation export
+EXPORT_COLUMNS = [
+    "id",
+    "table_id",
+    "customer_name",
+    "reservation_time",
+    "duration_minutes",
+    "end_time",
+    "created_at",
+    "updated_at",
+]
+
+# ReservationCreate fields that only steer table assignment
+ASSIGNMENT_FIELDS = {"party_size", "location"}
+
+
+# Live or archived reservation model
+ReservationModel = Union[Type[Reservation], Type[ArchivedReservation]]
+
+
+def response_columns(model: ReservationModel = Reservation) -> List[Any]:
+    """
+    Columns of ReservationResponse and its embedded TableResponse, in the
+    order the fast list path unpacks them.
+    """
+    return [
+        model.customer_name,
+        model.reservation_time,
+        model.duration_minutes,
+        model.table_id,
+        model.id,
+        model.created_at,
+        model.updated_at,
+        Table.name,
+        Table.seats,
+        Table.location,
+        Table.created_at,
+        Table.updated_at,
+    ]
 
 
 class ReservationService:
@@ -24,9 +103,262 @@ class ReservationService:
         Returns:
             List[Reservation]: List of all reservations
         """
-        statement = select(Reservation)
+        statement = self._select_with_table()
         return self.session.exec(statement).all()
 
+    def get_page(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        table_id: Optional[int] = None,
+        location: Optional[str] = None
+    ) -> Tuple[List[Reservation], Optional[str]]:
+        """
+        Get one page of reservations ordered by (reservation_time, id).
+
+        Uses keyset pagination: the cursor holds the sort key of the last
+        row returned, so every page is a single index range scan no matter
+        how deep it is.
+
+        The list endpoint reads pages with ``get_page_rows``; this ORM
+        variant is kept for callers that need Reservation objects and as
+        the baseline of the pagination and serialization benchmarks.
+
+        Args:
+            limit: Maximum number of reservations to return
+            cursor: Cursor returned with the previous page
+            start: Only reservations starting at or after this time
+            end: Only reservations starting before this time
+            table_id: Only reservations for this table
+            location: Only reservations for tables in this location
+
+        Returns:
+            Tuple[List[Reservation], Optional[str]]: Reservations and the
+            cursor of the next page, None on the last page
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        statement = self._filter(
+            self._select_with_table(), start, end, table_id, location,
+            table_joined=True
+        )
+        reservations = list(self.session.exec(
+            self._keyset(statement, cursor, limit)
+        ).all())
+
+        if len(reservations) <= limit:
+            return reservations, None
+        reservations = reservations[:limit]
+        last = reservations[-1]
+        return reservations, encode_cursor([last.reservation_time, last.id])
+
+    def get_page_rows(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        table_id: Optional[int] = None,
+        location: Optional[str] = None,
+        include_archived: bool = False
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Get one page of reservations as plain dicts shaped like
+        ReservationResponse.
+
+        Same page as ``get_page``, but only the response columns are
+        selected and rows are never turned into ORM objects, so the result
+        can be encoded straight to JSON without per-row model validation.
+
+        With include_archived the page also covers reservations moved to
+        the archive table. Live and archived rows keep their IDs, so both
+        are read with the same keyset and merged in (reservation_time, id)
+        order. Archived reservations of deleted tables are left out.
+
+        Args:
+            limit: Maximum number of reservations to return
+            cursor: Cursor returned with the previous page
+            start: Only reservations starting at or after this time
+            end: Only reservations starting before this time
+            table_id: Only reservations for this table
+            location: Only reservations for tables in this location
+            include_archived: Also return archived reservations
+
+        Returns:
+            Tuple[List[Dict[str, Any]], Optional[str]]: Reservations and
+            the cursor of the next page, None on the last page
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        models = (
+            [Reservation, ArchivedReservation] if include_archived
+            else [Reservation]
+        )
+        results = []
+        for model in models:
+            statement = self._filter(
+                select(*response_columns(model)).join(
+                    Table, Table.id == model.table_id
+                ),
+                start, end, table_id, location,
+                table_joined=True,
+                model=model
+            )
+            results.append(self.session.execute(
+                self._keyset(statement, cursor, limit, model=model)
+            ).all())
+        if len(results) == 1:
+            rows = results[0]
+        else:
+            # Each result is sorted and has at most limit + 1 rows, so the
+            # first limit + 1 merged rows are the page and its lookahead
+            rows = list(islice(
+                heapq.merge(*results, key=lambda row: (row[1], row[4])),
+                limit + 1
+            ))
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            # reservation_time and id are the second and fifth columns
+            next_cursor = encode_cursor([rows[-1][1], rows[-1][4]])
+        return [
+            {
+                "customer_name": customer_name,
+                "reservation_time": reservation_time,
+                "duration_minutes": duration_minutes,
+                "table_id": table_id,
+                "id": reservation_id,
+                "created_at": created_at,
+                "updated_at": updated_at,
+                "table": {
+                    "name": table_name,
+                    "seats": seats,
+                    "location": table_location,
+                    "id": table_id,
+                    "created_at": table_created_at,
+                    "updated_at": table_updated_at,
+                },
+            }
+            for (
+                customer_name, reservation_time, duration_minutes, table_id,
+                reservation_id, created_at, updated_at, table_name, seats,
+                table_location, table_created_at, table_updated_at
+            ) in rows
+        ], next_cursor
+
+    def _keyset(
+        self,
+        statement: Select,
+        cursor: Optional[str],
+        limit: int,
+        model: ReservationModel = Reservation
+    ) -> Select:
+        """
+        Restrict a reservation query to the page after the cursor, plus one
+        row to tell whether another page follows.
+        """
+        if cursor is not None:
+            after_time, after_id = self._decode_cursor(cursor)
+            statement = statement.where(
+                tuple_(model.reservation_time, model.id)
+                > tuple_(after_time, after_id)
+            )
+        return statement.order_by(
+            model.reservation_time, model.id
+        ).limit(limit + 1)
+
+    def iter_export_batches(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        table_id: Optional[int] = None,
+        location: Optional[str] = None,
+        batch_size: int = 1000
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Stream reservations as plain rows, ordered by (reservation_time, id).
+
+        Only the exported columns are selected and rows are fetched through
+        a server-side cursor in batches of ``batch_size``, so memory use does
+        not depend on how many reservations match.
+
+        Args:
+            start: Only reservations starting at or after this time
+            end: Only reservations starting before this time
+            table_id: Only reservations for this table
+            location: Only reservations for tables in this location
+            batch_size: Number of rows fetched per round trip
+
+        Yields:
+            List[Dict[str, Any]]: Batches of reservation rows
+        """
+        columns = [getattr(Reservation, name) for name in EXPORT_COLUMNS]
+        statement = self._filter(
+            select(*columns), start, end, table_id, location
+        ).order_by(Reservation.reservation_time, Reservation.id)
+
+        result = self.session.execute(
+            statement, execution_options={"yield_per": batch_size}
+        )
+        try:
+            for batch in result.mappings().partitions():
+                yield [dict(row) for row in batch]
+        finally:
+            result.close()
+
+    @staticmethod
+    def _select_with_table() -> Select:
+        """
+        Select reservations together with their table in one joined query.
+
+        ReservationResponse embeds the table, so loading it separately would
+        cost an extra query per row (or per page with selectin loading).
+        """
+        return select(Reservation).join(Reservation.table).options(
+            contains_eager(Reservation.table)
+        )
+
+    @staticmethod
+    def _filter(
+        statement: Select,
+        start: Optional[datetime],
+        end: Optional[datetime],
+        table_id: Optional[int],
+        location: Optional[str],
+        table_joined: bool = False,
+        model: ReservationModel = Reservation
+    ) -> Select:
+        # Bounds with a UTC offset are compared as the stored naive UTC
+        if start is not None:
+            statement = statement.where(
+                model.reservation_time >= naive_utc(start)
+            )
+        if end is not None:
+            statement = statement.where(model.reservation_time < naive_utc(end))
+        if table_id is not None:
+            statement = statement.where(model.table_id == table_id)
+        if location is not None:
+            if not table_joined:
+                statement = statement.join(
+                    Table, Table.id == model.table_id
+                )
+            statement = statement.where(Table.location == location)
+        return statement
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> Tuple[datetime, int]:
+        values = decode_cursor(cursor)
+        try:
+            after_time, after_id = values
+            return datetime.fromisoformat(after_time), int(after_id)
+        except (TypeError, ValueError) as exc:
+            raise ValueError("Invalid cursor") from exc
+
     def get_by_id(self, reservation_id: int) -> Optional[Reservation]:
         """
         Get reservation by ID.
@@ -37,7 +369,11 @@ class ReservationService:
         Returns:
             Optional[Reservation]: Reservation if found, None otherwise
         """
-        return self.session.get(Reservation, reservation_id)
+        return self.session.get(
+            Reservation,
+            reservation_id,
+            options=[joinedload(Reservation.table)]
+        )
 
     def get_by_table_id(self, table_id: int) -> List[Reservation]:
         """
@@ -49,9 +385,74 @@ class ReservationService:
         Returns:
             List[Reservation]: List of reservations for the table
         """
-        statement = select(Reservation).where(Reservation.table_id == table_id)
+        statement = self._select_with_table().where(
+            Reservation.table_id == table_id
+        )
         return self.session.exec(statement).all()
 
+    @staticmethod
+    def etag(reservation: Reservation) -> str:
+        """
+        Get the ETag of a reservation, covering its embedded table.
+
+        Args:
+            reservation: Reservation with its table loaded
+
+        Returns:
+            str: Quoted entity tag
+        """
+        return version_etag(
+            reservation.id, reservation.updated_at, reservation.table.updated_at
+        )
+
+    def get_etag(self, reservation_id: int) -> Optional[str]:
+        """
+        Get the ETag of a reservation without loading it.
+
+        Args:
+            reservation_id: Reservation ID
+
+        Returns:
+            Optional[str]: ETag if the reservation exists, None otherwise
+        """
+        row = self.session.exec(
+            select(Reservation.updated_at, Table.updated_at)
+            .join(Table, Table.id == Reservation.table_id)
+            .where(Reservation.id == reservation_id)
+        ).first()
+        return version_etag(reservation_id, *row) if row else None
+
+    @staticmethod
+    def table_etag(table: Table) -> str:
+        """
+        Get the ETag of a table's reservation list.
+
+        Args:
+            table: Table
+
+        Returns:
+            str: Quoted entity tag
+        """
+        return version_etag(
+            "table", table.id, table.reservations_version, table.updated_at
+        )
+
+    def get_table_etag(self, table_id: int) -> Optional[str]:
+        """
+        Get the ETag of a table's reservation list without loading it.
+
+        Args:
+            table_id: Table ID
+
+        Returns:
+            Optional[str]: ETag if the table exists, None otherwise
+        """
+        row = self.session.exec(
+            select(Table.reservations_version, Table.updated_at)
+            .where(Table.id == table_id)
+        ).first()
+        return version_etag("table", table_id, *row) if row else None
+
     def check_time_conflict(
         self,
         table_id: int,
@@ -71,75 +472,300 @@ class ReservationService:
         Returns:
             bool: True if there is a conflict, False otherwise
         """
-        # Ensure reservation_time is timezone-aware
-        if reservation_time.tzinfo is None:
-            reservation_time = reservation_time.replace(tzinfo=UTC)
-            
         end_time = reservation_time + timedelta(minutes=duration_minutes)
-        
-        # Get all reservations for the table
-        reservations = self.session.exec(
-            select(Reservation).where(
-                Reservation.table_id == table_id,
-                Reservation.id != exclude_id if exclude_id else True
+        return self.session.scalar(
+            select(self.overlapping(table_id, reservation_time, end_time, exclude_id))
+        )
+
+    @staticmethod
+    def overlapping(
+        table_id: int,
+        start: datetime,
+        end: datetime,
+        exclude_id: Optional[int] = None
+    ) -> Exists:
+        """
+        Build the condition that a table has a reservation overlapping a
+        time window.
+
+        Args:
+            table_id: Table ID, or a column to correlate with
+            start: Start of the window
+            end: End of the window
+            exclude_id: Reservation to ignore (for updates)
+
+        Returns:
+            Exists: EXISTS over the overlapping reservations
+        """
+        # Two windows overlap when each starts before the other ends. The
+        # stored end_time lets the database answer this with one range scan
+        # over the table's current and future reservations. No reservation
+        # is longer than the maximum duration, so the redundant lower bound
+        # on reservation_time narrows the scan further and lets PostgreSQL
+        # prune all older partitions.
+        overlapping = select(Reservation.id).where(
+            Reservation.table_id == table_id,
+            Reservation.end_time > start,
+            Reservation.reservation_time < end,
+            Reservation.reservation_time > start - timedelta(
+                minutes=settings.RESERVATION_MAX_DURATION_MINUTES
             )
-        ).all()
-        
-        # Check for conflicts
-        for reservation in reservations:
-            # Ensure reservation time is timezone-aware
-            res_time = reservation.reservation_time
-            if res_time.tzinfo is None:
-                res_time = res_time.replace(tzinfo=UTC)
-                
-            res_end_time = res_time + timedelta(minutes=reservation.duration_minutes)
-            
-            # Check if there is an overlap
-            if (
-                (res_time <= reservation_time and reservation_time < res_end_time) or
-                (res_time < end_time and end_time <= res_end_time)
-            ):
-                return True
-                
-        return False
+        )
+        if exclude_id is not None:
+            overlapping = overlapping.where(Reservation.id != exclude_id)
+        return overlapping.exists()
 
     def create(self, reservation_data: ReservationCreate) -> Optional[Reservation]:
         """
         Create a new reservation.
+
+        The table and conflict checks are part of the write: a single
+        ``INSERT ... SELECT ... RETURNING`` only inserts while the table
+        exists and the slot is free, and returns the stored row.
+
+        Without a table_id, the tables ranked by SeatingService are tried
+        in turn, up to SEATING_MAX_ATTEMPTS; a table taken since the
+        availability index saw it free just moves on to the next one.
         
         Args:
             reservation_data: Reservation data
             
         Returns:
-            Optional[Reservation]: Created reservation if successful, None if conflict
-            
+            Optional[Reservation]: Created reservation if successful, None if
+            the table is not found or the slot is taken
+
         Raises:
-            HTTPException: If table is not found
+            NoPartition: If the reservation's month has no partition
         """
-        # Check if table exists
-        table = self.session.get(Table, reservation_data.table_id)
-        if not table:
-            return None
+        row = reservation_data.model_dump(exclude=ASSIGNMENT_FIELDS)
+        # Stored as naive UTC, like the bulk path and the availability index
+        row["reservation_time"] = naive_utc(row["reservation_time"])
+        row["end_time"] = row["reservation_time"] + timedelta(
+            minutes=row["duration_minutes"]
+        )
+        if reservation_data.table_id is not None:
+            table_ids = [reservation_data.table_id]
+        else:
+            table_ids = SeatingService(self.session).rank_tables(
+                reservation_data.party_size,
+                row["reservation_time"],
+                row["duration_minutes"],
+                location=reservation_data.location
+            )[:settings.SEATING_MAX_ATTEMPTS]
 
-        # Check for time conflicts
-        if self.check_time_conflict(
-            reservation_data.table_id,
-            reservation_data.reservation_time,
-            reservation_data.duration_minutes
-        ):
-            return None
+        for table_id in table_ids:
+            row["table_id"] = table_id
+            reservation = self._insert(row)
+            if reservation is not None:
+                availability_index.add(reservation)
+                self._publish(self.event("reservation.created", reservation))
+                return reservation
+        return None
 
-        # Create reservation
-        reservation = Reservation(**reservation_data.model_dump())
-        self.session.add(reservation)
-        self.session.commit()
-        self.session.refresh(reservation)
+    def _insert(self, row: Dict[str, Any]) -> Optional[Reservation]:
+        """
+        Insert one reservation row if its table exists and is free.
+        """
+        table_id = row["table_id"]
+        columns = Reservation.__table__.c
+
+        # The check and the insert run under a per-table lock so concurrent
+        # bookings for the same table cannot both see the slot free.
+        with table_lock(self.session, table_id):
+            # Stamped once the lock is held: a row stamped before a long
+            # lock wait could commit behind the change feed's cursor
+            now = datetime.utcnow()
+            row = {**row, "created_at": now, "updated_at": now}
+            statement = insert(Reservation).from_select(
+                list(row),
+                select(*(
+                    literal(value, columns[name].type)
+                    for name, value in row.items()
+                )).where(
+                    exists().where(Table.id == table_id),
+                    ~self.overlapping(
+                        table_id, row["reservation_time"], row["end_time"]
+                    )
+                )
+            )
+            reservation = self._write(statement)
+            if reservation is None:
+                return None
+            if self._commit([table_id], reservation) is None:
+                return None
         return reservation
 
+    def create_bulk(
+        self,
+        items: List[ReservationCreate],
+        all_or_nothing: bool = True
+    ) -> List[Tuple[BulkItemStatus, Optional[Reservation]]]:
+        """
+        Create many reservations in one transaction.
+
+        Tables are fetched in one query and locked in ID order, so
+        concurrent bulk requests cannot deadlock. The reservations that
+        could clash with the batch are read in one query, then every table
+        is checked in a single pass over its bookings sorted by start time,
+        which catches conflicts with the database and within the batch
+        alike. Accepted items are written with one multi-row INSERT.
+
+        Args:
+            items: Reservations to create
+            all_or_nothing: Create nothing if any item fails; otherwise
+                create the valid items and report the rest
+
+        Returns:
+            List[Tuple[BulkItemStatus, Optional[Reservation]]]: Outcome of
+            each item, in request order, with the created reservation
+        """
+        windows = [
+            (
+                naive_utc(item.reservation_time),
+                naive_utc(item.reservation_time)
+                + timedelta(minutes=item.duration_minutes)
+            )
+            for item in items
+        ]
+        table_ids = sorted({item.table_id for item in items})
+        existing_tables = set(self.session.exec(
+            select(Table.id).where(Table.id.in_(table_ids))
+        ).all())
+
+        statuses: List[BulkItemStatus] = [
+            BulkItemStatus.CREATED if item.table_id in existing_tables
+            else BulkItemStatus.TABLE_NOT_FOUND
+            for item in items
+        ]
+
+        with ExitStack() as locks:
+            for table_id in sorted(existing_tables):
+                locks.enter_context(table_lock(self.session, table_id))
+
+            self._sweep_conflicts(items, windows, statuses)
+
+            accepted = [
+                i for i, item_status in enumerate(statuses)
+                if item_status == BulkItemStatus.CREATED
+            ]
+            failed = len(accepted) < len(items)
+            if not accepted or (failed and all_or_nothing):
+                return [
+                    (BulkItemStatus.SKIPPED, None)
+                    if item_status == BulkItemStatus.CREATED
+                    else (item_status, None)
+                    for item_status in statuses
+                ]
+
+            # Stamped once the locks are held, as in _insert
+            now = datetime.utcnow()
+            rows = [
+                {
+                    **items[i].model_dump(exclude=ASSIGNMENT_FIELDS),
+                    "reservation_time": windows[i][0],
+                    "end_time": windows[i][1],
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                for i in accepted
+            ]
+            try:
+                ids = self.session.scalars(
+                    insert(Reservation).returning(
+                        Reservation.id, sort_by_parameter_order=True
+                    ),
+                    rows
+                ).all()
+            except IntegrityError:
+                # Like _write: the exclusion constraint, or a month without
+                # a partition, rejected a row the sweep let through
+                self.session.rollback()
+                ids = None
+            if ids is None or self._commit(
+                {items[i].table_id for i in accepted}
+            ) is None:
+                return [
+                    (BulkItemStatus.CONFLICT, None)
+                    if item_status == BulkItemStatus.CREATED
+                    else (item_status, None)
+                    for item_status in statuses
+                ]
+
+        created = {
+            reservation.id: reservation
+            for reservation in self.session.exec(
+                self._select_with_table().where(Reservation.id.in_(ids))
+            ).all()
+        }
+        results: List[Tuple[BulkItemStatus, Optional[Reservation]]] = [
+            (item_status, None) for item_status in statuses
+        ]
+        availability_index.add_many(created.values())
+        for i, reservation_id in zip(accepted, ids):
+            reservation = created[reservation_id]
+            self._publish(self.event("reservation.created", reservation))
+            results[i] = (BulkItemStatus.CREATED, reservation)
+        return results
+
+    def _sweep_conflicts(
+        self,
+        items: List[ReservationCreate],
+        windows: List[Tuple[datetime, datetime]],
+        statuses: List[BulkItemStatus]
+    ) -> None:
+        """
+        Mark batch items that overlap a stored reservation or each other.
+
+        Items are visited per table in start order; an item conflicts when
+        an earlier accepted item is still running at its start, or when a
+        stored reservation overlaps it. Stored reservations never overlap
+        each other, so a bisect over their sorted starts finds the only two
+        candidates.
+        """
+        by_table: Dict[int, List[int]] = {}
+        for i, item in enumerate(items):
+            if statuses[i] == BulkItemStatus.CREATED:
+                by_table.setdefault(item.table_id, []).append(i)
+        if not by_table:
+            return
+
+        earliest = min(windows[i][0] for ids in by_table.values() for i in ids)
+        latest = max(windows[i][1] for ids in by_table.values() for i in ids)
+        booked: Dict[int, List[Tuple[datetime, datetime]]] = {}
+        for table_id, start, end in self.session.exec(
+            select(
+                Reservation.table_id,
+                Reservation.reservation_time,
+                Reservation.end_time
+            ).where(
+                Reservation.table_id.in_(list(by_table)),
+                Reservation.end_time > earliest,
+                Reservation.reservation_time < latest
+            ).order_by(Reservation.table_id, Reservation.reservation_time)
+        ):
+            booked.setdefault(table_id, []).append((start, end))
+
+        for table_id, indexes in by_table.items():
+            stored = booked.get(table_id, [])
+            starts = [start for start, _ in stored]
+            running_until = datetime.min
+            for i in sorted(indexes, key=lambda i: windows[i]):
+                start, end = windows[i]
+                k = bisect_left(starts, start)
+                if (
+                    running_until > start
+                    or (k > 0 and stored[k - 1][1] > start)
+                    or (k < len(stored) and starts[k] < end)
+                ):
+                    statuses[i] = BulkItemStatus.CONFLICT
+                else:
+                    running_until = max(running_until, end)
+
     def update(
         self,
         reservation_id: int,
-        reservation_data: ReservationUpdate
+        reservation_data: ReservationUpdate,
+        if_match: Optional[str] = None
     ) -> Optional[Reservation]:
         """
         Update an existing reservation.
@@ -147,54 +773,250 @@ class ReservationService:
         Args:
             reservation_id: Reservation ID
             reservation_data: Updated reservation data
+            if_match: If-Match header; the update only applies while the
+                reservation still has one of the listed ETags
             
         Returns:
-            Optional[Reservation]: Updated reservation if successful, None if not found or conflict
+            Optional[Reservation]: Updated reservation if successful, None
+            if not found or conflict
+
+        Raises:
+            PreconditionFailed: If the reservation was modified concurrently
+                or no longer matches if_match
+            NoPartition: If the new time falls in a month with no partition
         """
         reservation = self.get_by_id(reservation_id)
         if not reservation:
             return None
+        self._check_if_match(reservation, if_match)
 
         # Get update data
         update_data = reservation_data.model_dump(exclude_unset=True)
-        
-        # If updating time-related fields, check for conflicts
-        if any(key in update_data for key in ['table_id', 'reservation_time', 'duration_minutes']):
-            table_id = update_data.get('table_id', reservation.table_id)
-            reservation_time = update_data.get('reservation_time', reservation.reservation_time)
-            duration_minutes = update_data.get('duration_minutes', reservation.duration_minutes)
-            
-            if self.check_time_conflict(
-                table_id,
-                reservation_time,
-                duration_minutes,
-                exclude_id=reservation_id
-            ):
-                return None
+        if update_data.get("reservation_time") is not None:
+            # Stored as naive UTC, like every other write path
+            update_data["reservation_time"] = naive_utc(
+                update_data["reservation_time"]
+            )
+        previous_table_id = reservation.table_id
+        previous_location = reservation.table.location
+        table_id = update_data.get('table_id', reservation.table_id)
+        reservation_time = update_data.get(
+            'reservation_time', reservation.reservation_time
+        )
+        duration_minutes = update_data.get(
+            'duration_minutes', reservation.duration_minutes
+        )
+        end_time = reservation_time + timedelta(minutes=duration_minutes)
+
+        # updated_at is the row version: the update only applies to the row
+        # as it was loaded, and advances the version.
+        statement = update(Reservation).where(
+            Reservation.id == reservation_id,
+            Reservation.updated_at == reservation.updated_at
+        ).values(**update_data, end_time=end_time)
+        # If updating time-related fields, the update also requires the
+        # table to exist and the new slot to be free
+        reschedules = any(
+            key in update_data
+            for key in ['table_id', 'reservation_time', 'duration_minutes']
+        )
+        if reschedules:
+            statement = statement.where(
+                exists().where(Table.id == table_id),
+                ~self.overlapping(
+                    table_id, reservation_time, end_time, exclude_id=reservation_id
+                )
+            )
 
-        # Apply updates
-        for key, value in update_data.items():
-            setattr(reservation, key, value)
+        with table_lock(self.session, table_id):
+            # Stamped once the lock is held, as in _insert
+            statement = statement.values(updated_at=datetime.utcnow())
+            if self._write(statement) is None:
+                # Only the failure path pays for telling the causes apart
+                if reschedules and (
+                    self.session.get(Table, table_id) is None
+                    or self.check_time_conflict(
+                        table_id,
+                        reservation_time,
+                        duration_minutes,
+                        exclude_id=reservation_id
+                    )
+                ):
+                    return None
+                raise PreconditionFailed(
+                    f"Reservation with ID {reservation_id} has been modified"
+                )
+            if self._commit({previous_table_id, table_id}, reservation) is None:
+                return None
 
-        self.session.add(reservation)
-        self.session.commit()
-        self.session.refresh(reservation)
+        availability_index.add(reservation)
+        event = self.event("reservation.updated", reservation)
+        event["previous_table_id"] = previous_table_id
+        event["previous_location"] = previous_location
+        self._publish(event)
         return reservation
 
-    def delete(self, reservation_id: int) -> bool:
+    def delete(self, reservation_id: int, if_match: Optional[str] = None) -> bool:
         """
         Delete a reservation.
         
         Args:
             reservation_id: Reservation ID
+            if_match: If-Match header; the reservation is only deleted
+                while it still has one of the listed ETags
             
         Returns:
             bool: True if reservation was deleted, False otherwise
+
+        Raises:
+            PreconditionFailed: If the reservation was modified concurrently
+                or no longer matches if_match
         """
-        reservation = self.get_by_id(reservation_id)
-        if not reservation:
+        statement = delete(Reservation).where(Reservation.id == reservation_id)
+        if if_match is not None:
+            # The ETag can only be checked against the loaded row; the delete
+            # then requires the row to be unchanged since
+            loaded = self.get_by_id(reservation_id)
+            if not loaded:
+                return False
+            self._check_if_match(loaded, if_match)
+            statement = statement.where(
+                Reservation.updated_at == loaded.updated_at
+            )
+
+        reservation = self._write(statement)
+        if reservation is None:
+            if if_match is not None:
+                raise PreconditionFailed(
+                    f"Reservation with ID {reservation_id} has been modified"
+                )
+            return False
+        self.session.add(Tombstone(
+            entity=ChangeEntity.RESERVATION.value, entity_id=reservation_id
+        ))
+        if self._commit([reservation.table_id], reservation) is None:
             return False
+        availability_index.remove(reservation_id)
+        self._publish(self.event("reservation.deleted", reservation))
+        return True
+
+    @staticmethod
+    def event(event_type: str, reservation: Reservation) -> Event:
+        """
+        Build the change event published for a reservation.
+
+        Args:
+            event_type: reservation.created, reservation.updated or
+                reservation.deleted
+            reservation: Reservation with its table loaded
+
+        Returns:
+            Event: JSON-serializable event
+        """
+        return {
+            "type": event_type,
+            "reservation_id": reservation.id,
+            "table_id": reservation.table_id,
+            "location": reservation.table.location,
+            "reservation_time": reservation.reservation_time.isoformat(),
+            "end_time": reservation.end_time.isoformat(),
+        }
+
+    @staticmethod
+    def _publish(event: Event) -> None:
+        # The write is already committed; a lost event must not fail it
+        try:
+            event_broker.publish(event)
+        except Exception:
+            logger.exception("Failed to publish %s", event["type"])
+
+    def _check_if_match(
+        self,
+        reservation: Reservation,
+        if_match: Optional[str]
+    ) -> None:
+        if if_match is None:
+            return
+        if not etag_in(if_match, self.etag(reservation), weak=False):
+            raise PreconditionFailed(
+                f"Reservation with ID {reservation.id} has been modified"
+            )
+
+    def _write(self, statement: Union[Insert, Update, Delete]) -> Optional[Reservation]:
+        """
+        Execute a reservation INSERT, UPDATE or DELETE returning the row.
 
-        self.session.delete(reservation)
-        self.session.commit()
-        return True 
\ No newline at end of file
+        On PostgreSQL the no-overlap exclusion constraint is the final guard
+        against double bookings; a violation is rolled back and reported
+        like a statement that matched no row.
+
+        Args:
+            statement: Statement writing at most one reservation
+
+        Returns:
+            Optional[Reservation]: Reservation as written, None if no row
+            was written
+
+        Raises:
+            NoPartition: If the reservation's month has no partition
+        """
+        # The table is attached by _commit from the version update, which
+        # returns it anyway
+        statement = statement.returning(Reservation).options(
+            lazyload(Reservation.table)
+        )
+        try:
+            return self.session.scalars(statement).first()
+        except IntegrityError as exc:
+            self.session.rollback()
+            if is_missing_partition(exc):
+                raise NoPartition(
+                    "Reservations are not open for this month yet"
+                ) from exc
+            return None
+
+    def _commit(
+        self,
+        table_ids: Iterable[int],
+        *reservations: Reservation
+    ) -> Optional[Dict[int, Table]]:
+        """
+        Commit the current transaction.
+
+        The reservation list version of every table touched by the write is
+        advanced in the same transaction, with ``UPDATE ... RETURNING``
+        handing back the tables without another query. A violation of the
+        exclusion constraint is rolled back and reported as a conflict.
+
+        Args:
+            table_ids: Tables whose reservations were written
+            reservations: Written reservations to attach their table to
+
+        Returns:
+            Optional[Dict[int, Table]]: Touched tables by ID if the
+            transaction was committed, None on conflict
+        """
+        try:
+            tables = {
+                table.id: table
+                for table in self.session.scalars(
+                    update(Table)
+                    .where(Table.id.in_(sorted(set(table_ids))))
+                    .values(reservations_version=Table.reservations_version + 1)
+                    .returning(Table)
+                )
+            }
+            self.session.commit()
+        except IntegrityError:
+            self.session.rollback()
+            return None
+        for reservation in reservations:
+            set_committed_value(reservation, "table", tables[reservation.table_id])
+        return tables
+
+
+class AsyncReservationService(AsyncServiceAdapter):
+    """
+    Async facade over ReservationService.
+    """
+    service_cls = ReservationService
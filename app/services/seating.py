@@ -0,0 +1,195 @@
+import threading
+from bisect import bisect_left
+from datetime import datetime, timedelta
+from time import monotonic
+from typing import Dict, List, Optional, Tuple
+
+from sqlmodel import Session, select
+
+from app.core.config import settings
+from app.core.invalidation import invalidation_bus
+from app.models.table import Table
+from app.services.availability import AvailabilityIndex, availability_index
+
+# Seat counts in ascending order and the IDs of the tables with each
+Buckets = Tuple[List[int], List[List[int]]]
+
+
+class SeatingIndex:
+    """
+    Tables grouped by seat count, overall and per location.
+
+    Finding the tables that fit a party is a bisect over the sorted seat
+    counts instead of a query. The index is loaded on first use and
+    reloaded after ``ttl`` seconds or when TableService reports a change;
+    a stale entry only costs a failed insert, since the booking itself is
+    checked against the database.
+    """
+
+    def __init__(self, ttl: float = settings.SEATING_INDEX_TTL):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._loaded_at: Optional[float] = None
+        # location -> buckets; None holds every table
+        self._buckets: Dict[Optional[str], Buckets] = {}
+        # Bumped on every invalidation; a load that raced one is not kept
+        self._version = 0
+
+    def buckets(
+        self,
+        session: Session,
+        party_size: int,
+        location: Optional[str] = None
+    ) -> List[List[int]]:
+        """
+        Get the tables that seat a party, grouped by seat count.
+
+        Args:
+            session: Database session used to load the index
+            party_size: Number of guests
+            location: Only tables in this location
+
+        Returns:
+            List[List[int]]: Table IDs per seat count, smallest fitting
+            seat count first
+        """
+        with self._lock:
+            fresh = (
+                self._loaded_at is not None
+                and monotonic() - self._loaded_at <= self.ttl
+            )
+            all_buckets = self._buckets
+            version = self._version
+        if not fresh:
+            all_buckets = self._load(session)
+            with self._lock:
+                if version == self._version:
+                    self._buckets = all_buckets
+                    self._loaded_at = monotonic()
+
+        seat_counts, tables = all_buckets.get(location, ([], []))
+        return tables[bisect_left(seat_counts, party_size):]
+
+    def invalidate(self) -> None:
+        """
+        Reload the index on next use, in this worker and the others.
+        """
+        self.clear()
+        invalidation_bus.publish("seating.invalidate")
+
+    def clear(self) -> None:
+        """
+        Drop the loaded index.
+        """
+        with self._lock:
+            self._version += 1
+            self._loaded_at = None
+            self._buckets = {}
+
+    @staticmethod
+    def _load(session: Session) -> Dict[Optional[str], Buckets]:
+        grouped: Dict[Optional[str], Dict[int, List[int]]] = {}
+        for table_id, seats, location in session.exec(
+            select(Table.id, Table.seats, Table.location).order_by(Table.id)
+        ):
+            grouped.setdefault(None, {}).setdefault(seats, []).append(table_id)
+            if location is not None:
+                grouped.setdefault(location, {}).setdefault(seats, []).append(
+                    table_id
+                )
+        return {
+            location: (sorted(by_seats), [by_seats[s] for s in sorted(by_seats)])
+            for location, by_seats in grouped.items()
+        }
+
+
+seating_index = SeatingIndex()
+invalidation_bus.subscribe(
+    "seating.invalidate", lambda message: seating_index.clear()
+)
+invalidation_bus.subscribe_reset(seating_index.clear)
+
+
+class SeatingService:
+    """
+    Service choosing a table for a party that did not ask for one.
+    """
+
+    def __init__(
+        self,
+        session: Session,
+        index: Optional[SeatingIndex] = None,
+        availability: Optional[AvailabilityIndex] = None
+    ):
+        self.session = session
+        self.index = index or seating_index
+        self.availability = availability or availability_index
+
+    def rank_tables(
+        self,
+        party_size: int,
+        start: datetime,
+        duration_minutes: int,
+        location: Optional[str] = None,
+        limit: int = settings.SEATING_MAX_ATTEMPTS
+    ) -> List[int]:
+        """
+        Rank the tables free for a booking, best first.
+
+        Tables with the fewest wasted seats come first. Among tables of the
+        same size, the one whose free time the booking fragments least
+        wins: a free gap of under SEATING_MIN_GAP_MINUTES left next to the
+        booking is hard to sell, so its slots count against the table;
+        after that, the tightest free gap is preferred, keeping long
+        stretches open for long bookings. Free time comes from the
+        availability index, so no reservations are queried.
+
+        Args:
+            party_size: Number of guests
+            start: Start of the booking
+            duration_minutes: Length of the booking
+            location: Only tables in this location
+            limit: Stop after the seat count that yields this many tables
+
+        Returns:
+            List[int]: IDs of free tables, best fit first
+        """
+        index = self.availability
+        day_masks = list(index.slot_masks(
+            start, start + timedelta(minutes=duration_minutes)
+        ))
+        days = [day for day, _ in day_masks]
+        busy = index.busy_masks(self.session, days)
+        width = index.slots_per_day * len(days)
+        window = 0
+        for offset, (_, mask) in enumerate(day_masks):
+            window |= mask << (offset * index.slots_per_day)
+        first = (window & -window).bit_length() - 1
+        last = window.bit_length()
+        min_gap = -(-settings.SEATING_MIN_GAP_MINUTES // index.slot_minutes)
+
+        ranked: List[int] = []
+        for table_ids in self.index.buckets(self.session, party_size, location):
+            scored = []
+            for table_id in table_ids:
+                booked = 0
+                for offset, day in enumerate(days):
+                    booked |= busy[day].get(table_id, 0) << (
+                        offset * index.slots_per_day
+                    )
+                if booked & window:
+                    continue
+                # Free slots between the booking and the reservations
+                # either side of it, or the edge of the loaded days
+                before = first - (booked & ((1 << first) - 1)).bit_length()
+                after_booked = booked >> last
+                after = (
+                    (after_booked & -after_booked).bit_length() - 1
+                    if after_booked else width - last
+                )
+                fragments = sum(gap for gap in (before, after) if gap < min_gap)
+                scored.append((fragments, before + after, table_id))
+            ranked.extend(table_id for _, _, table_id in sorted(scored))
+            if len(ranked) >= limit:
+                break
+        return ranked
@@ -1,9 +1,28 @@
-from typing import List, Optional
+import json
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
 
+from sqlalchemy import bindparam, insert, update
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlmodel import Session, select
 
+from app.core.cache import CachedResponse, ResponseCache, table_cache
+from app.core.pagination import decode_cursor, encode_cursor
+from app.models.enums import ChangeEntity
 from app.models.table import Table
-from app.schemas.table import TableCreate, TableUpdate
+from app.models.tombstone import Tombstone
+from app.schemas.table import TableCreate, TableResponse, TableUpdate
+from app.services.availability import availability_index, naive_utc
+from app.services.base import AsyncServiceAdapter
+from app.services.reservation import ReservationService
+from app.services.seating import seating_index
+
+# INSERT constructs that support ON CONFLICT DO UPDATE, by dialect
+UPSERT_INSERTS = {
+    "postgresql": postgresql_insert,
+    "sqlite": sqlite_insert,
+}
 
 
 class TableService:
@@ -11,8 +30,9 @@ class TableService:
     Service for managing restaurant tables.
     """
 
-    def __init__(self, session: Session):
+    def __init__(self, session: Session, cache: Optional[ResponseCache] = None):
         self.session = session
+        self.cache = cache or table_cache
 
     def get_all(self) -> List[Table]:
         """
@@ -24,6 +44,190 @@ class TableService:
         statement = select(Table)
         return self.session.exec(statement).all()
 
+    def get_page(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        location: Optional[str] = None
+    ) -> Tuple[List[Table], Optional[str]]:
+        """
+        Get one page of tables ordered by ID.
+
+        Args:
+            limit: Maximum number of tables to return
+            cursor: Cursor returned with the previous page
+            location: Only tables in this location
+
+        Returns:
+            Tuple[List[Table], Optional[str]]: Tables and the cursor of the
+            next page, None on the last page
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        statement = select(Table)
+        if location is not None:
+            statement = statement.where(Table.location == location)
+        if cursor is not None:
+            try:
+                (after_id,) = decode_cursor(cursor)
+                after_id = int(after_id)
+            except (TypeError, ValueError) as exc:
+                raise ValueError("Invalid cursor") from exc
+            statement = statement.where(Table.id > after_id)
+
+        statement = statement.order_by(Table.id).limit(limit + 1)
+        tables = list(self.session.exec(statement).all())
+
+        if len(tables) <= limit:
+            return tables, None
+        tables = tables[:limit]
+        return tables, encode_cursor([tables[-1].id])
+
+    def get_page_cached(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        location: Optional[str] = None
+    ) -> CachedResponse:
+        """
+        Get one page of tables as a serialized response, from the cache.
+
+        The database is only read on a cache miss. Every table write
+        invalidates the cache.
+
+        Args:
+            limit: Maximum number of tables to return
+            cursor: Cursor returned with the previous page
+            location: Only tables in this location
+
+        Returns:
+            CachedResponse: JSON body, ETag and next page cursor
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        def build() -> CachedResponse:
+            tables, next_cursor = self.get_page(
+                limit, cursor=cursor, location=location
+            )
+            return CachedResponse.from_content(
+                [self._to_json(table) for table in tables], next_cursor
+            )
+
+        key = "page:" + json.dumps([limit, cursor, location])
+        return self.cache.get_or_set(key, build)
+
+    def get_by_id_cached(self, table_id: int) -> Optional[CachedResponse]:
+        """
+        Get a table as a serialized response, from the cache.
+
+        Args:
+            table_id: Table ID
+
+        Returns:
+            Optional[CachedResponse]: JSON body and ETag if found, None
+            otherwise
+        """
+        def build() -> Optional[CachedResponse]:
+            table = self.get_by_id(table_id)
+            if not table:
+                return None
+            return CachedResponse.from_content(self._to_json(table))
+
+        return self.cache.get_or_set(f"table:{table_id}", build)
+
+    @staticmethod
+    def _to_json(table: Table) -> dict:
+        return TableResponse.model_validate(table).model_dump(mode="json")
+
+    def upsert_bulk(self, tables_data: List[TableCreate]) -> Tuple[int, int]:
+        """
+        Insert or update many tables by name in one statement.
+
+        Runs a single multi-row ``INSERT ... ON CONFLICT (name) DO UPDATE``.
+        Existing tables keep their ID and creation time; seats and location
+        are overwritten. When a name appears more than once the last row
+        wins. Databases without ON CONFLICT look the names up first and
+        then insert and update in two statements.
+
+        Args:
+            tables_data: Tables to insert or update
+
+        Returns:
+            Tuple[int, int]: Number of tables inserted and updated
+        """
+        rows = {
+            table_data.name: table_data.model_dump() for table_data in tables_data
+        }
+        now = datetime.utcnow()
+        dialect = self.session.get_bind().dialect.name
+        if dialect not in UPSERT_INSERTS:
+            return self._upsert_by_lookup(rows, now)
+
+        statement = UPSERT_INSERTS[dialect](Table).values([
+            {**row, "created_at": now, "updated_at": now}
+            for row in rows.values()
+        ])
+        statement = statement.on_conflict_do_update(
+            index_elements=[Table.name],
+            set_={
+                "seats": statement.excluded.seats,
+                "location": statement.excluded.location,
+                "updated_at": statement.excluded.updated_at,
+            }
+        ).returning(Table.created_at)
+
+        # Updated rows keep their original created_at, so only inserted
+        # rows come back with this statement's timestamp.
+        created = self.session.execute(statement).scalars().all()
+        self.session.commit()
+        self.cache.invalidate()
+        seating_index.invalidate()
+        inserted = sum(1 for created_at in created if created_at == now)
+        return inserted, len(created) - inserted
+
+    def _upsert_by_lookup(
+        self,
+        rows: Dict[str, Dict[str, Any]],
+        now: datetime
+    ) -> Tuple[int, int]:
+        """
+        Upsert tables by name without ON CONFLICT: select the names that
+        exist, then insert the rest and update those in one batch each.
+        """
+        existing = set(self.session.exec(
+            select(Table.name).where(Table.name.in_(list(rows)))
+        ).all())
+        new_rows = [
+            {**row, "created_at": now, "updated_at": now}
+            for name, row in rows.items() if name not in existing
+        ]
+        if new_rows:
+            self.session.execute(insert(Table), new_rows)
+        if existing:
+            self.session.execute(
+                update(Table.__table__)
+                .where(Table.__table__.c.name == bindparam("match_name"))
+                .values(
+                    seats=bindparam("seats"),
+                    location=bindparam("location"),
+                    updated_at=now
+                ),
+                [
+                    {
+                        "match_name": name,
+                        "seats": rows[name]["seats"],
+                        "location": rows[name]["location"],
+                    }
+                    for name in sorted(existing)
+                ]
+            )
+        self.session.commit()
+        self.cache.invalidate()
+        seating_index.invalidate()
+        return len(new_rows), len(existing)
+
     def get_by_id(self, table_id: int) -> Optional[Table]:
         """
         Get table by ID.
@@ -39,6 +243,9 @@ class TableService:
     def create(self, table_data: TableCreate) -> Table:
         """
         Create a new table.
+
+        Written with ``INSERT ... RETURNING``, which hands back the stored
+        row, server defaults included, without a refresh.
         
         Args:
             table_data: Table data
@@ -46,10 +253,15 @@ class TableService:
         Returns:
             Table: Created table
         """
-        table = Table(**table_data.model_dump())
-        self.session.add(table)
+        now = datetime.utcnow()
+        table = self.session.scalars(
+            insert(Table)
+            .values(**table_data.model_dump(), created_at=now, updated_at=now)
+            .returning(Table)
+        ).one()
         self.session.commit()
-        self.session.refresh(table)
+        self.cache.invalidate()
+        seating_index.invalidate()
         return table
 
     def update(self, table_id: int, table_data: TableUpdate) -> Optional[Table]:
@@ -63,17 +275,21 @@ class TableService:
         Returns:
             Optional[Table]: Updated table if found, None otherwise
         """
-        table = self.get_by_id(table_id)
+        table = self.session.scalars(
+            update(Table)
+            .where(Table.id == table_id)
+            .values(
+                **table_data.model_dump(exclude_unset=True),
+                updated_at=datetime.utcnow()
+            )
+            .returning(Table)
+        ).first()
         if not table:
             return None
 
-        update_data = table_data.model_dump(exclude_unset=True)
-        for key, value in update_data.items():
-            setattr(table, key, value)
-
-        self.session.add(table)
         self.session.commit()
-        self.session.refresh(table)
+        self.cache.invalidate()
+        seating_index.invalidate()
         return table
 
     def delete(self, table_id: int) -> bool:
@@ -91,18 +307,52 @@ class TableService:
             return False
 
         self.session.delete(table)
+        self.session.add(Tombstone(entity=ChangeEntity.TABLE.value, entity_id=table_id))
         self.session.commit()
+        self.cache.invalidate()
+        seating_index.invalidate()
+        availability_index.remove_table(table_id)
         return True
 
-    def get_available_tables(self, seats: int) -> List[Table]:
+    def get_available_tables(
+        self,
+        seats: int,
+        start: Optional[datetime] = None,
+        duration_minutes: int = 60,
+        location: Optional[str] = None
+    ) -> List[Table]:
         """
-        Get tables with sufficient seats.
-        
+        Get tables with sufficient seats and no overlapping reservation.
+
+        Runs as a single query: reservations that overlap the requested
+        window are excluded with a NOT EXISTS anti-join. Tables are ordered
+        by seat count, so the best fit for the party comes first.
+
         Args:
             seats: Required number of seats
-            
+            start: Start of the requested window, naive times taken as
+                UTC; seats only if omitted
+            duration_minutes: Length of the requested window
+            location: Only tables in this location
+
         Returns:
             List[Table]: List of available tables
         """
         statement = select(Table).where(Table.seats >= seats)
-        return self.session.exec(statement).all() 
\ No newline at end of file
+        if location is not None:
+            statement = statement.where(Table.location == location)
+        if start is not None:
+            start = naive_utc(start)
+            end = start + timedelta(minutes=duration_minutes)
+            statement = statement.where(
+                ~ReservationService.overlapping(Table.id, start, end)
+            )
+        statement = statement.order_by(Table.seats, Table.id)
+        return self.session.exec(statement).all()
+
+
+class AsyncTableService(AsyncServiceAdapter):
+    """
+    Async facade over TableService.
+    """
+    service_cls = TableService
@@ -0,0 +1,180 @@
+from datetime import datetime, timedelta
+from typing import List
+
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from app.models.table import Table
+from app.models.reservation import Reservation
+
+START = datetime(2030, 1, 1, 19, 0)
+
+
+def _seed(db_session: Session) -> List[Table]:
+    tables = [
+        Table(name="Two Top", seats=2, location="Window"),
+        Table(name="Four Top", seats=4, location="Window"),
+        Table(name="Six Top", seats=6, location="Garden"),
+        Table(name="Eight Top", seats=8, location="Window"),
+    ]
+    db_session.add_all(tables)
+    db_session.commit()
+    # Four Top is booked 19:30-20:30
+    db_session.add(Reservation(
+        customer_name="Booked",
+        table_id=tables[1].id,
+        reservation_time=START + timedelta(minutes=30),
+        duration_minutes=60
+    ))
+    db_session.commit()
+    return tables
+
+
+def _names(response) -> List[str]:
+    assert response.status_code == 200
+    return [table["name"] for table in response.json()]
+
+
+def test_availability_excludes_overlapping_reservations(
+    client: TestClient,
+    db_session: Session
+):
+    """Test that tables booked during the window are not offered."""
+    _seed(db_session)
+
+    response = client.get(
+        "/api/v1/availability/",
+        params={"seats": 3, "start": START.isoformat(), "duration": 60}
+    )
+    assert _names(response) == ["Six Top", "Eight Top"]
+
+    # The booking has ended by 20:30
+    response = client.get(
+        "/api/v1/availability/",
+        params={
+            "seats": 3,
+            "start": (START + timedelta(minutes=90)).isoformat(),
+            "duration": 60,
+        }
+    )
+    assert _names(response) == ["Four Top", "Six Top", "Eight Top"]
+
+
+def test_availability_with_offset(client: TestClient, db_session: Session):
+    """Test that a start with a UTC offset is compared as UTC."""
+    _seed(db_session)
+
+    # 21:30+02:00 is 19:30 UTC, while Four Top is booked
+    response = client.get(
+        "/api/v1/availability/",
+        params={"seats": 3, "start": "2030-01-01T21:30:00+02:00", "duration": 60}
+    )
+    assert _names(response) == ["Six Top", "Eight Top"]
+
+
+def test_availability_location_filter(client: TestClient, db_session: Session):
+    """Test restricting availability to one location."""
+    _seed(db_session)
+
+    response = client.get(
+        "/api/v1/availability/",
+        params={"seats": 2, "start": START.isoformat(), "location": "Window"}
+    )
+    assert _names(response) == ["Two Top", "Eight Top"]
+
+
+def test_availability_requires_party_size(client: TestClient):
+    """Test validation of the query parameters."""
+    response = client.get(
+        "/api/v1/availability/", params={"start": START.isoformat()}
+    )
+    assert response.status_code == 422
+    response = client.get(
+        "/api/v1/availability/",
+        params={"seats": 0, "start": START.isoformat()}
+    )
+    assert response.status_code == 422
+
+
+def _grid(client: TestClient, **params) -> dict:
+    response = client.get(
+        "/api/v1/availability/grid", params={"day": "2030-01-01", **params}
+    )
+    assert response.status_code == 200
+    return {
+        table["name"]: [slot[11:16] for slot in table["free_slots"]]
+        for table in response.json()["tables"]
+    }
+
+
+def test_slot_grid(client: TestClient, db_session: Session):
+    """Test open slots per table, with and without a booking duration."""
+    _seed(db_session)
+
+    grid = _grid(client, seats=3, start="19:00", end="21:00")
+    assert list(grid) == ["Four Top", "Six Top", "Eight Top"]
+    assert grid["Four Top"] == ["19:00", "19:15", "20:30", "20:45"]
+    assert len(grid["Six Top"]) == 8
+
+    grid = _grid(client, seats=3, start="19:00", end="21:00", duration=60)
+    assert grid["Four Top"] == ["20:30", "20:45"]
+
+    response = client.get(
+        "/api/v1/availability/grid",
+        params={"day": "2030-01-01", "start": "21:00", "end": "19:00"}
+    )
+    assert response.status_code == 400
+
+
+def test_slot_grid_follows_writes(
+    client: TestClient,
+    db_session: Session,
+    query_counter: List[str]
+):
+    """Test that bookings update the loaded grid without reloading the day."""
+    tables = _seed(db_session)
+    _grid(client, seats=6, start="19:00", end="20:00")
+
+    query_counter.clear()
+    response = client.post("/api/v1/reservations/", json={
+        "customer_name": "Walk-in",
+        "table_id": tables[2].id,
+        "reservation_time": START.isoformat(),
+        "duration_minutes": 30,
+    })
+    assert response.status_code == 201
+    reservation_id = response.json()["id"]
+
+    query_counter.clear()
+    grid = _grid(client, seats=6, start="19:00", end="20:00")
+    assert grid["Six Top"] == ["19:30", "19:45"]
+    assert not [sql for sql in query_counter if "FROM reservations" in sql]
+
+    response = client.put(
+        f"/api/v1/reservations/{reservation_id}",
+        json={"reservation_time": (START + timedelta(minutes=30)).isoformat()}
+    )
+    assert response.status_code == 200
+    assert _grid(client, seats=6, start="19:00", end="20:00")["Six Top"] == [
+        "19:00", "19:15"
+    ]
+
+    response = client.delete(f"/api/v1/reservations/{reservation_id}")
+    assert response.status_code == 204
+    assert len(_grid(client, seats=6, start="19:00", end="20:00")["Six Top"]) == 4
+
+
+def test_slot_grid_across_midnight(client: TestClient, db_session: Session):
+    """Test that a booking running past midnight needs the next day free."""
+    tables = _seed(db_session)
+    db_session.add(Reservation(
+        customer_name="Early",
+        table_id=tables[0].id,
+        reservation_time=datetime(2030, 1, 2, 0, 15),
+        duration_minutes=60
+    ))
+    db_session.commit()
+
+    grid = _grid(client, seats=2, start="23:00", duration=60)
+    assert grid["Two Top"] == ["23:00", "23:15"]
+    assert grid["Eight Top"] == ["23:00", "23:15", "23:30", "23:45"]
@@ -0,0 +1,140 @@
+from datetime import datetime, timedelta
+from typing import List
+
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlmodel import Session, select
+
+from app.models.table import Table
+from app.models.reservation import Reservation
+
+START = datetime(2030, 1, 1, 18, 0)
+
+
+def _seed(db_session: Session) -> List[Table]:
+    tables = [
+        Table(name="Bulk A", seats=4, location="Main Hall"),
+        Table(name="Bulk B", seats=4, location="Main Hall"),
+    ]
+    db_session.add_all(tables)
+    db_session.commit()
+    # Bulk A is already booked 21:00-22:00
+    db_session.add(Reservation(
+        customer_name="Existing",
+        table_id=tables[0].id,
+        reservation_time=START + timedelta(hours=3),
+        duration_minutes=60
+    ))
+    db_session.commit()
+    return tables
+
+
+def _item(table_id: int, hours: float, name: str = "Guest") -> dict:
+    return {
+        "customer_name": name,
+        "table_id": table_id,
+        "reservation_time": (START + timedelta(hours=hours)).isoformat(),
+        "duration_minutes": 60,
+    }
+
+
+def _batch(tables: List[Table]) -> List[dict]:
+    a, b = tables[0].id, tables[1].id
+    return [
+        _item(a, 0, "First"),
+        _item(a, 0.5, "Overlaps first"),
+        _item(a, 2.5, "Overlaps existing"),
+        _item(999, 0, "No table"),
+        _item(b, 0, "Other table"),
+        _item(a, 1, "Right after first"),
+    ]
+
+
+def test_bulk_partial(client: TestClient, db_session: Session):
+    """Test that valid items are created and failures are reported."""
+    tables = _seed(db_session)
+
+    response = client.post(
+        "/api/v1/reservations/bulk",
+        json={"items": _batch(tables), "mode": "partial"}
+    )
+    assert response.status_code == 201
+    body = response.json()
+    assert body["created"] == 3
+    assert [result["status"] for result in body["results"]] == [
+        "created", "conflict", "conflict", "table_not_found", "created",
+        "created",
+    ]
+    assert body["results"][0]["reservation"]["table"]["name"] == "Bulk A"
+    assert body["results"][5]["reservation"]["reservation_time"] == (
+        "2030-01-01T19:00:00"
+    )
+
+    names = db_session.exec(
+        select(Reservation.customer_name)
+        .where(Reservation.table_id.in_([t.id for t in tables]))
+        .order_by(Reservation.id)
+    ).all()
+    assert names == ["Existing", "First", "Other table", "Right after first"]
+
+
+def test_bulk_all_or_nothing(client: TestClient, db_session: Session):
+    """Test that one failed item rejects the whole batch."""
+    tables = _seed(db_session)
+
+    response = client.post(
+        "/api/v1/reservations/bulk", json={"items": _batch(tables)}
+    )
+    assert response.status_code == 409
+    body = response.json()
+    assert body["created"] == 0
+    assert [result["status"] for result in body["results"]] == [
+        "skipped", "conflict", "conflict", "table_not_found", "skipped",
+        "skipped",
+    ]
+    assert db_session.exec(
+        select(Reservation).where(Reservation.table_id == tables[1].id)
+    ).all() == []
+
+
+def test_bulk_query_count(
+    client: TestClient,
+    db_session: Session,
+    query_counter: List[str]
+):
+    """Test that a large batch costs a fixed number of queries."""
+    tables = _seed(db_session)
+    items = [
+        _item(tables[i % 2].id, 24 + 2 * (i // 2), f"Guest {i}")
+        for i in range(200)
+    ]
+
+    query_counter.clear()
+    response = client.post("/api/v1/reservations/bulk", json={"items": items})
+
+    assert response.status_code == 201
+    assert response.json()["created"] == 200
+    assert len(query_counter) <= 3
+
+
+def test_bulk_validation(client: TestClient):
+    """Test that empty batches are rejected."""
+    response = client.post("/api/v1/reservations/bulk", json={"items": []})
+    assert response.status_code == 422
+
+
+def test_bulk_constraint_violation_is_conflict(client: TestClient, db_session: Session):
+    """Test that a row rejected by the database reports the batch as conflicted."""
+    tables = _seed(db_session)
+    # Stands in for the PostgreSQL exclusion constraint
+    db_session.exec(text(
+        "CREATE TEMP TRIGGER reject_reservations BEFORE INSERT ON reservations "
+        "BEGIN SELECT RAISE(ABORT, 'rejected'); END"
+    ))
+
+    response = client.post(
+        "/api/v1/reservations/bulk",
+        json={"items": [_item(tables[1].id, 0)], "mode": "partial"}
+    )
+    assert response.status_code == 409
+    assert [r["status"] for r in response.json()["results"]] == ["conflict"]
@@ -0,0 +1,119 @@
+from datetime import datetime
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.models.table import Table
+
+
+@pytest.fixture
+def no_settle(monkeypatch):
+    """Let the change feed return writes made a moment ago."""
+    monkeypatch.setattr(settings, "CHANGES_SETTLE_SECONDS", 0)
+
+
+def _changes(client: TestClient, **params) -> dict:
+    response = client.get("/api/v1/changes/", params=params)
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_changes_incremental_sync(client: TestClient, no_settle):
+    """Test that each call returns only what changed since the cursor."""
+    table = client.post("/api/v1/tables/", json={
+        "name": "Sync Table", "seats": 4, "location": "Terrace"
+    }).json()
+    reservation = client.post("/api/v1/reservations/", json={
+        "customer_name": "Sync",
+        "table_id": table["id"],
+        "reservation_time": datetime(2030, 1, 1, 19, 0).isoformat(),
+        "duration_minutes": 60,
+    }).json()
+
+    snapshot = _changes(client)
+    assert [row["id"] for row in snapshot["tables"]] == [table["id"]]
+    assert [row["id"] for row in snapshot["reservations"]] == [reservation["id"]]
+    assert snapshot["deleted"] == []
+    assert snapshot["has_more"] is False
+    cursor = snapshot["next_cursor"]
+
+    # Nothing changed: empty delta and the same cursor
+    delta = _changes(client, since=cursor)
+    assert delta["tables"] == delta["reservations"] == delta["deleted"] == []
+    assert delta["next_cursor"] == cursor
+
+    reservation_url = f"/api/v1/reservations/{reservation['id']}"
+    assert client.put(
+        reservation_url, json={"customer_name": "Renamed"}
+    ).status_code == 200
+    delta = _changes(client, since=cursor)
+    assert delta["tables"] == []
+    [updated] = delta["reservations"]
+    assert updated["customer_name"] == "Renamed"
+    assert updated["updated_at"] > updated["created_at"]
+    cursor = delta["next_cursor"]
+
+    assert client.put(
+        f"/api/v1/tables/{table['id']}", json={"seats": 6}
+    ).status_code == 200
+    assert client.delete(reservation_url).status_code == 204
+    delta = _changes(client, since=cursor)
+    [updated_table] = delta["tables"]
+    assert updated_table["seats"] == 6
+    assert updated_table["updated_at"] > updated_table["created_at"]
+    assert delta["reservations"] == []
+    assert [
+        (row["entity"], row["id"]) for row in delta["deleted"]
+    ] == [("reservation", reservation["id"])]
+
+
+def test_changes_pages_with_limit(
+    client: TestClient,
+    db_session: Session,
+    no_settle
+):
+    """Test that has_more pages through a large backlog without gaps."""
+    db_session.add_all([Table(name=f"Table {i}", seats=2) for i in range(5)])
+    db_session.commit()
+
+    seen = []
+    cursor = None
+    while True:
+        params = {"limit": 2}
+        if cursor is not None:
+            params["since"] = cursor
+        page = _changes(client, **params)
+        assert len(page["tables"]) <= 2
+        seen.extend(row["name"] for row in page["tables"])
+        cursor = page["next_cursor"]
+        if not page["has_more"]:
+            break
+
+    assert sorted(seen) == [f"Table {i}" for i in range(5)]
+
+
+def test_changes_deleted_table(client: TestClient, table_fixture: Table, no_settle):
+    """Test that deleting a table leaves a tombstone."""
+    table_id = table_fixture.id
+    cursor = _changes(client)["next_cursor"]
+
+    assert client.delete(f"/api/v1/tables/{table_id}").status_code == 204
+
+    delta = _changes(client, since=cursor)
+    assert delta["tables"] == []
+    assert [(row["entity"], row["id"]) for row in delta["deleted"]] == [
+        ("table", table_id)
+    ]
+
+
+def test_changes_hold_back_recent_writes(client: TestClient, table_fixture: Table):
+    """Test that writes inside the settle window wait for a later call."""
+    assert _changes(client)["tables"] == []
+
+
+def test_changes_invalid_cursor(client: TestClient):
+    """Test that a malformed cursor is rejected."""
+    response = client.get("/api/v1/changes/", params={"since": "garbage"})
+    assert response.status_code == 400
@@ -0,0 +1,158 @@
+import asyncio
+import json
+import threading
+from datetime import datetime
+
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from app.core.events import EventBroker, event_broker, sse_stream
+from app.models.table import Table
+
+
+def _event(table_id: int, location: str, **extra) -> dict:
+    return {
+        "type": "reservation.created",
+        "table_id": table_id,
+        "location": location,
+        **extra,
+    }
+
+
+def test_broker_filters_subscribers():
+    """Test that subscribers only receive events for their table or location."""
+    async def scenario():
+        broker = EventBroker()
+        by_table = broker.subscribe(table_id=1)
+        by_location = broker.subscribe(location="Garden")
+        everything = broker.subscribe()
+
+        broker.publish(_event(1, "Main Hall"))
+        broker.publish(_event(2, "Garden"))
+        # A move from table 3 to table 1 reaches subscribers of both sides
+        broker.publish(_event(
+            1, "Main Hall", previous_table_id=3, previous_location="Garden"
+        ))
+
+        assert by_table.queue.qsize() == 2
+        assert by_location.queue.qsize() == 2
+        assert everything.queue.qsize() == 3
+
+        by_table.close()
+        assert broker.subscriber_count == 2
+
+    asyncio.run(scenario())
+
+
+def test_broker_publish_from_thread():
+    """Test that events published on another thread wake the subscriber loop."""
+    async def scenario():
+        broker = EventBroker()
+        subscriptions = [broker.subscribe() for _ in range(10)]
+
+        thread = threading.Thread(
+            target=broker.publish, args=(_event(1, "Main Hall"),)
+        )
+        thread.start()
+        thread.join()
+
+        for subscription in subscriptions:
+            event = await asyncio.wait_for(subscription.get(), 1)
+            assert event["table_id"] == 1
+
+    asyncio.run(scenario())
+
+
+def test_broker_drops_events_for_full_queue():
+    """Test that a slow subscriber loses events instead of buffering forever."""
+    async def scenario():
+        broker = EventBroker()
+        subscription = broker.subscribe()
+        subscription.queue = asyncio.Queue(2)
+
+        for i in range(5):
+            broker.publish(_event(i, "Main Hall"))
+
+        assert subscription.queue.qsize() == 2
+        assert subscription.dropped == 3
+
+    asyncio.run(scenario())
+
+
+def test_sse_stream():
+    """Test the SSE encoding, keepalives and unsubscribe on disconnect."""
+    async def scenario():
+        broker = EventBroker()
+        subscription = broker.subscribe(table_id=7)
+        stream = sse_stream(subscription, keepalive=0.05)
+
+        assert await stream.__anext__() == b": connected\n\n"
+        assert await stream.__anext__() == b": keepalive\n\n"
+
+        broker.publish(_event(7, "Terrace", reservation_id=1))
+        message = (await stream.__anext__()).decode()
+        event_line, data_line, _, _ = message.split("\n")
+        assert event_line == "event: reservation.created"
+        assert json.loads(data_line[len("data: "):])["reservation_id"] == 1
+
+        await stream.aclose()
+        assert broker.subscriber_count == 0
+
+    asyncio.run(scenario())
+
+
+def test_reservation_writes_publish_events(client: TestClient, db_session: Session):
+    """Test that create, update and delete publish events after commit."""
+    first = Table(name="Events 1", seats=4, location="Terrace")
+    second = Table(name="Events 2", seats=4, location="Garden")
+    db_session.add_all([first, second])
+    db_session.commit()
+    first_id, second_id = first.id, second.id
+
+    def writes():
+        response = client.post("/api/v1/reservations/", json={
+            "customer_name": "Streamer",
+            "table_id": first_id,
+            "reservation_time": datetime(2030, 1, 1, 19, 0).isoformat(),
+            "duration_minutes": 60,
+        })
+        assert response.status_code == 201
+        url = f"/api/v1/reservations/{response.json()['id']}"
+        assert client.put(url, json={"table_id": second_id}).status_code == 200
+        assert client.delete(url).status_code == 204
+        # A rejected write publishes nothing
+        response = client.post("/api/v1/reservations/", json={
+            "customer_name": "Nobody",
+            "table_id": 999,
+            "reservation_time": datetime(2030, 1, 1, 19, 0).isoformat(),
+            "duration_minutes": 60,
+        })
+        assert response.status_code == 400
+
+    async def scenario():
+        on_first = event_broker.subscribe(table_id=first_id)
+        in_garden = event_broker.subscribe(location="Garden")
+        try:
+            await asyncio.to_thread(writes)
+            first_events = [on_first.queue.get_nowait() for _ in range(2)]
+            garden_events = [in_garden.queue.get_nowait() for _ in range(2)]
+            assert on_first.queue.empty() and in_garden.queue.empty()
+        finally:
+            on_first.close()
+            in_garden.close()
+        return first_events, garden_events
+
+    first_events, garden_events = asyncio.run(scenario())
+
+    assert [event["type"] for event in first_events] == [
+        "reservation.created", "reservation.updated"
+    ]
+    assert first_events[0]["location"] == "Terrace"
+    assert first_events[0]["end_time"] == "2030-01-01T20:00:00"
+    moved = first_events[1]
+    assert moved["table_id"] == second_id
+    assert moved["previous_table_id"] == first_id
+    assert moved["previous_location"] == "Terrace"
+    assert [event["type"] for event in garden_events] == [
+        "reservation.updated", "reservation.deleted"
+    ]
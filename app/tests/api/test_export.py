@@ -0,0 +1,98 @@
+import csv
+import gzip
+import io
+import json
+from datetime import datetime, timedelta
+
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from app.models.table import Table
+from app.models.reservation import Reservation
+from app.services.reservation import ReservationService
+
+
+def _seed(db_session: Session, count: int = 5) -> Table:
+    table = Table(name="Export Table", seats=4, location="Terrace")
+    other = Table(name="Other Table", seats=2, location="Main Hall")
+    db_session.add_all([table, other])
+    db_session.commit()
+    start = datetime(2030, 1, 1, 12, 0)
+    for i in range(count):
+        db_session.add_all([
+            Reservation(
+                customer_name=f"Guest {i}",
+                table_id=table.id,
+                reservation_time=start + timedelta(hours=i),
+                duration_minutes=60
+            ),
+            Reservation(
+                customer_name=f"Other {i}",
+                table_id=other.id,
+                reservation_time=start + timedelta(hours=i),
+                duration_minutes=60
+            ),
+        ])
+    db_session.commit()
+    return table
+
+
+def test_export_ndjson(client: TestClient, db_session: Session):
+    """Test NDJSON export with a table filter."""
+    table = _seed(db_session)
+
+    response = client.get(
+        "/api/v1/reservations/export", params={"table_id": table.id}
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [row["customer_name"] for row in rows] == [
+        f"Guest {i}" for i in range(5)
+    ]
+    assert rows[0]["end_time"] == "2030-01-01T13:00:00"
+
+
+def test_export_csv_gzip(client: TestClient, db_session: Session):
+    """Test gzip-compressed CSV export with location and date filters."""
+    _seed(db_session)
+
+    with client.stream(
+        "GET",
+        "/api/v1/reservations/export",
+        params={
+            "format": "csv",
+            "gzip": True,
+            "location": "Terrace",
+            "start": "2030-01-01T13:00:00",
+            "end": "2030-01-01T15:00:00",
+        }
+    ) as response:
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        raw = b"".join(response.iter_raw())
+
+    rows = list(csv.DictReader(io.StringIO(gzip.decompress(raw).decode())))
+    assert [row["customer_name"] for row in rows] == ["Guest 1", "Guest 2"]
+
+
+def test_export_empty_csv_has_header(client: TestClient):
+    """Test that an export without matches still yields the CSV header."""
+    response = client.get(
+        "/api/v1/reservations/export", params={"format": "csv", "table_id": 999}
+    )
+    assert response.status_code == 200
+    assert response.text.splitlines() == [
+        "id,table_id,customer_name,reservation_time,duration_minutes,"
+        "end_time,created_at,updated_at"
+    ]
+
+
+def test_export_batches(db_session: Session):
+    """Test that rows are fetched in batches of the requested size."""
+    _seed(db_session)
+
+    batches = list(ReservationService(db_session).iter_export_batches(batch_size=3))
+
+    assert [len(batch) for batch in batches] == [3, 3, 3, 1]
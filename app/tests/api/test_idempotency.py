@@ -0,0 +1,157 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Generator
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session, SQLModel, create_engine, func, select
+
+from app.db.session import get_session_factory
+from app.main import app
+from app.models.reservation import Reservation
+from app.models.table import Table
+from app.services.reservation import ReservationService
+
+
+@pytest.fixture
+def idempotency_store(tmp_path) -> Generator[None, None, None]:
+    """Keep idempotency keys in their own database, committed independently
+    of the test transaction as they are of the request's in production."""
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'idempotency.db'}",
+        connect_args={"check_same_thread": False, "timeout": 30}
+    )
+    SQLModel.metadata.create_all(engine)
+    app.dependency_overrides[get_session_factory] = lambda: lambda: Session(engine)
+    yield
+    app.dependency_overrides.pop(get_session_factory, None)
+    engine.dispose()
+
+
+def _payload(table: Table, name: str = "John Doe", hours: int = 1) -> dict:
+    return {
+        "customer_name": name,
+        "table_id": table.id,
+        "reservation_time": (
+            datetime.now(table.created_at.tzinfo) + timedelta(hours=hours)
+        ).isoformat(),
+        "duration_minutes": 60
+    }
+
+
+def _count(session: Session) -> int:
+    return session.exec(select(func.count()).select_from(Reservation)).one()
+
+
+def test_retry_replays_response(
+    client: TestClient,
+    db_session: Session,
+    table_fixture: Table,
+    idempotency_store
+):
+    """Test that a retried create returns the stored response and books once."""
+    payload = _payload(table_fixture)
+    headers = {"Idempotency-Key": "create-1"}
+
+    first = client.post("/api/v1/reservations/", json=payload, headers=headers)
+    retry = client.post("/api/v1/reservations/", json=payload, headers=headers)
+
+    assert first.status_code == retry.status_code == 201
+    assert retry.content == first.content
+    assert retry.headers["content-type"] == first.headers["content-type"]
+    assert "idempotent-replayed" not in first.headers
+    assert retry.headers["idempotent-replayed"] == "true"
+    assert _count(db_session) == 1
+
+
+def test_key_reused_for_other_request(
+    client: TestClient,
+    table_fixture: Table,
+    idempotency_store
+):
+    """Test that a key sent with a different body is rejected."""
+    headers = {"Idempotency-Key": "create-2"}
+    client.post("/api/v1/reservations/", json=_payload(table_fixture), headers=headers)
+
+    response = client.post(
+        "/api/v1/reservations/",
+        json=_payload(table_fixture, name="Jane Doe", hours=3),
+        headers=headers
+    )
+    assert response.status_code == 422
+
+
+def test_rejection_is_replayed(
+    client: TestClient,
+    db_session: Session,
+    table_fixture: Table,
+    idempotency_store
+):
+    """Test that a rejected booking stays rejected when retried, even after
+    the slot became free."""
+    existing = client.post("/api/v1/reservations/", json=_payload(table_fixture))
+    payload = _payload(table_fixture, name="Jane Doe")
+    headers = {"Idempotency-Key": "conflict"}
+
+    first = client.post("/api/v1/reservations/", json=payload, headers=headers)
+    assert first.status_code == 400
+
+    client.delete(f"/api/v1/reservations/{existing.json()['id']}")
+    retry = client.post("/api/v1/reservations/", json=payload, headers=headers)
+    assert retry.status_code == 400
+    assert retry.json() == first.json()
+    assert _count(db_session) == 0
+
+
+def test_delete_retry(
+    client: TestClient,
+    table_fixture: Table,
+    idempotency_store
+):
+    """Test that a retried delete gets 204 instead of 404."""
+    created = client.post("/api/v1/reservations/", json=_payload(table_fixture))
+    url = f"/api/v1/reservations/{created.json()['id']}"
+    headers = {"Idempotency-Key": "delete-1"}
+
+    assert client.delete(url, headers=headers).status_code == 204
+    retry = client.delete(url, headers=headers)
+    assert retry.status_code == 204
+    assert retry.headers["idempotent-replayed"] == "true"
+    assert client.delete(url).status_code == 404
+
+
+def test_concurrent_retries_run_once(
+    client: TestClient,
+    db_session: Session,
+    table_fixture: Table,
+    idempotency_store,
+    monkeypatch
+):
+    """Test that a retry arriving while the first request runs waits for
+    its response instead of booking again."""
+    calls = []
+    create = ReservationService.create
+
+    def slow_create(self, *args, **kwargs):
+        calls.append(1)
+        time.sleep(0.3)
+        return create(self, *args, **kwargs)
+
+    monkeypatch.setattr(ReservationService, "create", slow_create)
+    payload = _payload(table_fixture)
+
+    def send(_):
+        return client.post(
+            "/api/v1/reservations/",
+            json=payload,
+            headers={"Idempotency-Key": "concurrent"}
+        )
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        responses = list(executor.map(send, range(2)))
+
+    assert len(calls) == 1
+    assert [r.status_code for r in responses] == [201, 201]
+    assert responses[0].content == responses[1].content
+    assert _count(db_session) == 1
@@ -0,0 +1,47 @@
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlmodel import create_engine
+
+from app.db.pool import InstrumentedQueuePool, PoolMetrics
+
+
+def test_pool_metrics_counters(tmp_path):
+    """Test that checkouts, connects and overflow are recorded."""
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedQueuePool,
+        pool_size=1,
+        max_overflow=1
+    )
+    metrics = PoolMetrics()
+    metrics.attach(engine)
+
+    with engine.connect() as first, engine.connect() as second:
+        first.execute(text("SELECT 1"))
+        second.execute(text("SELECT 1"))
+        stats = metrics.snapshot()
+        assert stats["checked_out"] == 2
+        assert stats["overflow"] == 1
+
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+
+    stats = metrics.snapshot()
+    engine.dispose()
+
+    assert stats["checkouts"] == 3
+    assert stats["connects"] == 2
+    assert stats["overflow_peak"] == 1
+    assert stats["checked_out"] == 0
+    assert stats["wait_max_ms"] >= stats["wait_avg_ms"] > 0
+    assert stats["open_connections"] == 1
+    assert stats["connection_age_max_seconds"] >= 0
+
+
+def test_get_pool_metrics(client: TestClient):
+    """Test the pool metrics endpoint."""
+    response = client.get("/api/v1/metrics/pool")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["primary"]["pool_class"] == "InstrumentedQueuePool"
+    assert "wait_max_ms" in data["primary"]
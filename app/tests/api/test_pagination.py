@@ -0,0 +1,143 @@
+from datetime import datetime, timedelta
+
+from fastapi.testclient import TestClient
+from sqlmodel import Session, select
+
+from app.core.config import settings
+from app.core.pagination import NEXT_CURSOR_HEADER
+from app.models.table import Table
+from app.models.reservation import Reservation
+from app.schemas.reservation import ReservationResponse
+from app.services.reservation import ReservationService
+
+
+def _seed(db_session: Session) -> datetime:
+    start = datetime(2030, 1, 1, 12, 0)
+    window = Table(name="Window", seats=2, location="Window")
+    garden = Table(name="Garden", seats=4, location="Garden")
+    db_session.add_all([window, garden])
+    db_session.commit()
+    for i in range(5):
+        db_session.add_all([
+            Reservation(
+                customer_name=f"Window {i}",
+                table_id=window.id,
+                reservation_time=start + timedelta(hours=i),
+                duration_minutes=60
+            ),
+            Reservation(
+                customer_name=f"Garden {i}",
+                table_id=garden.id,
+                reservation_time=start + timedelta(hours=i),
+                duration_minutes=60
+            ),
+        ])
+    db_session.commit()
+    return start
+
+
+def _collect(client: TestClient, url: str, **params) -> list:
+    pages = []
+    while True:
+        response = client.get(url, params=params)
+        assert response.status_code == 200
+        pages.append(response.json())
+        cursor = response.headers.get(NEXT_CURSOR_HEADER)
+        if cursor is None:
+            return pages
+        params["cursor"] = cursor
+
+
+def test_reservations_keyset_pages(client: TestClient, db_session: Session):
+    """Test walking all reservations page by page."""
+    _seed(db_session)
+
+    pages = _collect(client, "/api/v1/reservations/", limit=3)
+
+    assert [len(page) for page in pages] == [3, 3, 3, 1]
+    rows = [row for page in pages for row in page]
+    keys = [(row["reservation_time"], row["id"]) for row in rows]
+    assert keys == sorted(keys)
+    assert len({row["id"] for row in rows}) == 10
+
+
+def test_reservations_filters(client: TestClient, db_session: Session):
+    """Test date range, table and location filters."""
+    start = _seed(db_session)
+
+    pages = _collect(
+        client,
+        "/api/v1/reservations/",
+        limit=2,
+        location="Garden",
+        start=(start + timedelta(hours=1)).isoformat(),
+        end=(start + timedelta(hours=4)).isoformat()
+    )
+    names = [row["customer_name"] for page in pages for row in page]
+    assert names == ["Garden 1", "Garden 2", "Garden 3"]
+
+    table_id = pages[0][0]["table_id"]
+    response = client.get(
+        "/api/v1/reservations/", params={"table_id": table_id, "limit": 100}
+    )
+    assert len(response.json()) == 5
+    assert NEXT_CURSOR_HEADER not in response.headers
+
+
+def test_reservations_limit_and_cursor_validation(client: TestClient):
+    """Test the limit cap and rejection of malformed cursors."""
+    response = client.get(
+        "/api/v1/reservations/",
+        params={"limit": settings.PAGINATION_MAX_LIMIT + 1}
+    )
+    assert response.status_code == 422
+
+    response = client.get("/api/v1/reservations/", params={"cursor": "garbage"})
+    assert response.status_code == 400
+
+
+def test_tables_keyset_pages(client: TestClient, db_session: Session):
+    """Test walking tables page by page with a location filter."""
+    _seed(db_session)
+    db_session.add(Table(name="Garden 2", seats=6, location="Garden"))
+    db_session.commit()
+
+    pages = _collect(client, "/api/v1/tables/", limit=1, location="Garden")
+
+    assert [[row["name"] for row in page] for page in pages] == [
+        ["Garden"], ["Garden 2"]
+    ]
+
+
+def test_reservations_fast_path_matches_models(
+    client: TestClient,
+    db_session: Session
+):
+    """Test that the orjson list body equals the ReservationResponse output."""
+    _seed(db_session)
+    # Microseconds must survive the fast path too
+    garden = db_session.exec(select(Table).where(Table.name == "Garden")).one()
+    garden.updated_at = datetime(2030, 1, 1, 9, 30, 0, 123456)
+    db_session.commit()
+
+    response = client.get(
+        "/api/v1/reservations/", params={"location": "Garden", "limit": 3}
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+
+    reservations, _ = ReservationService(db_session).get_page(3, location="Garden")
+    expected = [
+        ReservationResponse.model_validate(reservation).model_dump(mode="json")
+        for reservation in reservations
+    ]
+    assert response.json() == expected
+
+
+def test_reservations_list_schema_unchanged(client: TestClient):
+    """Test that the fast path keeps the documented response model."""
+    schema = client.get("/api/v1/openapi.json").json()
+    content = schema["paths"]["/api/v1/reservations/"]["get"]["responses"]["200"][
+        "content"
+    ]["application/json"]["schema"]
+    assert content["items"] == {"$ref": "#/components/schemas/ReservationResponse"}
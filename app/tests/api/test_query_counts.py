@@ -0,0 +1,167 @@
+from datetime import datetime, timedelta
+from typing import List
+
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from app.models.table import Table
+from app.models.reservation import Reservation
+
+
+def _seed(db_session: Session, tables: int = 5, per_table: int = 10) -> List[int]:
+    created = [Table(name=f"Table {i}", seats=4) for i in range(tables)]
+    db_session.add_all(created)
+    db_session.commit()
+    start = datetime(2030, 1, 1, 12, 0)
+    for table in created:
+        for i in range(per_table):
+            db_session.add(Reservation(
+                customer_name=f"Guest {i}",
+                table_id=table.id,
+                reservation_time=start + timedelta(hours=i),
+                duration_minutes=60
+            ))
+    db_session.commit()
+    table_ids = [table.id for table in created]
+    # Start every request with an empty identity map
+    db_session.expunge_all()
+    return table_ids
+
+
+def test_reservation_list_is_one_query(
+    client: TestClient,
+    db_session: Session,
+    query_counter: List[str]
+):
+    """Test that listing reservations loads tables in the same query."""
+    _seed(db_session)
+    query_counter.clear()
+
+    response = client.get("/api/v1/reservations/", params={"limit": 100})
+
+    assert response.status_code == 200
+    assert len(response.json()) == 50
+    assert len(query_counter) == 1
+
+
+def test_table_reservations_is_one_query(
+    client: TestClient,
+    db_session: Session,
+    query_counter: List[str]
+):
+    """Test that listing a table's reservations is a single query."""
+    table_ids = _seed(db_session)
+    query_counter.clear()
+
+    response = client.get(f"/api/v1/reservations/table/{table_ids[0]}")
+
+    assert response.status_code == 200
+    assert len(response.json()) == 10
+    assert len(query_counter) == 1
+
+
+def test_get_reservation_is_one_query(
+    client: TestClient,
+    reservation_fixture: dict,
+    db_session: Session,
+    query_counter: List[str]
+):
+    """Test that reading one reservation loads its table in the same query."""
+    db_session.expunge_all()
+    query_counter.clear()
+
+    response = client.get(f"/api/v1/reservations/{reservation_fixture['id']}")
+
+    assert response.status_code == 200
+    assert response.json()["table"]["id"] == reservation_fixture["table_id"]
+    assert len(query_counter) == 1
+
+
+def _writes(statements: List[str]) -> List[str]:
+    return [statement.split(None, 1)[0].upper() for statement in statements]
+
+
+def test_create_reservation_round_trips(
+    client: TestClient,
+    table_fixture: Table,
+    db_session: Session,
+    statement_counter: List[str]
+):
+    """Test that creating a reservation checks, inserts and returns the row
+    in one statement, plus the table version update."""
+    db_session.expunge_all()
+    statement_counter.clear()
+
+    response = client.post("/api/v1/reservations/", json={
+        "customer_name": "John Doe",
+        "table_id": table_fixture.id,
+        "reservation_time": (datetime.utcnow() + timedelta(hours=1)).isoformat(),
+        "duration_minutes": 60
+    })
+
+    assert response.status_code == 201
+    assert _writes(statement_counter) == ["INSERT", "UPDATE"]
+    created = response.json()
+    assert created["table"]["name"] == table_fixture.name
+    assert client.get(f"/api/v1/reservations/{created['id']}").json() == created
+
+
+def test_update_reservation_round_trips(
+    client: TestClient,
+    reservation_fixture: dict,
+    db_session: Session,
+    statement_counter: List[str]
+):
+    """Test that updating a reservation loads it once and writes it with
+    a single UPDATE ... RETURNING."""
+    db_session.expunge_all()
+    statement_counter.clear()
+
+    response = client.put(
+        f"/api/v1/reservations/{reservation_fixture['id']}",
+        json={"reservation_time": (datetime.utcnow() + timedelta(days=1)).isoformat()}
+    )
+
+    assert response.status_code == 200
+    assert _writes(statement_counter) == ["SELECT", "UPDATE", "UPDATE"]
+    fetched = client.get(f"/api/v1/reservations/{reservation_fixture['id']}")
+    assert fetched.json() == response.json()
+    assert fetched.headers["etag"] == response.headers["etag"]
+
+
+def test_delete_reservation_round_trips(
+    client: TestClient,
+    reservation_fixture: dict,
+    db_session: Session,
+    statement_counter: List[str]
+):
+    """Test that deleting a reservation does not load it first."""
+    db_session.expunge_all()
+    statement_counter.clear()
+
+    response = client.delete(f"/api/v1/reservations/{reservation_fixture['id']}")
+
+    assert response.status_code == 204
+    assert _writes(statement_counter) == ["DELETE", "INSERT", "UPDATE"]
+
+
+def test_table_writes_round_trips(
+    client: TestClient,
+    statement_counter: List[str]
+):
+    """Test that creating and updating a table are one statement each."""
+    created = client.post(
+        "/api/v1/tables/", json={"name": "Terrace 1", "seats": 2}
+    )
+    assert created.status_code == 201
+    assert _writes(statement_counter) == ["INSERT"]
+    assert created.json()["location"] == "Main Hall"
+
+    statement_counter.clear()
+    updated = client.put(
+        f"/api/v1/tables/{created.json()['id']}", json={"seats": 6}
+    )
+    assert updated.status_code == 200
+    assert _writes(statement_counter) == ["UPDATE"]
+    assert updated.json()["seats"] == 6
+    assert updated.json()["created_at"] == created.json()["created_at"]
@@ -0,0 +1,104 @@
+from datetime import datetime, timedelta
+from typing import List
+
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from app.models.table import Table
+
+START = datetime(2030, 1, 1, 19, 0)
+
+
+def _create(client: TestClient, table_id: int, hours: int = 0) -> dict:
+    response = client.post("/api/v1/reservations/", json={
+        "customer_name": "Poller",
+        "table_id": table_id,
+        "reservation_time": (START + timedelta(hours=hours)).isoformat(),
+        "duration_minutes": 60,
+    })
+    assert response.status_code == 201
+    return response.json()
+
+
+def test_reservation_not_modified(
+    client: TestClient,
+    table_fixture: Table,
+    query_counter: List[str]
+):
+    """Test 304 on an unchanged reservation and a new ETag after an update."""
+    reservation = _create(client, table_fixture.id)
+    url = f"/api/v1/reservations/{reservation['id']}"
+
+    response = client.get(url)
+    etag = response.headers["etag"]
+    assert response.headers["cache-control"] == "private, no-cache"
+
+    query_counter.clear()
+    response = client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert len(query_counter) == 1
+
+    response = client.put(url, json={"customer_name": "Renamed"})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+
+    response = client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()["customer_name"] == "Renamed"
+
+
+def test_table_reservations_not_modified(
+    client: TestClient,
+    db_session: Session,
+    table_fixture: Table
+):
+    """Test that the list ETag follows bookings for that table only."""
+    table_id = table_fixture.id
+    other = Table(name="Other", seats=2)
+    db_session.add(other)
+    db_session.commit()
+    other_id = other.id
+
+    url = f"/api/v1/reservations/table/{table_id}"
+    empty_etag = client.get(url).headers["etag"]
+    _create(client, table_id)
+
+    response = client.get(url, headers={"If-None-Match": empty_etag})
+    assert response.status_code == 200
+    assert len(response.json()) == 1
+    etag = response.headers["etag"]
+
+    # A booking for another table leaves this list's version alone
+    _create(client, other_id)
+    response = client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+
+def test_if_match_on_update_and_delete(client: TestClient, table_fixture: Table):
+    """Test optimistic concurrency with If-Match."""
+    reservation = _create(client, table_fixture.id)
+    url = f"/api/v1/reservations/{reservation['id']}"
+    etag = client.get(url).headers["etag"]
+
+    response = client.put(
+        url, json={"duration_minutes": 90}, headers={"If-Match": etag}
+    )
+    assert response.status_code == 200
+    new_etag = response.headers["etag"]
+
+    # A second writer still holding the old ETag is rejected
+    response = client.put(
+        url, json={"duration_minutes": 30}, headers={"If-Match": etag}
+    )
+    assert response.status_code == 412
+    response = client.delete(url, headers={"If-Match": etag})
+    assert response.status_code == 412
+    assert client.get(url).json()["duration_minutes"] == 90
+
+    # If-Match uses strong comparison: a weak validator never matches
+    response = client.delete(url, headers={"If-Match": "W/" + new_etag})
+    assert response.status_code == 412
+
+    response = client.delete(url, headers={"If-Match": new_etag})
+    assert response.status_code == 204
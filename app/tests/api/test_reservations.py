@@ -1,5 +1,6 @@
 from datetime import datetime, timedelta, UTC
 from fastapi.testclient import TestClient
+from sqlalchemy import text
 from sqlalchemy.orm import Session
 
 from app.models.table import Table
@@ -160,4 +161,120 @@ def test_reservation_time_conflict(client: TestClient, table_fixture: Table):
             "duration_minutes": 60
         }
     )
-    assert response.status_code == 400 
\ No newline at end of file
+    assert response.status_code == 400 
+
+
+def test_create_reservation_with_offset_stored_as_utc(
+    client: TestClient,
+    table_fixture: Table
+):
+    """Test that single and bulk creates store offset times as UTC."""
+    body = {
+        "customer_name": "John Doe",
+        "table_id": table_fixture.id,
+        "reservation_time": "2030-01-01T18:00:00+02:00",
+        "duration_minutes": 60
+    }
+    response = client.post("/api/v1/reservations/", json=body)
+    assert response.status_code == 201
+    assert response.json()["reservation_time"] == "2030-01-01T16:00:00"
+
+    # The same instant written in UTC is a double booking
+    body["reservation_time"] = "2030-01-01T16:00:00Z"
+    response = client.post("/api/v1/reservations/", json=body)
+    assert response.status_code == 400
+
+    body["reservation_time"] = "2030-01-02T18:00:00+02:00"
+    response = client.post("/api/v1/reservations/bulk", json={"items": [body]})
+    assert response.status_code == 201
+    assert response.json()["results"][0]["reservation"]["reservation_time"] == (
+        "2030-01-02T16:00:00"
+    )
+
+    reservation_id = response.json()["results"][0]["reservation"]["id"]
+    response = client.put(
+        f"/api/v1/reservations/{reservation_id}",
+        json={"reservation_time": "2030-01-03T18:00:00+02:00"}
+    )
+    assert response.status_code == 200
+    assert response.json()["reservation_time"] == "2030-01-03T16:00:00"
+
+
+def test_create_reservation_without_partition(
+    client: TestClient,
+    db_session: Session,
+    table_fixture: Table,
+    monkeypatch
+):
+    """Test that a month without a partition is not reported as a conflict."""
+    # Stands in for PostgreSQL rejecting a row no partition accepts
+    db_session.execute(text(
+        "CREATE TEMP TRIGGER reject_reservations BEFORE INSERT ON reservations "
+        "BEGIN SELECT RAISE(ABORT, 'no partition of relation'); END"
+    ))
+    monkeypatch.setattr(
+        "app.services.reservation.is_missing_partition", lambda exc: True
+    )
+
+    response = client.post(
+        "/api/v1/reservations/",
+        json={
+            "customer_name": "John Doe",
+            "table_id": table_fixture.id,
+            "reservation_time": datetime(2030, 1, 1, 19, 0).isoformat(),
+            "duration_minutes": 60
+        }
+    )
+    assert response.status_code == 422
+    assert "not open" in response.json()["detail"]
+
+
+def test_get_reservations_with_offset_bounds(
+    client: TestClient,
+    db_session: Session,
+    table_fixture: Table
+):
+    """Test that start and end filters with a UTC offset are compared as UTC."""
+    db_session.add(Reservation(
+        customer_name="Evening",
+        table_id=table_fixture.id,
+        reservation_time=datetime(2030, 1, 1, 17, 0),
+        duration_minutes=60
+    ))
+    db_session.commit()
+
+    # 18:30+02:00 to 19:30+02:00 is 16:30 to 17:30 UTC
+    response = client.get(
+        "/api/v1/reservations/",
+        params={
+            "start": "2030-01-01T18:30:00+02:00",
+            "end": "2030-01-01T19:30:00+02:00",
+        }
+    )
+    assert response.status_code == 200
+    assert [row["customer_name"] for row in response.json()] == ["Evening"]
+
+
+def test_reservation_duration_must_be_positive(
+    client: TestClient,
+    table_fixture: Table,
+    reservation_fixture: dict
+):
+    """Test that zero and negative durations are rejected."""
+    for duration in (0, -30):
+        response = client.post(
+            "/api/v1/reservations/",
+            json={
+                "customer_name": "John Doe",
+                "table_id": table_fixture.id,
+                "reservation_time": datetime(2030, 1, 1, 19, 0).isoformat(),
+                "duration_minutes": duration
+            }
+        )
+        assert response.status_code == 422
+
+        response = client.put(
+            f"/api/v1/reservations/{reservation_fixture['id']}",
+            json={"duration_minutes": duration}
+        )
+        assert response.status_code == 422
@@ -1,6 +1,9 @@
+from typing import List
+
 from fastapi.testclient import TestClient
 
 from app.models.table import Table
+from app.services import table as table_service
 
 
 def test_create_table(client: TestClient):
@@ -79,4 +82,134 @@ def test_update_table(client: TestClient, table_fixture: Table):
     data = response.json()
     assert data["name"] == "Updated Table"
     assert data["seats"] == 6
-    assert data["location"] == "Garden" 
\ No newline at end of file
+    assert data["location"] == "Garden" 
+
+
+def test_bulk_upsert_tables_json(client: TestClient, table_fixture: Table):
+    """Test inserting new tables and updating existing ones by name."""
+    table_id, name = table_fixture.id, table_fixture.name
+    response = client.post(
+        "/api/v1/tables/bulk",
+        json={
+            "items": [
+                {"name": name, "seats": 8, "location": "Terrace"},
+                {"name": "Bulk 1", "seats": 2},
+                {"name": "Bulk 2", "seats": 4, "location": "Garden"},
+            ]
+        }
+    )
+    assert response.status_code == 200
+    assert response.json() == {"inserted": 2, "updated": 1}
+
+    response = client.get(f"/api/v1/tables/{table_id}")
+    assert response.json()["seats"] == 8
+    assert response.json()["location"] == "Terrace"
+
+    response = client.get("/api/v1/tables/", params={"location": "Garden"})
+    assert [table["name"] for table in response.json()] == ["Bulk 2"]
+
+
+def test_bulk_upsert_tables_csv(client: TestClient):
+    """Test importing a floor plan from CSV."""
+    body = (
+        "name,seats,location\n"
+        "Patio 1,4,Patio\n"
+        "Patio 2,6,\n"
+        "Patio 1,2,Patio\n"
+    )
+    response = client.post(
+        "/api/v1/tables/bulk",
+        content=body,
+        headers={"Content-Type": "text/csv"}
+    )
+    assert response.status_code == 200
+    assert response.json() == {"inserted": 2, "updated": 0}
+
+    tables = {
+        table["name"]: table for table in client.get("/api/v1/tables/").json()
+    }
+    assert tables["Patio 1"]["seats"] == 2
+    assert tables["Patio 2"]["location"] == "Main Hall"
+
+
+def test_bulk_upsert_tables_validation(client: TestClient):
+    """Test rejection of invalid rows and malformed bodies."""
+    response = client.post(
+        "/api/v1/tables/bulk",
+        content="name,seats\nBroken,zero\n",
+        headers={"Content-Type": "text/csv"}
+    )
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["items", 0, "seats"]
+
+    response = client.post(
+        "/api/v1/tables/bulk",
+        content="{not json",
+        headers={"Content-Type": "application/json"}
+    )
+    assert response.status_code == 400
+
+
+def test_table_reads_are_cached(
+    client: TestClient,
+    table_fixture: Table,
+    query_counter: List[str]
+):
+    """Test that repeated reads skip the database and honour If-None-Match."""
+    table_id = table_fixture.id
+    for url in ["/api/v1/tables/", f"/api/v1/tables/{table_id}"]:
+        response = client.get(url)
+        assert response.status_code == 200
+        etag = response.headers["etag"]
+        assert response.headers["cache-control"].startswith("public, max-age=")
+
+        query_counter.clear()
+        response = client.get(url)
+        assert response.status_code == 200
+        assert response.headers["etag"] == etag
+        assert query_counter == []
+
+        response = client.get(url, headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+
+def test_table_writes_invalidate_cache(client: TestClient, table_fixture: Table):
+    """Test that an update is visible on the next read."""
+    table_id = table_fixture.id
+    etag = client.get(f"/api/v1/tables/{table_id}").headers["etag"]
+
+    response = client.put(f"/api/v1/tables/{table_id}", json={"seats": 10})
+    assert response.status_code == 200
+
+    response = client.get(
+        f"/api/v1/tables/{table_id}", headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 200
+    assert response.json()["seats"] == 10
+    assert response.headers["etag"] != etag
+
+
+def test_bulk_upsert_tables_without_on_conflict(
+    client: TestClient,
+    table_fixture: Table,
+    monkeypatch
+):
+    """Test the lookup fallback for databases without ON CONFLICT."""
+    monkeypatch.setattr(table_service, "UPSERT_INSERTS", {})
+    response = client.post(
+        "/api/v1/tables/bulk",
+        json={
+            "items": [
+                {"name": table_fixture.name, "seats": 8, "location": "Terrace"},
+                {"name": "Bulk 1", "seats": 2},
+            ]
+        }
+    )
+    assert response.status_code == 200
+    assert response.json() == {"inserted": 1, "updated": 1}
+
+    response = client.get(f"/api/v1/tables/{table_fixture.id}")
+    assert response.json()["seats"] == 8
+    assert response.json()["location"] == "Terrace"
@@ -1,13 +1,22 @@
+import os
 from datetime import datetime, UTC
-from typing import Generator, Dict, Any
+from typing import Generator, Dict, Any, List
 import pytest
+from sqlalchemy import event
 from sqlmodel import Session, SQLModel, create_engine
 from fastapi.testclient import TestClient
 
+# Tests run against SQLite in one process: keep the app from connecting an
+# invalidation bus on startup. Must be set before the settings are loaded.
+os.environ.setdefault("INVALIDATION_BACKEND", "none")
+
 from app.main import app
 from app.models.table import Table
 from app.models.reservation import Reservation
-from app.db.session import get_session
+from app.db.session import get_read_session, get_read_session_factory, get_session
+from app.core.cache import table_cache
+from app.services.availability import availability_index
+from app.services.seating import seating_index
 
 
 @pytest.fixture(scope="session")
@@ -21,19 +30,61 @@ def db_engine():
     SQLModel.metadata.drop_all(engine)
 
 
+@pytest.fixture(autouse=True)
+def clear_caches() -> Generator[None, None, None]:
+    """Start every test with empty availability and seating indexes and table cache."""
+    availability_index.clear()
+    seating_index.clear()
+    table_cache.invalidate()
+    yield
+    availability_index.clear()
+    seating_index.clear()
+    table_cache.invalidate()
+
+
 @pytest.fixture
 def db_session(db_engine) -> Generator[Session, None, None]:
     connection = db_engine.connect()
     transaction = connection.begin()
-    session = Session(bind=connection)
+    # Like the app's sessions, so tests see the same round trips
+    session = Session(bind=connection, expire_on_commit=False)
 
     yield session
 
     session.close()
-    transaction.rollback()
+    # A service that rolled back has already ended the transaction
+    if transaction.is_active:
+        transaction.rollback()
     connection.close()
 
 
+@pytest.fixture
+def query_counter(db_engine) -> Generator[List[str], None, None]:
+    """Collect SELECT statements executed against the test database."""
+    statements: List[str] = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append(statement)
+
+    event.listen(db_engine, "before_cursor_execute", before_cursor_execute)
+    yield statements
+    event.remove(db_engine, "before_cursor_execute", before_cursor_execute)
+
+
+@pytest.fixture
+def statement_counter(db_engine) -> Generator[List[str], None, None]:
+    """Collect every statement executed against the test database."""
+    statements: List[str] = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(db_engine, "before_cursor_execute", before_cursor_execute)
+    yield statements
+    event.remove(db_engine, "before_cursor_execute", before_cursor_execute)
+
+
 @pytest.fixture
 def client(db_session) -> Generator[TestClient, None, None]:
     def override_get_session():
@@ -43,6 +94,8 @@ def client(db_session) -> Generator[TestClient, None, None]:
             db_session.close()
 
     app.dependency_overrides[get_session] = override_get_session
+    app.dependency_overrides[get_read_session] = override_get_session
+    app.dependency_overrides[get_read_session_factory] = lambda: lambda: db_session
     with TestClient(app) as test_client:
         yield test_client
     app.dependency_overrides.clear()
@@ -0,0 +1,175 @@
+import gzip
+import json
+from datetime import datetime, timedelta
+
+from fastapi.testclient import TestClient
+from sqlmodel import Session, select
+
+from app.models.archive import ArchiveCheckpoint, ArchivedReservation
+from app.models.reservation import Reservation
+from app.models.table import Table
+from app.services.archive import ArchiveService, NDJSONSink, TableSink
+
+HORIZON = datetime(2025, 1, 1)
+
+
+def _seed(db_session: Session, table: Table) -> datetime:
+    """Five past reservations before HORIZON and two upcoming ones."""
+    past = datetime(2024, 12, 1, 12, 0)
+    for i in range(5):
+        db_session.add(Reservation(
+            customer_name=f"Past {i}",
+            table_id=table.id,
+            reservation_time=past + timedelta(days=i),
+            duration_minutes=60
+        ))
+    upcoming = datetime(2030, 1, 1, 12, 0)
+    for i in range(2):
+        db_session.add(Reservation(
+            customer_name=f"Upcoming {i}",
+            table_id=table.id,
+            reservation_time=upcoming + timedelta(hours=i),
+            duration_minutes=60
+        ))
+    db_session.commit()
+    return past
+
+
+def _live_names(db_session: Session) -> list:
+    return sorted(db_session.exec(select(Reservation.customer_name)).all())
+
+
+def test_archive_to_table(db_session: Session, table_fixture: Table):
+    """Test that past reservations move to the archive table in chunks."""
+    _seed(db_session, table_fixture)
+    version = table_fixture.reservations_version
+    service = ArchiveService(db_session)
+
+    assert service.archive(TableSink(), HORIZON, chunk_size=2) == 5
+
+    assert _live_names(db_session) == ["Upcoming 0", "Upcoming 1"]
+    archived = db_session.exec(
+        select(ArchivedReservation).order_by(ArchivedReservation.id)
+    ).all()
+    assert [row.customer_name for row in archived] == [f"Past {i}" for i in range(5)]
+    checkpoint = db_session.get(ArchiveCheckpoint, "table")
+    assert checkpoint.parts == 3
+    assert checkpoint.pending is None
+    db_session.refresh(table_fixture)
+    assert table_fixture.reservations_version > version
+
+    # A second run finds nothing left to move
+    assert service.archive(TableSink(), HORIZON, chunk_size=2) == 0
+
+
+def test_archive_stops_after_max_chunks(db_session: Session, table_fixture: Table):
+    """Test that an interrupted run resumes where it stopped."""
+    _seed(db_session, table_fixture)
+    service = ArchiveService(db_session)
+
+    assert service.archive(TableSink(), HORIZON, chunk_size=2, max_chunks=1) == 2
+    assert len(_live_names(db_session)) == 5
+    assert service.archive(TableSink(), HORIZON, chunk_size=2) == 3
+    assert len(_live_names(db_session)) == 2
+
+
+def test_archive_later_run_moves_long_reservation(
+    db_session: Session,
+    table_fixture: Table
+):
+    """Test that a reservation outlasting an archived one is moved later."""
+    start = datetime(2024, 12, 1, 12, 0)
+    db_session.add_all([
+        Reservation(
+            customer_name="Long",
+            table_id=table_fixture.id,
+            reservation_time=start,
+            duration_minutes=600
+        ),
+        Reservation(
+            customer_name="Short",
+            table_id=table_fixture.id,
+            reservation_time=start + timedelta(hours=1),
+            duration_minutes=60
+        ),
+    ])
+    db_session.commit()
+    service = ArchiveService(db_session)
+
+    assert service.archive(TableSink(), start + timedelta(hours=3)) == 1
+    assert _live_names(db_session) == ["Long"]
+    assert service.archive(TableSink(), start + timedelta(days=1)) == 1
+    assert _live_names(db_session) == []
+
+
+def test_archive_to_ndjson(db_session: Session, table_fixture: Table, tmp_path):
+    """Test that chunks are written as gzip-compressed NDJSON files."""
+    _seed(db_session, table_fixture)
+    sink = NDJSONSink(str(tmp_path))
+
+    assert ArchiveService(db_session).archive(sink, HORIZON, chunk_size=3) == 5
+
+    files = sorted(path.name for path in tmp_path.iterdir())
+    assert files == ["part-000000.ndjson.gz", "part-000001.ndjson.gz"]
+    names = []
+    for name in files:
+        with gzip.open(tmp_path / name, "rt") as file:
+            names.extend(json.loads(line)["customer_name"] for line in file)
+    assert names == [f"Past {i}" for i in range(5)]
+    assert _live_names(db_session) == ["Upcoming 0", "Upcoming 1"]
+
+
+def test_archive_finishes_pending_chunk(
+    db_session: Session,
+    table_fixture: Table,
+    tmp_path
+):
+    """Test that a chunk written before a crash is removed, not rewritten."""
+    past = _seed(db_session, table_fixture)
+    sink = NDJSONSink(str(tmp_path))
+    first = db_session.exec(
+        select(Reservation).where(Reservation.reservation_time == past)
+    ).one()
+    # State left by a run that wrote part 0 and stopped before removing it
+    db_session.add(ArchiveCheckpoint(
+        destination=sink.destination,
+        parts=1,
+        pending=json.dumps([first.id])
+    ))
+    db_session.commit()
+
+    assert ArchiveService(db_session).archive(sink, HORIZON, chunk_size=10) == 5
+
+    # Part 0 is not written again; the remaining four go to part 1
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["part-000001.ndjson.gz"]
+    with gzip.open(tmp_path / "part-000001.ndjson.gz", "rt") as file:
+        assert len(file.readlines()) == 4
+    assert _live_names(db_session) == ["Upcoming 0", "Upcoming 1"]
+
+
+def test_list_includes_archived(
+    client: TestClient,
+    db_session: Session,
+    table_fixture: Table
+):
+    """Test that include_archived pages over live and archived reservations."""
+    _seed(db_session, table_fixture)
+    ArchiveService(db_session).archive(TableSink(), HORIZON, chunk_size=2)
+
+    live = client.get("/api/v1/reservations/")
+    assert [row["customer_name"] for row in live.json()] == [
+        "Upcoming 0", "Upcoming 1"
+    ]
+
+    names = []
+    params = {"include_archived": True, "limit": 3}
+    while True:
+        response = client.get("/api/v1/reservations/", params=params)
+        assert response.status_code == 200
+        names.extend(row["customer_name"] for row in response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+        params["cursor"] = cursor
+    assert names == [f"Past {i}" for i in range(5)] + ["Upcoming 0", "Upcoming 1"]
+    assert response.json()[-1]["table"]["name"] == table_fixture.name
@@ -0,0 +1,102 @@
+import asyncio
+from datetime import datetime, timedelta, UTC
+from typing import AsyncGenerator, Generator
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import SQLModel, create_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.db.session import get_async_url, get_read_session, get_session
+from app.main import app
+
+
+@pytest.fixture
+def async_client(tmp_path) -> Generator[TestClient, None, None]:
+    url = f"sqlite:///{tmp_path / 'async.db'}"
+    sync_engine = create_engine(url)
+    SQLModel.metadata.create_all(sync_engine)
+    sync_engine.dispose()
+
+    async_engine = create_async_engine(get_async_url(url))
+
+    async def override_get_session() -> AsyncGenerator[AsyncSession, None]:
+        async with AsyncSession(async_engine, expire_on_commit=False) as session:
+            yield session
+
+    app.dependency_overrides[get_session] = override_get_session
+    app.dependency_overrides[get_read_session] = override_get_session
+    with TestClient(app) as test_client:
+        yield test_client
+        test_client.portal.call(async_engine.dispose)
+    app.dependency_overrides.clear()
+
+
+def test_get_async_url():
+    """Test mapping of blocking driver URLs to async drivers."""
+    assert get_async_url("postgresql://u:p@db/app") == (
+        "postgresql+asyncpg://u:p@db/app"
+    )
+    assert get_async_url("sqlite:///./test.db") == "sqlite+aiosqlite:///./test.db"
+
+
+def test_async_reservation_flow(async_client: TestClient):
+    """Test the table and reservation endpoints on an AsyncSession."""
+    response = async_client.post(
+        "/api/v1/tables/",
+        json={"name": "Async Table", "seats": 2, "location": "Terrace"}
+    )
+    assert response.status_code == 201
+    table_id = response.json()["id"]
+
+    reservation = {
+        "customer_name": "Async Customer",
+        "table_id": table_id,
+        "reservation_time": (datetime.now(UTC) + timedelta(days=1)).isoformat(),
+        "duration_minutes": 60
+    }
+    response = async_client.post("/api/v1/reservations/", json=reservation)
+    assert response.status_code == 201
+    data = response.json()
+    assert data["table"]["name"] == "Async Table"
+
+    # Overlapping booking is rejected
+    response = async_client.post("/api/v1/reservations/", json=reservation)
+    assert response.status_code == 400
+
+    response = async_client.get(f"/api/v1/reservations/table/{table_id}")
+    assert response.status_code == 200
+    assert len(response.json()) == 1
+
+    response = async_client.delete(f"/api/v1/reservations/{data['id']}")
+    assert response.status_code == 204
+
+
+def test_async_concurrent_bookings_for_one_table(async_client: TestClient):
+    """Test that concurrent bookings for one table wait without blocking the loop."""
+    response = async_client.post(
+        "/api/v1/tables/",
+        json={"name": "Busy Table", "seats": 2, "location": "Terrace"}
+    )
+    table_id = response.json()["id"]
+    start = datetime.now(UTC) + timedelta(days=1)
+
+    async def book_all():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            return await asyncio.gather(*(
+                client.post("/api/v1/reservations/", json={
+                    "customer_name": f"Guest {i}",
+                    "table_id": table_id,
+                    "reservation_time": (start + timedelta(hours=i)).isoformat(),
+                    "duration_minutes": 60
+                })
+                for i in range(5)
+            ))
+
+    responses = async_client.portal.call(book_all)
+    assert [r.status_code for r in responses] == [201] * 5
@@ -0,0 +1,108 @@
+import time
+from typing import Dict, Optional, Tuple
+
+import pytest
+
+from app.core.cache import CachedResponse, MemoryCache, RedisCache, ResponseCache
+from app.core.etag import etag_in
+
+
+class FakeRedis:
+    """Minimal in-memory stand-in for a redis-py client."""
+
+    def __init__(self) -> None:
+        self.data: Dict[str, Tuple[bytes, Optional[float]]] = {}
+
+    def get(self, key: str) -> Optional[bytes]:
+        value, expires_at = self.data.get(key, (None, None))
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self.data[key]
+            return None
+        return value
+
+    def set(self, key: str, value: bytes, ex: Optional[int] = None) -> None:
+        expires_at = time.monotonic() + ex if ex is not None else None
+        self.data[key] = (value, expires_at)
+
+    def incr(self, key: str) -> int:
+        value = int(self.get(key) or b"0") + 1
+        self.data[key] = (str(value).encode(), None)
+        return value
+
+
+class BrokenRedis(FakeRedis):
+    def get(self, key: str) -> Optional[bytes]:
+        raise ConnectionError("redis is down")
+
+
+def test_memory_cache_ttl_and_lru():
+    """Test entry expiry and eviction of the least recently used entry."""
+    cache = MemoryCache(max_entries=2)
+    cache.set("a", b"1", ttl=60)
+    cache.set("b", b"2", ttl=60)
+    assert cache.get("a") == b"1"
+    cache.set("c", b"3", ttl=60)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == b"1"
+
+    cache.set("short", b"4", ttl=0)
+    assert cache.get("short") is None
+
+
+@pytest.mark.parametrize(
+    "backend", [lambda: MemoryCache(), lambda: RedisCache(FakeRedis())]
+)
+def test_response_cache_invalidation(backend):
+    """Test that invalidate hides every entry of the namespace."""
+    cache = ResponseCache(backend(), "tables", ttl=60)
+    calls = []
+
+    def build() -> CachedResponse:
+        calls.append(1)
+        return CachedResponse.from_content({"version": len(calls)}, "next")
+
+    first = cache.get_or_set("page", build)
+    assert cache.get_or_set("page", build) == first
+    assert first.next_cursor == "next"
+    assert len(calls) == 1
+
+    cache.invalidate()
+    second = cache.get_or_set("page", build)
+    assert second.body == b'{"version":2}'
+    assert second.etag != first.etag
+
+
+def test_response_cache_does_not_store_stale_build():
+    """Test that a response built across an invalidation is not served."""
+    cache = ResponseCache(MemoryCache(), "tables", ttl=60)
+
+    def build_racing_a_write() -> CachedResponse:
+        cache.invalidate()
+        return CachedResponse.from_content("stale")
+
+    cache.get_or_set("page", build_racing_a_write)
+    fresh = cache.get_or_set("page", lambda: CachedResponse.from_content("fresh"))
+    assert fresh.body == b'"fresh"'
+
+
+def test_redis_errors_are_cache_misses():
+    """Test that a failing Redis server falls back to building responses."""
+    cache = ResponseCache(RedisCache(BrokenRedis()), "tables", ttl=60)
+    response = cache.get_or_set("page", lambda: CachedResponse.from_content([]))
+    assert response.body == b"[]"
+
+
+def test_etag_in():
+    """Test If-None-Match list parsing."""
+    assert etag_in('"a", W/"b"', '"b"')
+    assert etag_in("*", '"c"')
+    assert not etag_in('"a"', '"b"')
+    assert not etag_in(None, '"a"')
+
+
+def test_etag_in_strong():
+    """Test that strong comparison does not match weak validators."""
+    assert etag_in('"a", "b"', '"b"', weak=False)
+    assert etag_in("*", '"c"', weak=False)
+    assert not etag_in('W/"b"', '"b"', weak=False)
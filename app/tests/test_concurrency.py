@@ -0,0 +1,53 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, UTC
+
+from sqlmodel import Session, SQLModel, create_engine, func, select
+
+from app.models.table import Table
+from app.models.reservation import Reservation
+from app.schemas.reservation import ReservationCreate
+from app.services.reservation import ReservationService
+
+PARALLEL_BOOKINGS = 200
+
+
+def test_parallel_bookings_for_one_slot(tmp_path):
+    """Test that only one of many concurrent bookings for a slot succeeds."""
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'concurrency.db'}",
+        connect_args={"check_same_thread": False, "timeout": 30},
+        pool_size=32,
+        max_overflow=0
+    )
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        table = Table(name="Busy Table", seats=2)
+        session.add(table)
+        session.commit()
+        table_id = table.id
+
+    slot = datetime.now(UTC) + timedelta(days=1)
+
+    def book(i: int) -> bool:
+        with Session(engine) as session:
+            reservation = ReservationService(session).create(
+                ReservationCreate(
+                    customer_name=f"Guest {i}",
+                    table_id=table_id,
+                    reservation_time=slot + timedelta(minutes=i % 30),
+                    duration_minutes=60
+                )
+            )
+            return reservation is not None
+
+    with ThreadPoolExecutor(max_workers=32) as executor:
+        results = list(executor.map(book, range(PARALLEL_BOOKINGS)))
+
+    with Session(engine) as session:
+        stored = session.exec(
+            select(func.count()).select_from(Reservation)
+        ).one()
+
+    engine.dispose()
+    assert results.count(True) == 1
+    assert stored == 1
@@ -0,0 +1,185 @@
+import multiprocessing
+import os
+import socket
+import time
+from datetime import date, datetime
+from types import SimpleNamespace
+
+from app.core.invalidation import UnixSocketInvalidationBus
+
+DAY = date(2030, 1, 1)
+
+
+def _worker(connection) -> None:
+    """Run one worker process with the module-level caches and bus."""
+    from sqlalchemy.pool import StaticPool
+    from sqlmodel import Session, SQLModel, create_engine
+
+    from app.core.cache import CachedResponse, table_cache
+    from app.core.invalidation import invalidation_bus
+    from app.services.availability import availability_index
+
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    SQLModel.metadata.create_all(engine)
+    session = Session(engine)
+    builds = []
+
+    def build() -> CachedResponse:
+        builds.append(None)
+        return CachedResponse.from_content(len(builds))
+
+    def read() -> tuple:
+        body = table_cache.get_or_set("page", build).body
+        return body, availability_index.busy_masks(session, [DAY])[DAY]
+
+    invalidation_bus.start()
+    read()
+    connection.send("ready")
+    while True:
+        command = connection.recv()
+        if command == "write":
+            table_cache.invalidate()
+            availability_index.add(SimpleNamespace(
+                id=1,
+                table_id=7,
+                reservation_time=datetime(2030, 1, 1, 12, 0),
+                end_time=datetime(2030, 1, 1, 13, 0)
+            ))
+            connection.send("ok")
+        elif command == "read":
+            connection.send(read())
+        else:
+            invalidation_bus.stop()
+            connection.send("stopped")
+            return
+
+
+def test_workers_share_invalidations(tmp_path, monkeypatch):
+    """Test that a write on one worker evicts and updates the others' caches."""
+    # Read by the settings of the spawned workers
+    monkeypatch.setenv("INVALIDATION_BACKEND", "unix")
+    monkeypatch.setenv("INVALIDATION_SOCKET_DIR", str(tmp_path))
+    context = multiprocessing.get_context("spawn")
+    workers = []
+    for _ in range(3):
+        parent, child = context.Pipe()
+        process = context.Process(target=_worker, args=(child,), daemon=True)
+        process.start()
+        workers.append((process, parent))
+
+    try:
+        for _, connection in workers:
+            assert connection.poll(30)
+            assert connection.recv() == "ready"
+        assert len(list(tmp_path.glob("*.sock"))) == 3
+
+        writer = workers[0][1]
+        writer.send("write")
+        assert writer.recv() == "ok"
+
+        # Noon to one o'clock in 15-minute slots
+        expected = (b"2", {7: 0b1111 << 48})
+        for _, connection in workers:
+            deadline = time.monotonic() + 5
+            while True:
+                connection.send("read")
+                if connection.recv() == expected or time.monotonic() > deadline:
+                    break
+                time.sleep(0.05)
+            connection.send("read")
+            assert connection.recv() == expected
+    finally:
+        for process, connection in workers:
+            connection.send("stop")
+            connection.recv()
+            process.join(5)
+
+    assert list(tmp_path.glob("*.sock")) == []
+
+
+def test_unix_bus_removes_stale_sockets(tmp_path):
+    """Test that sockets of workers that died are cleaned up on send."""
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+    stale.bind(str(tmp_path / "1-dead.sock"))
+    stale.close()
+
+    bus = UnixSocketInvalidationBus(str(tmp_path))
+    bus.start()
+    try:
+        bus.publish("cache.tables")
+    finally:
+        bus.stop()
+
+    assert not os.path.exists(tmp_path / "1-dead.sock")
+
+
+def test_bus_ignores_own_messages():
+    """Test that a worker does not apply its own broadcasts twice."""
+    bus = UnixSocketInvalidationBus("/nonexistent")
+    received = []
+    bus.subscribe("cache.tables", received.append)
+
+    bus.receive('{"type": "cache.tables", "origin": "%s"}' % bus.origin)
+    bus.receive('{"type": "cache.tables", "origin": "other"}')
+    bus.receive("not json")
+
+    assert [message["origin"] for message in received] == ["other"]
+
+
+def test_reset_drops_caches(monkeypatch):
+    """Test that a reconnect of the bus drops every subscribed cache."""
+    from app.core.cache import CachedResponse, table_cache
+    from app.core.invalidation import PostgresInvalidationBus, invalidation_bus
+    from app.db.notify import PostgresListener
+
+    builds = []
+
+    def build() -> CachedResponse:
+        builds.append(None)
+        return CachedResponse.from_content(len(builds))
+
+    assert table_cache.get_or_set("page", build).body == b"1"
+    assert table_cache.get_or_set("page", build).body == b"1"
+    invalidation_bus.reset()
+    assert table_cache.get_or_set("page", build).body == b"2"
+
+    # The LISTEN transport resets the bus whenever it reconnects
+    monkeypatch.setattr(PostgresListener, "start", lambda self: None)
+    bus = PostgresInvalidationBus("test")
+    bus.start()
+    assert bus._listener.on_reconnect == bus.reset
+
+
+def test_unix_bus_requires_private_directory(tmp_path):
+    """Test that the bus refuses a socket directory other users can open."""
+    tmp_path.chmod(0o755)
+    bus = UnixSocketInvalidationBus(str(tmp_path))
+    try:
+        bus.start()
+    except RuntimeError:
+        pass
+    else:
+        bus.stop()
+        raise AssertionError("started in a shared directory")
+
+    created = tmp_path / "sockets"
+    bus = UnixSocketInvalidationBus(str(created))
+    bus.start()
+    bus.stop()
+    assert created.stat().st_mode & 0o777 == 0o700
+
+
+def test_unix_bus_send_does_not_block(tmp_path):
+    """Test that a peer that stopped reading does not stall publishers."""
+    peer = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+    peer.bind(str(tmp_path / "1-busy.sock"))
+    bus = UnixSocketInvalidationBus(str(tmp_path))
+    bus.start()
+    try:
+        started = time.monotonic()
+        for _ in range(50):
+            bus.publish("cache.tables")
+        assert time.monotonic() - started < 1
+    finally:
+        bus.stop()
+        peer.close()
@@ -0,0 +1,60 @@
+import socket
+import threading
+from types import SimpleNamespace
+from typing import List
+
+from app.core.config import settings
+from app.db.notify import PostgresListener
+
+
+class FakeConnection:
+    """Stands in for a psycopg2 connection that received one poll's worth."""
+
+    def __init__(self, payloads: List[str], drop: bool = False):
+        self._read, self._write = socket.socketpair()
+        self._write.send(b"x")
+        self.payloads = payloads
+        self.drop = drop
+        self.notifies: list = []
+        self.closed = False
+
+    def fileno(self) -> int:
+        return self._read.fileno()
+
+    def poll(self) -> None:
+        self._read.recv(1)
+        if self.drop:
+            raise OSError("server closed the connection unexpectedly")
+        self.notifies.extend(SimpleNamespace(payload=p) for p in self.payloads)
+
+    def close(self) -> None:
+        self.closed = True
+        self._read.close()
+        self._write.close()
+
+
+def test_listener_reconnects_after_dropped_connection(monkeypatch):
+    """Test that a dropped LISTEN connection is reopened and reported."""
+    monkeypatch.setattr(settings, "NOTIFY_RECONNECT_MAX_SECONDS", 0)
+    dropped = FakeConnection(["before"], drop=True)
+    reopened = FakeConnection(["after"])
+    connections = [dropped, reopened]
+    received = []
+    reconnected = threading.Event()
+    delivered = threading.Event()
+
+    def callback(payload: str) -> None:
+        received.append(payload)
+        delivered.set()
+
+    listener = PostgresListener("test", callback, on_reconnect=reconnected.set)
+    monkeypatch.setattr(listener, "_connect", lambda: connections.pop(0))
+    listener.start()
+    try:
+        assert reconnected.wait(5)
+        assert delivered.wait(5)
+    finally:
+        listener.stop()
+
+    assert received == ["after"]
+    assert dropped.closed and reopened.closed
@@ -0,0 +1,275 @@
+import os
+from datetime import date, datetime, timedelta
+from typing import Callable, Generator, List
+
+import pytest
+from sqlalchemy import event, insert, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session, SQLModel, create_engine
+
+from app.db.partitions import (
+    add_months,
+    attached_partitions,
+    is_missing_partition,
+    maintain_partitions,
+    month_start,
+    partition_month,
+    partition_name,
+    partition_reservations,
+    plan_partitions,
+    unpartition_reservations
+)
+from app.models.reservation import Reservation
+from app.models.table import Table
+from app.schemas.reservation import ReservationCreate
+from app.services.reservation import ReservationService
+
+TEST_POSTGRES_URL = os.environ.get("TEST_POSTGRES_URL")
+
+
+def test_month_arithmetic():
+    """Test month shifts across year boundaries and partition names."""
+    assert add_months(date(2026, 11, 1), 2) == date(2027, 1, 1)
+    assert add_months(date(2026, 1, 1), -1) == date(2025, 12, 1)
+    assert month_start(datetime(2026, 10, 18, 12, 30)) == date(2026, 10, 1)
+    assert partition_name(date(2026, 3, 1)) == "reservations_y2026m03"
+    assert partition_month("reservations_y2026m03") == date(2026, 3, 1)
+    assert partition_month("reservations_partitioned") is None
+
+
+def test_is_missing_partition():
+    """Test that a missing partition is told apart from a CHECK violation."""
+    class Orig(Exception):
+        pgcode = "23514"
+
+    missing = Orig('no partition of relation "reservations" found for row')
+    check = Orig('new row violates check constraint "ck_duration"')
+    assert is_missing_partition(IntegrityError("INSERT", {}, missing))
+    assert not is_missing_partition(IntegrityError("INSERT", {}, check))
+    assert not is_missing_partition(IntegrityError("INSERT", {}, Exception("x")))
+
+
+def test_plan_partitions():
+    """Test that missing future months are created and old ones detached."""
+    existing = [date(2024, 9, 1), date(2024, 10, 1), date(2026, 10, 1)]
+    create, detach = plan_partitions(existing, date(2026, 10, 18), ahead=2, retain=24)
+    assert create == [date(2026, 11, 1), date(2026, 12, 1)]
+    assert detach == [date(2024, 9, 1)]
+
+
+INDEXES = [
+    (index.name, [column.name for column in index.columns])
+    for index in Reservation.__table__.indexes
+]
+
+
+@pytest.fixture
+def pg_engine() -> Generator[Engine, None, None]:
+    """Scratch PostgreSQL database with the plain schema; skipped unless
+    TEST_POSTGRES_URL is set."""
+    if not TEST_POSTGRES_URL:
+        pytest.skip("TEST_POSTGRES_URL is not set")
+    engine = create_engine(TEST_POSTGRES_URL)
+    SQLModel.metadata.create_all(engine)
+    try:
+        yield engine
+    finally:
+        with engine.begin() as connection:
+            names = connection.execute(text(
+                "SELECT tablename FROM pg_tables WHERE tablename LIKE 'reservations_y%'"
+            )).scalars().all()
+            for name in names:
+                connection.execute(text(f"DROP TABLE IF EXISTS {name}"))
+        SQLModel.metadata.drop_all(engine)
+        engine.dispose()
+
+
+@pytest.fixture
+def pg_session(pg_engine: Engine) -> Generator[Session, None, None]:
+    """Session on the scratch database with partitioned reservations."""
+    with pg_engine.begin() as connection:
+        partition_reservations(connection, INDEXES, ahead=6)
+    with Session(pg_engine) as session:
+        yield session
+
+
+def explain(session: Session, call: Callable[[], object]) -> List[str]:
+    """Run ``call`` and return the EXPLAIN output of its SELECTs."""
+    executed = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, *args):
+        if statement.lstrip().upper().startswith("SELECT"):
+            executed.append((statement, parameters))
+
+    engine = session.get_bind()
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        call()
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    cursor = session.connection().connection.cursor()
+    plan = []
+    for statement, parameters in executed:
+        cursor.execute(f"EXPLAIN {statement}", parameters)
+        plan.extend(row[0] for row in cursor.fetchall())
+    return plan
+
+
+def scanned_partitions(plan: List[str]) -> List[str]:
+    return sorted({
+        word for line in plan for word in line.split()
+        if partition_month(word) is not None
+    })
+
+
+def _seed(session: Session) -> int:
+    table = Table(name="Partitioned", seats=4)
+    session.add(table)
+    session.commit()
+    start = datetime.combine(
+        add_months(month_start(date.today()), 1), datetime.min.time()
+    )
+    now = datetime.utcnow()
+    session.execute(insert(Reservation), [
+        {
+            "table_id": table.id,
+            "customer_name": f"Guest {i}",
+            "reservation_time": start + timedelta(hours=6 * i),
+            "duration_minutes": 60,
+            "end_time": start + timedelta(hours=6 * i, minutes=60),
+            "created_at": now,
+            "updated_at": now,
+        }
+        for i in range(4 * 150)
+    ])
+    session.commit()
+    session.execute(text("ANALYZE reservations"))
+    return table.id
+
+
+def test_conflict_check_prunes_partitions(pg_session: Session):
+    """Test that the conflict check only reads the partition of its month."""
+    table_id = _seed(pg_session)
+    month = add_months(month_start(date.today()), 2)
+    slot = datetime(month.year, month.month, 15, 19, 0)
+
+    service = ReservationService(pg_session)
+    plan = explain(
+        pg_session, lambda: service.check_time_conflict(table_id, slot, 60)
+    )
+    assert scanned_partitions(plan) == [partition_name(month)], plan
+
+
+def test_page_by_time_range_prunes_partitions(pg_session: Session):
+    """Test that a time-range page only reads the partitions in the range."""
+    table_id = _seed(pg_session)
+    month = add_months(month_start(date.today()), 2)
+
+    plan = explain(pg_session, lambda: ReservationService(pg_session).get_page_rows(
+        100,
+        start=datetime(month.year, month.month, 1),
+        end=datetime(month.year, month.month, 20),
+        table_id=table_id
+    ))
+    assert scanned_partitions(plan) == [partition_name(month)], plan
+
+
+def test_maintenance_creates_and_detaches(pg_session: Session):
+    """Test that maintenance keeps the window of attached partitions."""
+    current = month_start(date.today())
+    connection = pg_session.get_bind().connect()
+    try:
+        created, detached = maintain_partitions(
+            connection, today=add_months(current, 3), ahead=6, retain=1
+        )
+        attached = attached_partitions(connection)
+    finally:
+        connection.close()
+
+    assert created == [add_months(current, i) for i in range(7, 10)]
+    assert detached == [current, add_months(current, 1)]
+    assert attached == [add_months(current, i) for i in range(2, 10)]
+
+
+def test_conversion_keeps_rows_and_round_trips(pg_engine: Engine):
+    """Test converting a populated table to partitions and back."""
+    now = datetime.utcnow()
+    with pg_engine.begin() as connection:
+        table_id = connection.execute(insert(Table).returning(Table.id), {
+            "name": "Converted", "seats": 4, "location": "Main Hall",
+            "created_at": now, "updated_at": now,
+        }).scalar_one()
+        # An old month, a booking across a month end and one far ahead
+        starts = [
+            datetime(2020, 3, 10, 19, 0),
+            datetime.combine(
+                add_months(month_start(date.today()), 1), datetime.min.time()
+            ) - timedelta(minutes=30),
+            datetime.combine(
+                add_months(month_start(date.today()), 30), datetime.min.time()
+            ),
+        ]
+        connection.execute(insert(Reservation), [
+            {
+                "table_id": table_id,
+                "customer_name": f"Guest {i}",
+                "reservation_time": start,
+                "duration_minutes": 60,
+                "end_time": start + timedelta(minutes=60),
+                "created_at": now,
+                "updated_at": now,
+            }
+            for i, start in enumerate(starts)
+        ])
+
+    def rows() -> list:
+        with pg_engine.connect() as connection:
+            return connection.execute(text(
+                "SELECT id, reservation_time, tableoid::regclass::text "
+                "FROM reservations ORDER BY id"
+            )).all()
+
+    before = rows()
+    with pg_engine.begin() as connection:
+        partition_reservations(connection, INDEXES, ahead=6)
+    after = rows()
+    assert [row[:2] for row in after] == [row[:2] for row in before]
+    assert [row[2] for row in after] == [
+        partition_name(month_start(start)) for start in starts
+    ]
+
+    with Session(pg_engine) as session:
+        service = ReservationService(session)
+        # The ID sequence carries on, and overlaps are still rejected
+        created = service.create(ReservationCreate(
+            customer_name="After",
+            table_id=table_id,
+            reservation_time=starts[2] + timedelta(hours=2),
+            duration_minutes=60
+        ))
+        assert created.id > before[-1][0]
+        assert service.create(ReservationCreate(
+            customer_name="Overlap",
+            table_id=table_id,
+            reservation_time=starts[2] + timedelta(hours=2, minutes=30),
+            duration_minutes=60
+        )) is None
+
+    with pg_engine.begin() as connection:
+        unpartition_reservations(connection, INDEXES)
+    restored = rows()
+    assert [row[:2] for row in restored[:-1]] == [row[:2] for row in before]
+    assert {row[2] for row in restored} == {"reservations"}
+    with pg_engine.connect() as connection:
+        constraints = connection.execute(text(
+            "SELECT conname FROM pg_constraint "
+            "WHERE conrelid = 'reservations'::regclass AND contype <> 'n' "
+            "ORDER BY conname"
+        )).scalars().all()
+    assert constraints == [
+        "reservations_no_overlap",
+        "reservations_pkey",
+        "reservations_table_id_fkey",
+    ]
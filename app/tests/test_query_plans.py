@@ -0,0 +1,121 @@
+from datetime import datetime, timedelta
+from typing import Callable, Generator, List, Tuple
+
+import pytest
+from sqlalchemy import event, insert, text
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine
+
+from app.models.reservation import Reservation
+from app.models.table import Table
+from app.services.reservation import ReservationService
+from app.services.table import TableService
+
+
+@pytest.fixture
+def session() -> Generator[Session, None, None]:
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        tables = [Table(name=f"Table {i}", seats=2 + i % 6) for i in range(20)]
+        session.add_all(tables)
+        session.commit()
+        start = datetime(2030, 1, 1, 12, 0)
+        now = datetime.utcnow()
+        session.execute(insert(Reservation), [
+            {
+                "table_id": table.id,
+                "customer_name": f"Guest {i}",
+                "reservation_time": start + timedelta(hours=i),
+                "duration_minutes": 60,
+                "end_time": start + timedelta(hours=i + 1),
+                "created_at": now,
+                "updated_at": now,
+            }
+            for table in tables
+            for i in range(50)
+        ])
+        session.commit()
+        session.execute(text("ANALYZE"))
+        yield session
+    engine.dispose()
+
+
+def query_plan(session: Session, call: Callable[[], object]) -> List[str]:
+    """Run ``call`` and return the EXPLAIN QUERY PLAN of its SELECTs."""
+    executed: List[Tuple[str, tuple]] = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, *args):
+        if statement.lstrip().upper().startswith("SELECT"):
+            executed.append((statement, parameters))
+
+    engine = session.get_bind()
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        call()
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    connection = session.connection().connection.driver_connection
+    return [
+        row[3]
+        for statement, parameters in executed
+        for row in connection.execute(f"EXPLAIN QUERY PLAN {statement}", parameters)
+    ]
+
+
+# Either composite index answers an overlap check with a range scan over
+# one table's reservations near the window; which one depends on the data.
+OVERLAP_SEARCHES = (
+    "USING COVERING INDEX ix_reservations_table_id_end_time_reservation_time"
+    " (table_id=? AND end_time>?)",
+    "USING INDEX ix_reservations_table_id_reservation_time_id"
+    " (table_id=? AND reservation_time>? AND reservation_time<?)",
+)
+
+
+def uses_overlap_search(plan: List[str]) -> bool:
+    return any(
+        step.startswith("SEARCH reservations") and search in step
+        for step in plan
+        for search in OVERLAP_SEARCHES
+    )
+
+
+def test_conflict_check_uses_index(session: Session):
+    """Test that the conflict check is an index range scan."""
+    plan = query_plan(session, lambda: ReservationService(session).check_time_conflict(
+        1, datetime(2030, 1, 2, 12, 0), 60
+    ))
+    assert uses_overlap_search(plan), plan
+
+
+def test_available_tables_use_index(session: Session):
+    """Test that the availability anti-join probes an index per table
+    instead of scanning reservations."""
+    plan = query_plan(session, lambda: TableService(session).get_available_tables(
+        4, start=datetime(2030, 1, 2, 12, 0)
+    ))
+    assert uses_overlap_search(plan), plan
+    assert not any(step.startswith("SCAN reservations") for step in plan), plan
+
+
+def test_table_time_range_uses_composite_index(session: Session):
+    """Test that a table's reservations in a time range come from one index
+    range scan, already in page order."""
+    plan = query_plan(session, lambda: ReservationService(session).get_page_rows(
+        100,
+        start=datetime(2030, 1, 1, 18, 0),
+        end=datetime(2030, 1, 2, 18, 0),
+        table_id=3
+    ))
+    assert any(
+        "USING INDEX ix_reservations_table_id_reservation_time_id"
+        " (table_id=? AND reservation_time>? AND reservation_time<?)" in step
+        for step in plan
+    ), plan
+    assert not any("TEMP B-TREE" in step for step in plan), plan
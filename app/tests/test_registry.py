@@ -0,0 +1,57 @@
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import SQLModel, create_engine
+
+from app.core.config import settings
+from app.db.registry import EngineRegistry, engine_registry
+from app.main import app
+
+REQUESTS = 10_000
+
+
+def test_registry_lifecycle(tmp_path):
+    """Test that engines are created once and forgotten after dispose."""
+    registry = EngineRegistry()
+    primary = registry.register("primary", f"sqlite:///{tmp_path / 'a.db'}")
+    replica = registry.register("replica", f"sqlite:///{tmp_path / 'b.db'}")
+
+    assert registry.get("primary") is primary
+    assert registry.get("replica") is replica
+    assert registry.register("primary", "sqlite://") is primary
+    assert set(registry.pool_stats()) == {"primary", "replica"}
+
+    asyncio.run(registry.dispose())
+
+    assert not registry.has("primary")
+    with pytest.raises(RuntimeError):
+        registry.get("primary")
+
+
+def test_connection_count_constant_across_requests(tmp_path, monkeypatch):
+    """Test that requests reuse pooled connections instead of opening new ones."""
+    url = f"sqlite:///{tmp_path / 'registry.db'}"
+    schema_engine = create_engine(url)
+    SQLModel.metadata.create_all(schema_engine)
+    schema_engine.dispose()
+    monkeypatch.setattr(settings, "SQLALCHEMY_DATABASE_URI", url)
+
+    with TestClient(app) as client:
+        engine = engine_registry.get("primary")
+        assert str(engine.url) == url
+
+        for _ in range(100):
+            assert client.get("/api/v1/reservations/").status_code == 200
+        warm = engine_registry.get_metrics("primary").snapshot()
+
+        for _ in range(REQUESTS):
+            assert client.get("/api/v1/reservations/").status_code == 200
+        stats = engine_registry.get_metrics("primary").snapshot()
+
+        assert engine_registry.get("primary") is engine
+
+    assert stats["connects"] == warm["connects"]
+    assert stats["checkouts"] >= warm["checkouts"] + REQUESTS
+    assert stats["checked_out"] == 0
+    assert not engine_registry.has("primary")
@@ -0,0 +1,70 @@
+from fastapi.testclient import TestClient
+from sqlmodel import Session, SQLModel, create_engine
+
+from app.core.config import Settings, settings
+from app.db.routing import STICKY_COOKIE
+from app.main import app
+from app.models.table import Table
+
+
+def _create_database(url: str) -> None:
+    engine = create_engine(url)
+    SQLModel.metadata.create_all(engine)
+    engine.dispose()
+
+
+def _available_tables(client: TestClient) -> list:
+    response = client.get(
+        "/api/v1/availability/",
+        params={"seats": 1, "start": "2030-01-01T19:00:00"}
+    )
+    return [table["name"] for table in response.json()]
+
+
+def test_replica_uri_accepts_any_sqlalchemy_url():
+    """Test that the replica URI is not limited to PostgreSQL schemes."""
+    url = "sqlite+aiosqlite:///replica.db"
+    assert Settings(SQLALCHEMY_REPLICA_URI=url).SQLALCHEMY_REPLICA_URI == url
+
+
+def test_reads_use_replica_until_client_writes(tmp_path, monkeypatch):
+    """Test replica routing for GET routes and read-your-writes stickiness."""
+    primary_url = f"sqlite:///{tmp_path / 'primary.db'}"
+    replica_url = f"sqlite:///{tmp_path / 'replica.db'}"
+    _create_database(primary_url)
+    _create_database(replica_url)
+
+    # A row that only exists on the replica shows which database served a read
+    replica = create_engine(replica_url)
+    with Session(replica) as session:
+        session.add(Table(name="Replica Table", seats=2))
+        session.commit()
+    replica.dispose()
+
+    monkeypatch.setattr(settings, "SQLALCHEMY_DATABASE_URI", primary_url)
+    monkeypatch.setattr(settings, "SQLALCHEMY_REPLICA_URI", replica_url)
+    monkeypatch.setattr(settings, "DB_READ_YOUR_WRITES_SECONDS", 60)
+
+    with TestClient(app) as client, TestClient(app) as other_client:
+        assert _available_tables(client) == ["Replica Table"]
+
+        response = client.post(
+            "/api/v1/tables/", json={"name": "Primary Table", "seats": 4}
+        )
+        assert response.status_code == 201
+        assert STICKY_COOKIE in response.cookies
+
+        # The writer reads its own write from the primary
+        assert _available_tables(client) == ["Primary Table"]
+        table_id = response.json()["id"]
+        assert client.get(f"/api/v1/tables/{table_id}").status_code == 200
+
+        # Other clients keep reading from the replica
+        assert _available_tables(other_client) == ["Replica Table"]
+
+
+def test_failed_write_does_not_pin_to_primary(client: TestClient):
+    """Test that only successful writes open the read-your-writes window."""
+    response = client.put("/api/v1/tables/999", json={"seats": 2})
+    assert response.status_code == 404
+    assert STICKY_COOKIE not in response.cookies
@@ -0,0 +1,137 @@
+from datetime import datetime, timedelta
+
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from app.models.reservation import Reservation
+from app.models.table import Table
+from app.services.seating import SeatingIndex, SeatingService
+
+LOCATION = "Терраса"
+EVENING = datetime(2030, 1, 1, 19, 0)
+
+
+def _tables(db_session: Session, *seats: int) -> list:
+    tables = [
+        Table(name=f"Seating {i}", seats=count, location=LOCATION)
+        for i, count in enumerate(seats)
+    ]
+    db_session.add_all(tables)
+    db_session.commit()
+    return tables
+
+
+def _book(db_session: Session, table: Table, start: datetime, minutes: int) -> None:
+    db_session.add(Reservation(
+        customer_name="Booked",
+        table_id=table.id,
+        reservation_time=start,
+        duration_minutes=minutes
+    ))
+    db_session.commit()
+
+
+def _rank(db_session: Session, party_size: int, start: datetime = EVENING) -> list:
+    return SeatingService(db_session, index=SeatingIndex()).rank_tables(
+        party_size, start, 60, location=LOCATION, limit=100
+    )
+
+
+def test_rank_prefers_fewest_wasted_seats(db_session: Session):
+    """Test that a couple gets a 2-top before any larger table."""
+    eight, two, four = _tables(db_session, 8, 2, 4)
+
+    assert _rank(db_session, 2) == [two.id, four.id, eight.id]
+    assert _rank(db_session, 3) == [four.id, eight.id]
+    assert _rank(db_session, 9) == []
+
+
+def test_rank_skips_booked_tables(db_session: Session):
+    """Test that a table booked over the window is not offered."""
+    small, large = _tables(db_session, 2, 4)
+    _book(db_session, small, EVENING - timedelta(minutes=30), 60)
+
+    assert _rank(db_session, 2) == [large.id]
+
+
+def test_rank_avoids_fragmenting_free_time(db_session: Session):
+    """Test that a booking fills a gap rather than leaving an orphan one."""
+    snug, loose, empty = _tables(db_session, 2, 2, 2)
+    # Booking right after an existing one leaves no gap on snug; on loose
+    # it would leave 30 minutes nobody can book
+    _book(db_session, snug, EVENING - timedelta(hours=2), 120)
+    _book(db_session, loose, EVENING - timedelta(hours=2), 90)
+
+    assert _rank(db_session, 2) == [snug.id, empty.id, loose.id]
+
+
+def test_create_assigns_table(client: TestClient, db_session: Session):
+    """Test that a reservation without table_id gets the best-fitting table."""
+    eight, two = _tables(db_session, 8, 2)
+    body = {
+        "customer_name": "Walk-in",
+        "party_size": 2,
+        "location": LOCATION,
+        "reservation_time": EVENING.isoformat(),
+        "duration_minutes": 60,
+    }
+
+    first = client.post("/api/v1/reservations/", json=body)
+    assert first.status_code == 201
+    assert first.json()["table_id"] == two.id
+
+    second = client.post("/api/v1/reservations/", json=body)
+    assert second.status_code == 201
+    assert second.json()["table_id"] == eight.id
+
+    third = client.post("/api/v1/reservations/", json=body)
+    assert third.status_code == 400
+    assert "No free table" in third.json()["detail"]
+
+
+def test_create_assigns_table_for_offset_time(
+    client: TestClient,
+    db_session: Session
+):
+    """Test that tables are ranked for the same UTC window that is booked."""
+    eight, two = _tables(db_session, 8, 2)
+    _book(db_session, two, EVENING - timedelta(minutes=30), 60)
+
+    # 19:00+02:00 is 17:00 UTC: the 2-top is free then
+    response = client.post("/api/v1/reservations/", json={
+        "customer_name": "Walk-in",
+        "party_size": 2,
+        "location": LOCATION,
+        "reservation_time": "2030-01-01T19:00:00+02:00",
+        "duration_minutes": 60,
+    })
+    assert response.status_code == 201
+    assert response.json()["table_id"] == two.id
+    assert response.json()["reservation_time"] == "2030-01-01T17:00:00"
+
+
+def test_create_requires_table_or_party_size(client: TestClient):
+    """Test that a reservation needs a table_id or a party_size."""
+    response = client.post(
+        "/api/v1/reservations/",
+        json={
+            "customer_name": "Walk-in",
+            "reservation_time": EVENING.isoformat(),
+            "duration_minutes": 60,
+        }
+    )
+    assert response.status_code == 422
+
+
+def test_bulk_requires_table_id(client: TestClient):
+    """Test that bulk items are not auto-assigned."""
+    response = client.post(
+        "/api/v1/reservations/bulk",
+        json={"items": [{
+            "customer_name": "Walk-in",
+            "party_size": 2,
+            "reservation_time": EVENING.isoformat(),
+            "duration_minutes": 60,
+        }]}
+    )
+    assert response.status_code == 422
@@ -0,0 +1,140 @@
+from contextlib import contextmanager
+from datetime import datetime, timedelta, UTC
+
+import pytest
+from sqlalchemy import update
+from sqlmodel import Session
+
+from app.core.etag import PreconditionFailed
+from app.models.table import Table
+from app.models.reservation import Reservation
+from app.schemas.reservation import ReservationCreate, ReservationUpdate
+from app.services.reservation import ReservationService
+
+
+def _add_reservation(
+    db_session: Session,
+    table: Table,
+    start: datetime,
+    duration_minutes: int = 60
+) -> Reservation:
+    reservation = Reservation(
+        customer_name="Test Customer",
+        reservation_time=start,
+        duration_minutes=duration_minutes,
+        table_id=table.id
+    )
+    db_session.add(reservation)
+    db_session.commit()
+    db_session.refresh(reservation)
+    return reservation
+
+
+def test_end_time_is_stored(db_session: Session, table_fixture: Table):
+    """Test that end_time is derived from start and duration on insert."""
+    start = datetime(2030, 1, 1, 19, 0)
+    reservation = _add_reservation(db_session, table_fixture, start, 90)
+
+    assert reservation.end_time == start + timedelta(minutes=90)
+
+
+def test_check_time_conflict_overlaps(db_session: Session, table_fixture: Table):
+    """Test overlap detection against existing reservations."""
+    start = datetime(2030, 1, 1, 19, 0)
+    _add_reservation(db_session, table_fixture, start, 60)
+    service = ReservationService(db_session)
+
+    # Starts inside the existing reservation
+    assert service.check_time_conflict(
+        table_fixture.id, start + timedelta(minutes=30), 60
+    )
+    # Ends inside the existing reservation
+    assert service.check_time_conflict(
+        table_fixture.id, start - timedelta(minutes=30), 60
+    )
+    # Fully contains the existing reservation
+    assert service.check_time_conflict(
+        table_fixture.id, start - timedelta(minutes=30), 120
+    )
+    # Back-to-back reservations do not conflict
+    assert not service.check_time_conflict(
+        table_fixture.id, start + timedelta(minutes=60), 60
+    )
+    assert not service.check_time_conflict(
+        table_fixture.id, start - timedelta(minutes=60), 60
+    )
+
+
+def test_check_time_conflict_excludes_reservation(
+    db_session: Session,
+    table_fixture: Table
+):
+    """Test that a reservation does not conflict with itself on update."""
+    start = datetime(2030, 1, 1, 19, 0)
+    reservation = _add_reservation(db_session, table_fixture, start, 60)
+    service = ReservationService(db_session)
+
+    assert not service.check_time_conflict(
+        table_fixture.id, start, 90, exclude_id=reservation.id
+    )
+
+
+def test_update_recomputes_end_time(db_session: Session, table_fixture: Table):
+    """Test that changing the duration moves the stored end_time."""
+    start = datetime.now(UTC) + timedelta(days=1)
+    reservation = _add_reservation(db_session, table_fixture, start, 60)
+    service = ReservationService(db_session)
+
+    updated = service.update(
+        reservation.id, ReservationUpdate(duration_minutes=120)
+    )
+
+    assert updated.end_time == updated.reservation_time + timedelta(minutes=120)
+
+
+def test_update_detects_concurrent_change(db_session: Session, table_fixture: Table):
+    """Test that an update loses to a change committed after it loaded the row."""
+    reservation = _add_reservation(
+        db_session, table_fixture, datetime(2030, 1, 1, 19, 0)
+    )
+    db_session.execute(
+        update(Reservation)
+        .where(Reservation.id == reservation.id)
+        .values(updated_at=datetime(2030, 1, 1))
+        .execution_options(synchronize_session=False)
+    )
+
+    with pytest.raises(PreconditionFailed):
+        ReservationService(db_session).update(
+            reservation.id, ReservationUpdate(customer_name="Late")
+        )
+
+
+def test_writes_are_stamped_after_the_table_lock(
+    db_session: Session,
+    table_fixture: Table,
+    monkeypatch
+):
+    """Test that a wait for the table lock does not age a row's updated_at."""
+    acquired = []
+
+    @contextmanager
+    def recording_lock(session, table_id):
+        acquired.append(datetime.utcnow())
+        yield
+
+    monkeypatch.setattr("app.services.reservation.table_lock", recording_lock)
+    service = ReservationService(db_session)
+
+    reservation = service.create(ReservationCreate(
+        customer_name="Stamped",
+        table_id=table_fixture.id,
+        reservation_time=datetime(2030, 1, 1, 19, 0),
+        duration_minutes=60
+    ))
+    assert reservation.updated_at >= acquired[-1]
+
+    updated = service.update(
+        reservation.id, ReservationUpdate(duration_minutes=90)
+    )
+    assert updated.updated_at >= acquired[-1]
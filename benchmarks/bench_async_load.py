@@ -0,0 +1,98 @@
+"""
+Load benchmark comparing the sync and async database engines.
+
+Starts the API under uvicorn once per DB_ENGINE setting, fires requests at
+GET /api/v1/tables/ from a fixed number of concurrent clients and reports
+requests per second and latency percentiles. Needs a reachable PostgreSQL
+database (SQLALCHEMY_DATABASE_URI or POSTGRES_* settings) with the schema
+migrated.
+
+Usage:
+    python -m benchmarks.bench_async_load [--clients 500] [--requests 20000]
+"""
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import time
+from typing import List
+
+import httpx
+
+PATH = "/api/v1/tables/"
+
+
+async def wait_ready(base_url: str, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient(base_url=base_url) as client:
+        while time.monotonic() < deadline:
+            try:
+                await client.get("/")
+                return
+            except httpx.TransportError:
+                await asyncio.sleep(0.2)
+    raise RuntimeError(f"Server at {base_url} did not start")
+
+
+async def fire(base_url: str, clients: int, total: int) -> List[float]:
+    """Send ``total`` requests from ``clients`` concurrent workers."""
+    latencies: List[float] = []
+    remaining = iter(range(total))
+    limits = httpx.Limits(max_connections=clients, max_keepalive_connections=clients)
+
+    async with httpx.AsyncClient(
+        base_url=base_url, limits=limits, timeout=60.0
+    ) as client:
+        async def worker() -> None:
+            for _ in remaining:
+                started = time.perf_counter()
+                response = await client.get(PATH)
+                response.raise_for_status()
+                latencies.append(time.perf_counter() - started)
+
+        await asyncio.gather(*(worker() for _ in range(clients)))
+    return latencies
+
+
+def run(mode: str, port: int, clients: int, total: int) -> None:
+    env = dict(os.environ, DB_ENGINE=mode, LOG_LEVEL="WARNING")
+    server = subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "app.main:app",
+            "--port", str(port), "--log-level", "warning",
+        ],
+        env=env
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        asyncio.run(wait_ready(base_url))
+        asyncio.run(fire(base_url, clients, min(total, clients)))  # warm-up
+        started = time.perf_counter()
+        latencies = sorted(asyncio.run(fire(base_url, clients, total)))
+        elapsed = time.perf_counter() - started
+    finally:
+        server.terminate()
+        server.wait()
+
+    p50 = latencies[len(latencies) // 2] * 1000
+    p99 = latencies[int(len(latencies) * 0.99) - 1] * 1000
+    print(
+        f"{mode:>6} | {total / elapsed:>10.0f} | {p50:>8.1f} | {p99:>8.1f}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--clients", type=int, default=500)
+    parser.add_argument("--requests", type=int, default=20_000)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    print(f"{'engine':>6} | {'req/s':>10} | {'p50 ms':>8} | {'p99 ms':>8}")
+    for mode in ("sync", "async"):
+        run(mode, args.port, args.clients, args.requests)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+Benchmark for the availability search.
+
+Seeds 1k tables with 1M reservations (about a thousand per table, in
+staggered two-hour slots) and measures the anti-join query used by
+TableService.get_available_tables against the client-side approach it
+replaces: loading every table and every reservation and computing free
+tables in Python.
+
+Usage:
+    python -m benchmarks.bench_availability [--tables 1000] [--reservations 1000000]
+"""
+import argparse
+import random
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import insert
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine, select
+
+from app.models.reservation import Reservation
+from app.models.table import Table
+from app.services.table import TableService
+
+REPEAT = 20
+LOCATIONS = ["Main Hall", "Window", "Garden", "Terrace"]
+
+
+def seed(session: Session, tables: int, reservations: int) -> datetime:
+    now = datetime.utcnow()
+    session.execute(
+        insert(Table),
+        [
+            {
+                "name": f"Table {i}",
+                "seats": random.choice([2, 2, 4, 4, 4, 6, 8]),
+                "location": LOCATIONS[i % len(LOCATIONS)],
+                "created_at": now,
+                "updated_at": now,
+            }
+            for i in range(tables)
+        ]
+    )
+
+    # Every table gets a 90-minute booking every two hours, staggered by
+    # table so that roughly a quarter of the tables is free at any time.
+    origin = datetime(2029, 1, 1, 12, 0)
+    batch = []
+    for i in range(reservations):
+        table_id = i % tables + 1
+        reservation_time = origin + timedelta(
+            hours=2 * (i // tables), minutes=30 * (table_id % 4)
+        )
+        batch.append({
+            "table_id": table_id,
+            "customer_name": f"Guest {i}",
+            "reservation_time": reservation_time,
+            "duration_minutes": 90,
+            "end_time": reservation_time + timedelta(minutes=90),
+            "created_at": now,
+            "updated_at": now,
+        })
+        if len(batch) == 20_000:
+            session.execute(insert(Reservation), batch)
+            batch = []
+    if batch:
+        session.execute(insert(Reservation), batch)
+    session.commit()
+    # Query a slot in the middle of the booked range
+    return origin + timedelta(
+        hours=2 * (reservations // tables // 2), minutes=90
+    )
+
+
+def client_side(session: Session, seats: int, start: datetime, duration: int) -> list:
+    end = start + timedelta(minutes=duration)
+    busy = set()
+    for reservation in session.exec(select(Reservation)):
+        if reservation.reservation_time < end and reservation.end_time > start:
+            busy.add(reservation.table_id)
+    return [
+        table for table in session.exec(select(Table))
+        if table.seats >= seats and table.id not in busy
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tables", type=int, default=1000)
+    parser.add_argument("--reservations", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    random.seed(42)
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        slot = seed(session, args.tables, args.reservations)
+        service = TableService(session)
+
+        started = time.perf_counter()
+        for _ in range(REPEAT):
+            free = service.get_available_tables(4, start=slot, duration_minutes=30)
+        query_ms = (time.perf_counter() - started) / REPEAT * 1000
+
+        started = time.perf_counter()
+        expected = client_side(session, 4, slot, 30)
+        session.expunge_all()
+        client_ms = (time.perf_counter() - started) * 1000
+
+    assert {table.id for table in free} == {table.id for table in expected}
+    print(
+        f"{args.tables} tables, {args.reservations} reservations, "
+        f"{len(free)} free tables"
+    )
+    print(f"{'anti-join query':>20} | {query_ms:>10.2f} ms")
+    print(f"{'client-side scan':>20} | {client_ms:>10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
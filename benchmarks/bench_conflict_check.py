@@ -0,0 +1,85 @@
+"""
+Benchmark for ReservationService.check_time_conflict.
+
+Seeds a single table with a growing history of past reservations and measures
+the average time of a conflict check for an upcoming slot. With the stored
+end_time and the (table_id, end_time, reservation_time) index the timings
+should stay flat as the history grows.
+
+Usage:
+    python -m benchmarks.bench_conflict_check [--sizes 1000 10000 100000]
+"""
+import argparse
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import insert
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine
+
+from app.models.reservation import Reservation
+from app.models.table import Table
+from app.services.reservation import ReservationService
+
+CHECKS = 1000
+
+
+def seed(session: Session, table_id: int, size: int) -> None:
+    """Insert ``size`` back-to-back past reservations for one table."""
+    start = datetime(2020, 1, 1, 12, 0)
+    now = datetime.utcnow()
+    rows = [
+        {
+            "table_id": table_id,
+            "customer_name": f"Guest {i}",
+            "reservation_time": start + timedelta(hours=i),
+            "duration_minutes": 60,
+            "end_time": start + timedelta(hours=i + 1),
+            "created_at": now,
+            "updated_at": now,
+        }
+        for i in range(size)
+    ]
+    session.execute(insert(Reservation), rows)
+    session.commit()
+
+
+def run(size: int) -> float:
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        table = Table(name="Bench", seats=4)
+        session.add(table)
+        session.commit()
+        seed(session, table.id, size)
+
+        service = ReservationService(session)
+        slot = datetime(2030, 1, 1, 19, 0)
+        started = time.perf_counter()
+        for i in range(CHECKS):
+            service.check_time_conflict(
+                table.id, slot + timedelta(minutes=i), 60
+            )
+        elapsed = time.perf_counter() - started
+    engine.dispose()
+    return elapsed / CHECKS * 1_000_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000]
+    )
+    args = parser.parse_args()
+
+    print(f"{'history rows':>12} | {'us per check':>12}")
+    for size in args.sizes:
+        print(f"{size:>12} | {run(size):>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
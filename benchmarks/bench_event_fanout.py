@@ -0,0 +1,83 @@
+"""
+Benchmark for reservation event fan-out.
+
+Subscribes 1k SSE-style consumers to the in-process event broker and
+publishes events from a worker thread, the way ReservationService does
+when it runs on the threadpool. Reports the latency between publish and
+delivery to each subscriber, and the same for subscribers filtered by
+table, where each event only reaches its own table's subscribers.
+
+Usage:
+    python -m benchmarks.bench_event_fanout [--subscribers 1000] [--events 200]
+"""
+import argparse
+import asyncio
+import statistics
+import threading
+import time
+from typing import List, Optional
+
+from app.core.events import EventBroker
+
+TABLES = 50
+
+
+async def consume(subscription, events: int, latencies: List[float]) -> None:
+    for _ in range(events):
+        event = await subscription.get()
+        latencies.append(time.perf_counter() - event["sent"])
+
+
+async def run(subscribers: int, events: int, tables: Optional[int]) -> List[float]:
+    broker = EventBroker()
+    latencies: List[float] = []
+    consumers = []
+    for i in range(subscribers):
+        table_id = i % tables + 1 if tables else None
+        subscription = broker.subscribe(table_id=table_id)
+        subscription.queue = asyncio.Queue()
+        expected = events // tables if tables else events
+        consumers.append(consume(subscription, expected, latencies))
+
+    def publish() -> None:
+        for i in range(events):
+            broker.publish({
+                "type": "reservation.created",
+                "table_id": i % (tables or 1) + 1,
+                "location": "Main Hall",
+                "sent": time.perf_counter(),
+            })
+            # About a hundred writes a second
+            time.sleep(0.01)
+
+    publisher = threading.Thread(target=publish)
+    publisher.start()
+    await asyncio.gather(*consumers)
+    publisher.join()
+    return latencies
+
+
+def report(label: str, latencies: List[float]) -> None:
+    ordered = sorted(latencies)
+    p99 = ordered[int(len(ordered) * 0.99) - 1]
+    print(
+        f"{label:>16} | {len(latencies):>8} deliveries | "
+        f"p50 {statistics.median(ordered) * 1000:>7.3f} ms | "
+        f"p99 {p99 * 1000:>7.3f} ms | max {ordered[-1] * 1000:>7.3f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--subscribers", type=int, default=1000)
+    parser.add_argument("--events", type=int, default=200)
+    args = parser.parse_args()
+
+    events = args.events - args.events % TABLES
+    print(f"{args.subscribers} subscribers, {events} events")
+    report("all events", asyncio.run(run(args.subscribers, events, None)))
+    report("per table", asyncio.run(run(args.subscribers, events, TABLES)))
+
+
+if __name__ == "__main__":
+    main()
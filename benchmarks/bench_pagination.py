@@ -0,0 +1,116 @@
+"""
+Benchmark for keyset pagination of GET /reservations.
+
+Compares fetching page 1 and page N of the reservation listing with the
+keyset cursor used by ReservationService.get_page against the equivalent
+LIMIT/OFFSET query. Keyset pages should take the same time at any depth,
+while OFFSET pages slow down linearly.
+
+Usage:
+    python -m benchmarks.bench_pagination [--rows 200000] [--limit 100]
+"""
+import argparse
+import time
+from datetime import datetime, timedelta
+from typing import Callable
+
+from sqlalchemy import insert
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine, select
+
+from app.core.pagination import encode_cursor
+from app.models.reservation import Reservation
+from app.models.table import Table
+from app.services.reservation import ReservationService
+
+REPEAT = 50
+
+
+def seed(session: Session, rows: int, tables: int = 100) -> None:
+    session.execute(
+        insert(Table),
+        [
+            {"name": f"Table {i}", "seats": 4, "location": "Main Hall",
+             "created_at": datetime.utcnow(), "updated_at": datetime.utcnow()}
+            for i in range(tables)
+        ]
+    )
+    start = datetime(2024, 1, 1, 12, 0)
+    now = datetime.utcnow()
+    batch = []
+    for i in range(rows):
+        reservation_time = start + timedelta(minutes=15 * (i // tables))
+        batch.append({
+            "table_id": i % tables + 1,
+            "customer_name": f"Guest {i}",
+            "reservation_time": reservation_time,
+            "duration_minutes": 15,
+            "end_time": reservation_time + timedelta(minutes=15),
+            "created_at": now,
+            "updated_at": now,
+        })
+        if len(batch) == 10_000:
+            session.execute(insert(Reservation), batch)
+            batch = []
+    if batch:
+        session.execute(insert(Reservation), batch)
+    session.commit()
+
+
+def measure(fn: Callable[[], object]) -> float:
+    started = time.perf_counter()
+    for _ in range(REPEAT):
+        fn()
+    return (time.perf_counter() - started) / REPEAT * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--page", type=int, default=1000)
+    args = parser.parse_args()
+
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        seed(session, args.rows)
+        service = ReservationService(session)
+
+        offset = (args.page - 1) * args.limit
+        last = session.exec(
+            select(Reservation)
+            .order_by(Reservation.reservation_time, Reservation.id)
+            .offset(offset - 1)
+            .limit(1)
+        ).one()
+        deep_cursor = encode_cursor([last.reservation_time, last.id])
+
+        def offset_page(page_offset: int) -> Callable[[], object]:
+            return lambda: session.exec(
+                select(Reservation)
+                .order_by(Reservation.reservation_time, Reservation.id)
+                .offset(page_offset)
+                .limit(args.limit)
+            ).all()
+
+        results = {
+            "keyset page 1": measure(lambda: service.get_page(args.limit)),
+            f"keyset page {args.page}": measure(
+                lambda: service.get_page(args.limit, cursor=deep_cursor)
+            ),
+            "offset page 1": measure(offset_page(0)),
+            f"offset page {args.page}": measure(offset_page(offset)),
+        }
+
+    print(f"{args.rows} reservations, {args.limit} rows per page")
+    for name, ms in results.items():
+        print(f"{name:>20} | {ms:>8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
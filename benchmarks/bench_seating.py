@@ -0,0 +1,168 @@
+"""
+Simulation benchmark for automatic table assignment.
+
+Replays a stream of booking requests for a restaurant of mixed table sizes
+at a fixed arrival rate (10k bookings per minute by default) and compares
+two ways of picking the table: the smallest free table from
+TableService.get_available_tables, which is what a host does by hand, and
+the seat-assignment optimizer (no table_id, party_size only). Latency is
+measured from each request's scheduled arrival, so a strategy that cannot
+keep up with the rate shows it as queueing in p99.
+
+Reported per strategy: share of requests seated, seat utilization (guests
+per seat of the tables they got), occupancy (booked share of table time in
+the service window) and latency percentiles.
+
+Usage:
+    python -m benchmarks.bench_seating [--tables 200] [--bookings 10000] [--rate 10000]
+"""
+import argparse
+import random
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Tuple
+
+from sqlalchemy import insert
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine
+
+from app.models.table import Table
+from app.schemas.reservation import ReservationCreate
+from app.services.availability import availability_index
+from app.services.reservation import ReservationService
+from app.services.seating import seating_index
+from app.services.table import TableService
+
+FIRST_DAY = datetime(2030, 1, 1)
+# Service window and booking start granularity
+OPENING, CLOSING = 17, 23
+START_STEP_MINUTES = 15
+# Share of tables by seat count and of parties by size
+TABLE_MIX = {2: 40, 4: 35, 6: 15, 8: 10}
+PARTY_MIX = {1: 5, 2: 45, 3: 15, 4: 20, 5: 5, 6: 6, 7: 2, 8: 2}
+DURATIONS = [60, 90, 120]
+
+Request = Tuple[int, datetime, int]
+
+
+def seed(session: Session, tables: int, rng: random.Random) -> None:
+    now = datetime.utcnow()
+    sizes = rng.choices(list(TABLE_MIX), weights=list(TABLE_MIX.values()), k=tables)
+    session.execute(
+        insert(Table),
+        [
+            {"name": f"Table {i}", "seats": seats, "location": "Main Hall",
+             "created_at": now, "updated_at": now}
+            for i, seats in enumerate(sizes)
+        ]
+    )
+    session.commit()
+
+
+def requests(bookings: int, days: int, rng: random.Random) -> List[Request]:
+    starts = (CLOSING - OPENING) * 60 // START_STEP_MINUTES
+    result = []
+    for _ in range(bookings):
+        party_size = rng.choices(list(PARTY_MIX), weights=list(PARTY_MIX.values()))[0]
+        duration = rng.choice(DURATIONS)
+        start = FIRST_DAY + timedelta(
+            days=rng.randrange(days),
+            hours=OPENING,
+            minutes=START_STEP_MINUTES * rng.randrange(starts)
+        )
+        # Bookings end by closing time
+        start = min(start, start.replace(hour=CLOSING) - timedelta(minutes=duration))
+        result.append((party_size, start, duration))
+    return result
+
+
+def book(session: Session, strategy: str, request: Request):
+    party_size, start, duration = request
+    data = {
+        "customer_name": "Guest",
+        "reservation_time": start,
+        "duration_minutes": duration,
+    }
+    if strategy == "optimizer":
+        data["party_size"] = party_size
+    else:
+        free = TableService(session).get_available_tables(party_size, start, duration)
+        if not free:
+            return None
+        data["table_id"] = free[0].id
+    return ReservationService(session).create(ReservationCreate(**data))
+
+
+def run(strategy: str, args: argparse.Namespace) -> Dict[str, float]:
+    rng = random.Random(args.seed)
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+    SQLModel.metadata.create_all(engine)
+    availability_index.clear()
+    seating_index.clear()
+    with Session(engine, expire_on_commit=False) as session:
+        seed(session, args.tables, rng)
+        seats = {table.id: table.seats for table in TableService(session).get_all()}
+        stream = requests(args.bookings, args.days, rng)
+
+        interval = 60.0 / args.rate
+        latencies = []
+        seated = guests = seats_used = minutes = 0
+        began = time.perf_counter()
+        for i, request in enumerate(stream):
+            arrival = began + i * interval
+            now = time.perf_counter()
+            if now < arrival:
+                time.sleep(arrival - now)
+            reservation = book(session, strategy, request)
+            latencies.append(time.perf_counter() - arrival)
+            if reservation is not None:
+                seated += 1
+                guests += request[0] * request[2]
+                seats_used += seats[reservation.table_id] * request[2]
+                minutes += request[2]
+        elapsed = time.perf_counter() - began
+    engine.dispose()
+
+    latencies.sort()
+    window = (CLOSING - OPENING) * 60 * args.days * len(seats)
+    return {
+        "seated": seated / len(stream) * 100,
+        "seat_util": guests / seats_used * 100 if seats_used else 0.0,
+        "occupancy": minutes / window * 100,
+        "p50": latencies[len(latencies) // 2] * 1000,
+        "p99": latencies[int(len(latencies) * 0.99) - 1] * 1000,
+        "rate": len(stream) / elapsed * 60,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tables", type=int, default=200)
+    parser.add_argument("--bookings", type=int, default=10_000)
+    parser.add_argument("--days", type=int, default=14)
+    parser.add_argument(
+        "--rate", type=float, default=10_000, help="bookings per minute"
+    )
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    print(
+        f"{'strategy':>9} | {'seated %':>8} | {'seat use %':>10} | "
+        f"{'occupancy %':>11} | {'p50 ms':>7} | {'p99 ms':>7} | {'per min':>8}"
+    )
+    for strategy in ("smallest", "optimizer"):
+        result = run(strategy, args)
+        print(
+            f"{strategy:>9} | {result['seated']:>8.1f} | "
+            f"{result['seat_util']:>10.1f} | "
+            f"{result['occupancy']:>11.1f} | {result['p50']:>7.2f} | "
+            f"{result['p99']:>7.2f} | {result['rate']:>8.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+Benchmark for serializing reservation list responses.
+
+Compares the model path GET /reservations used to take (ORM rows
+validated into ReservationResponse with its nested TableResponse, then
+jsonable_encoder and json.dumps as FastAPI does for a response_model)
+with the fast path: a column-only query turned into plain dicts and
+encoded with orjson. Both include the page query; a serialization-only
+figure is printed for each as well.
+
+Usage:
+    python -m benchmarks.bench_serialization [--rows 50000] [--limit 500]
+"""
+import argparse
+import json
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Tuple
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from sqlalchemy import insert
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine
+
+from app.core.responses import ORJSONResponse
+from app.models.reservation import Reservation
+from app.models.table import Table
+from app.schemas.reservation import ReservationResponse
+from app.services.reservation import ReservationService
+
+REPEAT = 20
+
+
+def seed(session: Session, rows: int, tables: int = 100) -> None:
+    now = datetime.utcnow()
+    session.execute(
+        insert(Table),
+        [
+            {"name": f"Table {i}", "seats": 4, "location": "Main Hall",
+             "created_at": now, "updated_at": now}
+            for i in range(tables)
+        ]
+    )
+    start = datetime(2030, 1, 1, 12, 0)
+    session.execute(
+        insert(Reservation),
+        [
+            {
+                "table_id": i % tables + 1,
+                "customer_name": f"Guest {i}",
+                "reservation_time": start + timedelta(minutes=15 * (i // tables)),
+                "duration_minutes": 15,
+                "end_time": start + timedelta(minutes=15 * (i // tables + 1)),
+                "created_at": now,
+                "updated_at": now,
+            }
+            for i in range(rows)
+        ]
+    )
+    session.commit()
+
+
+def model_path(service: ReservationService, limit: int) -> Tuple[bytes, float]:
+    reservations, _ = service.get_page(limit)
+    started = time.perf_counter()
+    content = jsonable_encoder([
+        ReservationResponse.model_validate(reservation)
+        for reservation in reservations
+    ])
+    body = JSONResponse(content).body
+    return body, time.perf_counter() - started
+
+
+def fast_path(service: ReservationService, limit: int) -> Tuple[bytes, float]:
+    rows, _ = service.get_page_rows(limit)
+    started = time.perf_counter()
+    body = ORJSONResponse(rows).body
+    return body, time.perf_counter() - started
+
+
+def measure(
+    session: Session,
+    path: Callable[[ReservationService, int], Tuple[bytes, float]],
+    limit: int
+) -> Tuple[float, float]:
+    total = serialize = 0.0
+    for _ in range(REPEAT):
+        # A fresh identity map each time, as in a request
+        session.expunge_all()
+        started = time.perf_counter()
+        _, spent = path(ReservationService(session), limit)
+        total += time.perf_counter() - started
+        serialize += spent
+    rows = REPEAT * limit
+    return rows / total, rows / serialize
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=50_000)
+    parser.add_argument("--limit", type=int, default=500)
+    args = parser.parse_args()
+
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        seed(session, args.rows)
+        service = ReservationService(session)
+        assert json.loads(model_path(service, args.limit)[0]) == json.loads(
+            fast_path(service, args.limit)[0]
+        )
+
+        print(f"{args.rows} reservations, pages of {args.limit}")
+        print(f"{'path':>12} | {'rows/s end-to-end':>18} | {'rows/s encoding':>16}")
+        for label, path in (("model", model_path), ("orjson", fast_path)):
+            total, serialize = measure(session, path, args.limit)
+            print(f"{label:>12} | {total:>18,.0f} | {serialize:>16,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Benchmark for the slot-grid availability view.
+
+Seeds a restaurant with a busy evening and compares answering "every open
+15-minute slot tonight across all tables" three ways: one
+check_time_conflict query per table per slot, the availability index on a
+cold day (one query for the day's reservations) and the index once the day
+is loaded.
+
+Usage:
+    python -m benchmarks.bench_slot_grid [--tables 200] [--reservations 800]
+"""
+import argparse
+import random
+import time
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import insert
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine, select
+
+from app.models.reservation import Reservation
+from app.models.table import Table
+from app.services.availability import AvailabilityIndex, AvailabilityService
+from app.services.reservation import ReservationService
+
+REPEAT = 20
+DAY = date(2030, 1, 1)
+EVENING = (datetime(2030, 1, 1, 17, 0), datetime(2030, 1, 1, 23, 0))
+
+
+def seed(session: Session, tables: int, reservations: int) -> None:
+    now = datetime.utcnow()
+    session.execute(
+        insert(Table),
+        [
+            {"name": f"Table {i}", "seats": 4, "location": "Main Hall",
+             "created_at": now, "updated_at": now}
+            for i in range(tables)
+        ]
+    )
+    rows = []
+    for i in range(reservations):
+        # Spread the bookings over the evening, one per table at a time
+        table_id = i % tables + 1
+        reservation_time = EVENING[0] + timedelta(
+            minutes=90 * (i // tables) + 15 * random.randrange(4)
+        )
+        rows.append({
+            "table_id": table_id,
+            "customer_name": f"Guest {i}",
+            "reservation_time": reservation_time,
+            "duration_minutes": 75,
+            "end_time": reservation_time + timedelta(minutes=75),
+            "created_at": now,
+            "updated_at": now,
+        })
+    session.execute(insert(Reservation), rows)
+    session.commit()
+
+
+def per_slot_queries(session: Session) -> int:
+    service = ReservationService(session)
+    open_slots = 0
+    for table in session.exec(select(Table)).all():
+        slot = EVENING[0]
+        while slot < EVENING[1]:
+            if not service.check_time_conflict(table.id, slot, 15):
+                open_slots += 1
+            slot += timedelta(minutes=15)
+    return open_slots
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tables", type=int, default=200)
+    parser.add_argument("--reservations", type=int, default=800)
+    args = parser.parse_args()
+
+    random.seed(42)
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        seed(session, args.tables, args.reservations)
+
+        def grid(index: AvailabilityIndex) -> int:
+            result = AvailabilityService(session, index).get_slot_grid(
+                DAY, start=EVENING[0].time(), end=EVENING[1].time()
+            )
+            return sum(len(table["free_slots"]) for table in result["tables"])
+
+        started = time.perf_counter()
+        expected = per_slot_queries(session)
+        queries_ms = (time.perf_counter() - started) * 1000
+
+        started = time.perf_counter()
+        for _ in range(REPEAT):
+            cold = grid(AvailabilityIndex())
+        cold_ms = (time.perf_counter() - started) / REPEAT * 1000
+
+        index = AvailabilityIndex()
+        grid(index)
+        started = time.perf_counter()
+        for _ in range(REPEAT):
+            warm = grid(index)
+        warm_ms = (time.perf_counter() - started) / REPEAT * 1000
+
+    assert expected == cold == warm
+    print(
+        f"{args.tables} tables, {args.reservations} reservations, "
+        f"{expected} open slots"
+    )
+    print(f"{'per-slot queries':>20} | {queries_ms:>10.2f} ms")
+    print(f"{'grid, cold day':>20} | {cold_ms:>10.2f} ms")
+    print(f"{'grid, loaded day':>20} | {warm_ms:>10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
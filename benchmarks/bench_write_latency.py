@@ -0,0 +1,143 @@
+"""
+Benchmark for the latency of single-reservation writes.
+
+Creates, reschedules and deletes reservations one at a time through
+ReservationService and reports the mean and p95 latency and the number of
+statements per operation. The "refresh" variant is the write path the
+service used before RETURNING: load the table, check, add, commit and
+refresh the row, each a separate round trip.
+
+Round trips dominate on a real server, so run it against a local
+PostgreSQL scratch database; its tables are created and dropped.
+
+Usage:
+    python -m benchmarks.bench_write_latency [--url postgresql://...] [--writes 500]
+"""
+import argparse
+import statistics
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine
+
+from app.models.reservation import Reservation
+from app.models.table import Table
+from app.schemas.reservation import ReservationCreate, ReservationUpdate
+from app.services.reservation import ReservationService
+
+
+def create_with_refresh(session: Session, data: ReservationCreate) -> Reservation:
+    """Create a reservation the way the service did before RETURNING."""
+    session.get(Table, data.table_id)
+    ReservationService(session).check_time_conflict(
+        data.table_id, data.reservation_time, data.duration_minutes
+    )
+    reservation = Reservation(**data.model_dump())
+    session.add(reservation)
+    session.commit()
+    session.refresh(reservation)
+    return reservation
+
+
+def measure(
+    engine: Engine,
+    operation: Callable[[Session, int], None],
+    writes: int
+) -> Dict[str, float]:
+    statements = []
+
+    def count(*args) -> None:
+        statements.append(1)
+
+    latencies: List[float] = []
+    event.listen(engine, "before_cursor_execute", count)
+    try:
+        for i in range(writes):
+            with Session(engine, expire_on_commit=False) as session:
+                started = time.perf_counter()
+                operation(session, i)
+                latencies.append(time.perf_counter() - started)
+    finally:
+        event.remove(engine, "before_cursor_execute", count)
+    latencies.sort()
+    return {
+        "mean": statistics.fmean(latencies) * 1000,
+        "p95": latencies[int(len(latencies) * 0.95)] * 1000,
+        "statements": len(statements) / writes,
+    }
+
+
+def run(url: str, writes: int) -> None:
+    if url.startswith("sqlite"):
+        engine = create_engine(
+            url, connect_args={"check_same_thread": False}, poolclass=StaticPool
+        )
+    else:
+        engine = create_engine(url)
+    SQLModel.metadata.create_all(engine)
+    try:
+        with Session(engine) as session:
+            table = Table(name="Bench", seats=4)
+            session.add(table)
+            session.commit()
+            table_id = table.id
+
+        start = datetime(2030, 1, 1, 12, 0)
+        ids: List[int] = []
+
+        def booking(i: int, offset: timedelta = timedelta()) -> ReservationCreate:
+            return ReservationCreate(
+                customer_name=f"Guest {i}",
+                table_id=table_id,
+                reservation_time=start + timedelta(hours=i) + offset,
+                duration_minutes=30
+            )
+
+        def create(session: Session, i: int) -> None:
+            ids.append(ReservationService(session).create(booking(i)).id)
+
+        def refresh(session: Session, i: int) -> None:
+            create_with_refresh(session, booking(i, timedelta(days=365)))
+
+        def update(session: Session, i: int) -> None:
+            ReservationService(session).update(ids[i], ReservationUpdate(
+                reservation_time=start + timedelta(hours=i, minutes=15)
+            ))
+
+        def delete(session: Session, i: int) -> None:
+            ReservationService(session).delete(ids[i])
+
+        print(
+            f"{'operation':>14} | {'mean ms':>8} | {'p95 ms':>8} | "
+            f"{'statements':>10}"
+        )
+        for name, operation in [
+            ("create", create),
+            ("create+refresh", refresh),
+            ("update", update),
+            ("delete", delete),
+        ]:
+            result = measure(engine, operation, writes)
+            print(
+                f"{name:>14} | {result['mean']:>8.3f} | {result['p95']:>8.3f}"
+                f" | {result['statements']:>10.1f}"
+            )
+    finally:
+        SQLModel.metadata.drop_all(engine)
+        engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--url", default="sqlite://")
+    parser.add_argument("--writes", type=int, default=500)
+    args = parser.parse_args()
+    run(args.url, args.writes)
+
+
+if __name__ == "__main__":
+    main()
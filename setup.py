@@ -15,8 +15,12 @@ setup(
         "python-multipart>=0.0.9",
         "email-validator>=2.1.1",
         "psycopg2-binary>=2.9.9",
+        "asyncpg>=0.29.0",
+        "aiosqlite>=0.20.0",
+        "greenlet>=3.0.3",
         "alembic>=1.13.1",
         "python-dotenv>=1.0.1",
+        "orjson>=3.8.0",
     ],
     extras_require={
         "dev": [